@@ -1,4 +1,16 @@
-from .components_manager import ComponentsManager
-from .controller_manager import ControllerManager
-from .ocr_processor_manager import OCRProcessorManager
-from .window_manager import WindowManager
\ No newline at end of file
+from utilities import lazy_exports
+
+# OCR-related managers are imported on first use to keep start-up light
+_EXPORTS = {
+    "ComponentsManager": ".components_manager",
+    "ControllerManager": ".controller_manager",
+    "OCRProcessorManager": ".ocr_processor_manager",
+    "WindowManager": ".window_manager",
+    "OCRTask": ".ocr_task_executor",
+    "OCRTaskExecutor": ".ocr_task_executor",
+    "BatchOCRProcessor": ".batch_processor",
+    "ModelWarmUp": ".model_warmup",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,141 @@
+from ocr.ocr_worker import init_worker, recognize_file
+from ocr.result_filter import OCRResultFilter
+from utilities import LOGGER_NAME, OCRResultFileExporter, OCR_TILE_WORKERS, OCR_ENGINE_DEFAULT
+
+from collections import Counter
+import glob
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class BatchOCRProcessor:
+    """
+    Headless OCR of many images, without creating any Tk window.
+
+    Images are recognized across a process pool; every worker loads one OCR
+    reader in its initializer and keeps it warm for all images it receives.
+    One CSV or JSON file is written per image and a throughput summary is
+    printed at the end.
+    """
+
+    IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+
+    def __init__(self, source, output_dir=None, fmt="csv", scale_percent=150,
+                 language='en', gpu=True, workers=OCR_TILE_WORKERS, use_cache=True,
+                 engine=OCR_ENGINE_DEFAULT, engine_options=None, result_filter=None):
+        """
+        Parameters:
+        - source: a directory, an image file, or a glob pattern
+        - output_dir: where result files are written (default: next to each image)
+        - fmt: "csv" or "json"
+        - scale_percent: resize percent applied before OCR
+        - language: OCR language code(s)
+        - gpu: whether the worker readers should try to use the GPU
+        - workers: number of worker processes
+        - use_cache: reuse results from the persistent OCR cache
+        - engine: OCR engine name used by the workers
+        - engine_options: engine-specific options
+        - result_filter: optional OCRResultFilter applied before writing
+        """
+        if fmt not in OCRResultFileExporter.FORMATS:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        self.source = source
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.scale_percent = scale_percent
+        self.language = language
+        self.gpu = gpu
+        self.workers = max(1, workers)
+        self.use_cache = use_cache
+        self.engine = engine
+        self.engine_options = dict(engine_options or {})
+        self.result_filter = result_filter
+
+    def collect_images(self):
+        """
+        Expand the source into a sorted list of image paths.
+        """
+        if os.path.isdir(self.source):
+            paths = [os.path.join(self.source, name) for name in os.listdir(self.source)]
+        else:
+            paths = glob.glob(self.source, recursive=True)
+        return sorted(p for p in paths
+                      if os.path.isfile(p) and p.lower().endswith(self.IMAGE_EXTENSIONS))
+
+    def output_path(self, image_path, keep_extension=False):
+        """
+        Result file for an image: same stem, format extension, in output_dir if given.
+        With keep_extension the image extension stays in the name (a.png -> a_png.csv).
+        """
+        stem, extension = os.path.splitext(os.path.basename(image_path))
+        if keep_extension:
+            stem = f"{stem}_{extension.lstrip('.')}"
+        directory = self.output_dir or os.path.dirname(image_path)
+        return os.path.join(directory, f"{stem}.{self.fmt}")
+
+    def output_paths(self, images):
+        """
+        Result file of every image. Images that would share a result file
+        (a.png and a.jpg in one directory) keep their extension in the name.
+        """
+        paths = {image: self.output_path(image) for image in images}
+        counts = Counter(os.path.normcase(os.path.abspath(p)) for p in paths.values())
+        for image, path in paths.items():
+            if counts[os.path.normcase(os.path.abspath(path))] > 1:
+                paths[image] = self.output_path(image, keep_extension=True)
+        return paths
+
+    def run(self):
+        """
+        Process every image and print a summary.
+
+        Returns:
+        - number of images that failed
+        """
+        images = self.collect_images()
+        if not images:
+            print(f"No images found for '{self.source}'")
+            return 0
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+        out_paths = self.output_paths(images)
+
+        workers = min(self.workers, len(images))
+        logger.info(f"Batch OCR of {len(images)} image(s) with {workers} worker process(es)")
+        start = time.perf_counter()
+        words = 0
+        failed = []
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(self.language, self.gpu, None, self.engine, self.engine_options)) as pool:
+            futures = {
+                pool.submit(recognize_file, path, self.scale_percent, self.use_cache): path
+                for path in images
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                path = futures[future]
+                try:
+                    ocr_results, scale_percent = future.result()
+                    if self.result_filter is not None:
+                        ocr_results = self.result_filter.apply(ocr_results)
+                    out_path = out_paths[path]
+                    OCRResultFileExporter(out_path, self.fmt, scale=scale_percent / 100).export(ocr_results)
+                except Exception as e:
+                    logger.exception(f"Batch OCR failed for '{path}'")
+                    failed.append(path)
+                    print(f"[{done}/{len(images)}] FAILED {path}: {e}")
+                    continue
+                words += len(ocr_results)
+                print(f"[{done}/{len(images)}] {path} -> {out_path} ({len(ocr_results)} words)")
+
+        elapsed = time.perf_counter() - start
+        processed = len(images) - len(failed)
+        print(f"Processed {processed}/{len(images)} image(s), {words} words in {elapsed:.1f}s "
+              f"({processed / elapsed if elapsed else 0:.2f} images/s, "
+              f"{elapsed / max(processed, 1):.2f}s per image, {workers} worker(s))")
+        if failed:
+            print(f"{len(failed)} image(s) failed")
+        return len(failed)
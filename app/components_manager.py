@@ -1,6 +1,6 @@
 from table_core import GridStateManager, NavigationController, GridCommandManager
-from table_ui import  NavigationBar, LowerControls, TableCanvas
-from utilities import CSVExporter, LOGGER_NAME
+from table_ui import  NavigationBar, LowerControls, TableCanvas, VirtualTableCanvas, StatusBar
+from utilities import CSVExporter, LOGGER_NAME, GRID_STORAGE_DEFAULT, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW, TABLE_VIEW_DEFAULT
 
 import logging
 
@@ -10,11 +10,13 @@ class ComponentsManager:
     """
     Manages the components of the application.
     """
-    def __init__(self, rows, cols):
-        self.state_manager      = GridStateManager(rows, cols)
-        self.command_manager    = GridCommandManager()
+    def __init__(self, rows, cols, grid_storage=GRID_STORAGE_DEFAULT, undo_budget_mb=UNDO_MEMORY_BUDGET_MB, undo_overflow=UNDO_OVERFLOW,
+                 table_view=TABLE_VIEW_DEFAULT):
+        self.state_manager      = GridStateManager(rows, cols, grid_storage)
+        self.command_manager    = GridCommandManager(undo_budget_mb, undo_overflow)
         self.nav_controller     = NavigationController()
         self.exporter           = CSVExporter()
         self.nav_bar            = NavigationBar()
         self.lower_controls     = LowerControls(self.state_manager)
-        self.canvas_table       = TableCanvas()
+        self.canvas_table       = VirtualTableCanvas() if table_view == "virtual" else TableCanvas()
+        self.status_bar         = StatusBar()
@@ -1,6 +1,7 @@
 from .components_manager import ComponentsManager
 from .window_manager import WindowManager
-from utilities import LOGGER_NAME
+from .ocr_task_executor import OCRTaskExecutor
+from utilities import LOGGER_NAME, GRID_STORAGE_DEFAULT, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW, TABLE_VIEW_DEFAULT
 from table_controller import TableGridController
 
 import logging
@@ -11,9 +12,12 @@ class ControllerManager:
     """
     Manages the controllers and components of the application.
     """
-    def __init__(self, rows: int, cols: int):
+    def __init__(self, rows: int, cols: int, grid_storage: str = GRID_STORAGE_DEFAULT,
+                 undo_budget_mb: float = UNDO_MEMORY_BUDGET_MB, undo_overflow: str = UNDO_OVERFLOW,
+                 table_view: str = TABLE_VIEW_DEFAULT):
         self.window_manager = WindowManager()
-        self.components_manager = ComponentsManager(rows, cols)
+        self.components_manager = ComponentsManager(rows, cols, grid_storage, undo_budget_mb, undo_overflow, table_view)
+        self.ocr_executor = OCRTaskExecutor(self.window_manager.root)
 
         self.table_grid_controller = TableGridController(
             window_manager = self.window_manager,
@@ -23,7 +27,9 @@ class ControllerManager:
             exporter=self.components_manager.exporter,
             nav_bar=self.components_manager.nav_bar,
             lower_controls=self.components_manager.lower_controls,
-            canvas_table=self.components_manager.canvas_table
+            canvas_table=self.components_manager.canvas_table,
+            status_bar=self.components_manager.status_bar,
+            ocr_executor=self.ocr_executor
         )
 
         logger.info("ControllerManager initialized with all components.")
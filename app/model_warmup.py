@@ -0,0 +1,65 @@
+from ocr import shared_reader_pool
+from utilities import LOGGER_NAME, OCR_WARMUP_DELAY_MS
+
+import logging
+import time
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class ModelWarmUp:
+    """
+    Builds the OCR reader and runs a dummy inference in the background
+    shortly after the main window appears, so the first real OCR action
+    only pays for inference. Progress is shown in the status bar.
+    """
+    def __init__(self, root, ocr_executor, status_bar, language='en', delay_ms=OCR_WARMUP_DELAY_MS):
+        """
+        Parameters:
+        - root: main Tk window
+        - ocr_executor: OCRTaskExecutor the warm-up runs on
+        - status_bar: StatusBar used as the indicator
+        - language: OCR language(s) to warm up
+        - delay_ms: delay after the window shows before warming up
+        """
+        self.root = root
+        self.ocr_executor = ocr_executor
+        self.status_bar = status_bar
+        self.language = language
+        self.delay_ms = delay_ms
+        self.task = None
+
+    def start(self):
+        """
+        Schedule the warm-up once the Tk loop is running.
+        """
+        self.root.after(self.delay_ms, self._submit)
+
+    def _submit(self):
+        self.status_bar.set_status("Loading OCR model...", busy=True)
+        self.task = self.ocr_executor.submit(
+            self._warm_up, self.language,
+            on_result=self._on_done,
+            on_error=self._on_failed
+        )
+
+    @staticmethod
+    def _warm_up(task, language):
+        """
+        Worker-thread part: build the reader through the shared pool and run one inference.
+        """
+        start = time.perf_counter()
+        shared_reader_pool.warm_up(language=language)
+        return time.perf_counter() - start
+
+    def _on_done(self, elapsed):
+        logger.info(f"OCR model warm-up finished in {elapsed:.1f}s")
+        self.status_bar.set_status("OCR ready")
+        self.root.after(3000, self.status_bar.clear)
+
+    def _on_failed(self, error):
+        logger.error(f"OCR model warm-up failed: {error}")
+        self.status_bar.set_status("OCR model could not be loaded; it will be retried on first use")
+
+    def cancel(self):
+        if self.task is not None:
+            self.task.cancel()
@@ -1,4 +1,7 @@
-from ocr import OCRImageProcessor, OCRReader, WordSelectorImage
+from ocr import OCRImageProcessor, WordSelectorImage, OCRProgressPanel, shared_reader_pool, shared_result_cache
+from ocr import get_shared_tiled_runner, OCRResultFilter, LazyWordRecognizer
+from utilities import OCR_TILE_SIZE, OCR_TILE_OVERLAP, OCR_TILE_WORKERS, OCR_MIN_CONFIDENCE, OCR_NMS_IOU
+from utilities import OCR_IMAGE_VIEWER
 from utilities import LOGGER_NAME
 
 import logging
@@ -8,18 +11,253 @@ logger = logging.getLogger(LOGGER_NAME)
 class OCRProcessorManager:
     """
     Manages the OCR processing components of the application.
+    The image is loaded up front; recognition runs on the OCR executor and the
+    word selector is built in the OCR window once the results arrive.
     """
     def __init__(self, args, table_controller):
+        # Screenshots and clipboard images arrive as in-memory arrays instead of files
+        image = getattr(args, "image", None)
+        source_name = getattr(args, "source_name", None) or args.image_path
         try:
-            logger.info(f"Loading image: {args.image_path}")
-            self.processor = OCRImageProcessor(args.image_path, args.scale_percent)
+            logger.info(f"Loading image: {source_name}")
+            self.processor = OCRImageProcessor(args.image_path, args.scale_percent, image=image)
         except FileNotFoundError as e:
             logger.error(f"Failed to load image: {e}")
             raise e
-        
-        self.ocr = OCRReader(language=args.lang)
-        ocr_results = self.ocr.read(self.processor.gray_enhanced)
 
+        self.args = args
+        self.table_controller = table_controller
+        self.image = None                  # WordSelectorImage, built when OCR finishes
+        self.fill_task = None              # Background recognition in detect-first mode
+        self._show_requested = False
+
+        self.window = table_controller.window_manager.create_table_window(f"{source_name} - OCR Results")
+        self.progress = OCRProgressPanel(self.window, on_cancel=self.cancel)
+        self.progress.start()
+        self.window.bind("<Destroy>", self._on_window_destroyed, add="+")
+
+        # Tiled mode is opt-in (--tiled); captures inherit it from the command line
+        tiling = None
+        if getattr(args, "tiled", False):
+            tiling = {
+                "tile_size": getattr(args, "tile_size", OCR_TILE_SIZE),
+                "overlap": getattr(args, "tile_overlap", OCR_TILE_OVERLAP),
+                "workers": getattr(args, "ocr_workers", OCR_TILE_WORKERS),
+            }
+
+        result_filter = OCRResultFilter(
+            min_confidence=getattr(args, "min_confidence", OCR_MIN_CONFIDENCE),
+            iou_threshold=getattr(args, "nms_iou", OCR_NMS_IOU)
+        )
+
+        self.result_filter = result_filter
+
+        # Detect-first: open the window after detection alone and recognize words lazily
+        if getattr(args, "detect_first", False) and tiling is None:
+            self.task = table_controller.ocr_executor.submit(
+                self._detect, self.processor.gray_enhanced, args.lang, self.processor.preprocessing_params(),
+                result_filter,
+                on_result=self._on_detected,
+                on_error=self._on_ocr_failed
+            )
+            return
+
+        self.task = table_controller.ocr_executor.submit(
+            self._recognize, self.processor.gray_enhanced, args.lang, self.processor.preprocessing_params(),
+            tiling, result_filter,
+            on_result=self._on_ocr_done,
+            on_error=self._on_ocr_failed,
+            on_progress=self._on_ocr_progress
+        )
+
+    @classmethod
+    def _recognize(cls, task, gray_enhanced, lang, params, tiling=None, result_filter=None):
+        """
+        Worker-thread part of the pipeline: read the raw results, then drop
+        low-confidence and duplicate boxes before anything is drawn or indexed.
+        """
+        ocr_results = cls._read_raw(task, gray_enhanced, lang, params, tiling)
+        if ocr_results is None or result_filter is None:
+            return ocr_results
+        return result_filter.apply(ocr_results)
+
+    @staticmethod
+    def _read_raw(task, gray_enhanced, lang, params, tiling=None):
+        """
+        Answer from the result cache if this exact image was seen before,
+        otherwise fetch a warm reader and run OCR. With `tiling` set, the
+        image is recognized tile by tile in worker processes. The cache holds
+        unfiltered results, so changing the filter does not require new OCR.
+        """
+        params = {**params, **shared_reader_pool.engine_signature()}
+        runner = None
+        if tiling:
+            runner = get_shared_tiled_runner(language=lang, engine=shared_reader_pool.engine,
+                                             engine_options=shared_reader_pool.engine_options, **tiling)
+            params = {**params, **runner.config()}
+
+        cache_key = shared_result_cache.make_key(gray_enhanced, lang, params)
+        ocr_results = shared_result_cache.get(cache_key)
+        if ocr_results is not None:
+            return ocr_results
+
+        if runner is not None:
+            ocr_results = runner.read(
+                gray_enhanced,
+                on_tile_done=lambda done, total, _: task.report_progress(done, total),
+                should_cancel=lambda: task.cancelled
+            )
+        else:
+            reader = shared_reader_pool.get_reader(language=lang)
+            if task.cancelled:
+                return None
+            ocr_results = reader.read(gray_enhanced)
+        if task.cancelled:
+            return None
+        shared_result_cache.put(cache_key, ocr_results)
+        return ocr_results
+
+    DETECT_FIRST_PARAMS = {"mode": "detect_first"}  # Keeps per-box results apart from full readtext results
+
+    @classmethod
+    def _detect(cls, task, gray_enhanced, lang, params, result_filter=None):
+        """
+        Worker-thread part of detect-first mode. A cached full result (from a
+        regular run or an earlier detect-first run) is used as is; otherwise
+        only the text detector runs and overlapping boxes are suppressed.
+
+        Detect-first results come from per-box recognition, which can differ
+        from a full readtext run, so they are cached under their own key and
+        never handed to a regular run.
+
+        Returns:
+        - (cached results or None, LazyWordRecognizer or None, cache key), or None if cancelled
+        """
+        params = {**params, **shared_reader_pool.engine_signature()}
+        cache_key = shared_result_cache.make_key(gray_enhanced, lang, {**params, **cls.DETECT_FIRST_PARAMS})
+        for key in (shared_result_cache.make_key(gray_enhanced, lang, params), cache_key):
+            ocr_results = shared_result_cache.get(key)
+            if ocr_results is not None:
+                return ocr_results, None, cache_key
+
+        reader = shared_reader_pool.get_reader(language=lang)
+        if task.cancelled:
+            return None
+        boxes = reader.detect(gray_enhanced)
+        if task.cancelled:
+            return None
+        if result_filter is not None:
+            boxes = result_filter.apply_to_boxes(boxes)
+        return None, LazyWordRecognizer(reader, gray_enhanced, boxes), cache_key
+
+    @staticmethod
+    def _recognize_remaining(task, recognizer, cache_key):
+        """
+        Worker-thread part of the background pass in detect-first mode; the
+        complete result is cached here so the file write stays off the Tk thread.
+        """
+        ocr_results = recognizer.recognize_remaining(task)
+        if ocr_results is not None:
+            shared_result_cache.put(cache_key, list(ocr_results))
+        return ocr_results
+
+    def _on_detected(self, detection):
+        """
+        Called on the Tk thread after detection: show the boxes right away and
+        recognize the words in the background, in reading order.
+        """
+        if detection is None:
+            return
+        ocr_results, recognizer, cache_key = detection
+        if recognizer is None:
+            self._on_ocr_done(self.result_filter.apply(ocr_results))
+            return
+        if not self._show_word_selector(recognizer.ocr_results, recognizer):
+            return
+
+        self.fill_task = self.table_controller.ocr_executor.submit(
+            self._recognize_remaining, recognizer, cache_key,
+            on_result=self._on_recognized,
+            on_error=self._on_ocr_failed,
+            on_progress=self._on_recognition_progress
+        )
+
+    def _on_recognition_progress(self, done, total, payload=None):
+        if self.window.winfo_exists() and self.image is not None:
+            self.image.set_recognition_progress(done, total)
+
+    def _on_recognized(self, ocr_results):
+        """
+        Called on the Tk thread once every detected word has its text.
+        """
+        if ocr_results is None:
+            return
+        self._on_recognition_progress(len(ocr_results), len(ocr_results))
+
+    def _on_ocr_progress(self, done, total, payload=None):
+        """
+        Called on the Tk thread as tiles finish.
+        """
+        if self.window.winfo_exists():
+            self.progress.set_progress(done, total, f"Recognized tile {done}/{total}")
+
+    def _on_ocr_done(self, ocr_results):
+        """
+        Called on the Tk thread with the OCR results; builds the word selector.
+        """
+        self._show_word_selector(ocr_results)
+
+    def _show_word_selector(self, ocr_results, recognizer=None):
+        """
+        Replace the progress panel with the word selector.
+
+        Returns:
+        - False if the OCR window was already closed
+        """
+        if not self.window.winfo_exists():
+            logger.info("OCR window was closed before recognition finished; results dropped.")
+            return False
+
+        self.progress.destroy()
         self.image = WordSelectorImage(
-            self.processor.img, ocr_results, table_controller, table_controller.window_manager.create_table_window(f"{args.image_path} - OCR Results")
+            self.processor.img, ocr_results, self.table_controller, self.window,
+            viewer=getattr(self.args, "viewer", OCR_IMAGE_VIEWER),
+            recognizer=recognizer
         )
+        logger.info("OCR results displayed.")
+        if self._show_requested:
+            self.image.show()
+        return True
+
+    def _on_ocr_failed(self, error):
+        """
+        Called on the Tk thread when recognition raised an exception.
+        """
+        if self.window.winfo_exists():
+            self.progress.show_error(f"OCR failed: {error}")
+
+    def _on_window_destroyed(self, event):
+        """
+        Stop pending recognition when the user closes the OCR window.
+        """
+        if event.widget is self.window:
+            self.task.cancel()
+            if self.fill_task is not None:
+                self.fill_task.cancel()
+
+    def show(self):
+        """
+        Activate word selection, now or as soon as the OCR results are ready.
+        """
+        self._show_requested = True
+        if self.image is not None:
+            self.image.show()
+
+    def cancel(self):
+        """
+        Cancel recognition (if still running) and close the OCR window.
+        """
+        self.task.cancel()
+        if self.fill_task is not None:
+            self.fill_task.cancel()
+        self.table_controller.window_manager.close_table_window(self.window)
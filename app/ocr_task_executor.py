@@ -0,0 +1,169 @@
+from utilities import LOGGER_NAME, OCR_MAX_WORKERS, OCR_POLL_INTERVAL_MS
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class OCRTask:
+    """
+    Handle for one background OCR job.
+
+    The worker function receives the task as its first argument so it can
+    report progress and check whether the user cancelled it. Callbacks given
+    to `OCRTaskExecutor.submit` always run on the Tk thread.
+    """
+
+    def __init__(self, executor, on_result=None, on_error=None, on_progress=None):
+        self._executor = executor
+        self._cancel_event = threading.Event()
+        self.on_result = on_result
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.future = None                 # Set by the executor once submitted
+
+    @property
+    def cancelled(self):
+        """True once cancel() has been called."""
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """
+        Cancel the task. A task that has not started yet is dropped; a running
+        one finishes in the background but its result is discarded.
+        """
+        if self._cancel_event.is_set():
+            return
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+        logger.info("OCR task cancelled.")
+
+    def report_progress(self, done, total, payload=None):
+        """
+        Report progress from the worker thread; delivered to on_progress on the Tk thread.
+        """
+        self._executor._post(self, "progress", (done, total, payload))
+
+    def done(self):
+        return self.future is not None and self.future.done()
+
+
+class OCRTaskExecutor:
+    """
+    Runs OCR work on background threads and marshals the results back onto
+    the Tk event loop with `after`, so the UI never blocks on recognition.
+    """
+
+    def __init__(self, root, max_workers=OCR_MAX_WORKERS, poll_interval_ms=OCR_POLL_INTERVAL_MS):
+        """
+        Parameters:
+        - root: the Tk root whose event loop receives the callbacks
+        - max_workers: number of OCR jobs that may run at the same time
+        - poll_interval_ms: how often finished jobs are checked while any are pending
+        """
+        self.root = root
+        self.poll_interval_ms = poll_interval_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocr")
+        # Short interactive jobs (e.g. recognizing a clicked word) never queue behind page-long OCR
+        self._priority_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-priority")
+        self._events = queue.Queue()       # (task, kind, payload) posted by workers
+        self._active = set()               # Tasks whose final callback has not run yet
+        self._poll_job = None
+        logger.info(f"OCRTaskExecutor started with {max_workers} worker(s).")
+
+    def submit(self, fn, *args, on_result=None, on_error=None, on_progress=None, priority=False, **kwargs):
+        """
+        Run fn(task, *args, **kwargs) on a worker thread. Must be called from the Tk thread.
+
+        Parameters:
+        - fn: the work to run off the UI thread (must not touch Tk widgets)
+        - on_result: called with fn's return value on the Tk thread
+        - on_error: called with the raised exception on the Tk thread
+        - on_progress: called with (done, total, payload) on the Tk thread
+        - priority: run on the dedicated interactive worker instead of queueing behind other jobs
+
+        Returns:
+        - the OCRTask handle, which can be used to cancel the job
+        """
+        task = OCRTask(self, on_result, on_error, on_progress)
+        pool = self._priority_pool if priority else self._pool
+        task.future = pool.submit(self._run, task, fn, args, kwargs)
+        self._active.add(task)
+        self._schedule_poll()
+        return task
+
+    def _run(self, task, fn, args, kwargs):
+        """
+        Worker-thread wrapper: runs the job and posts its outcome to the queue.
+        """
+        if task.cancelled:
+            return
+        try:
+            result = fn(task, *args, **kwargs)
+        except Exception as e:
+            logger.exception("Background OCR task failed")
+            self._post(task, "error", e)
+        else:
+            self._post(task, "result", result)
+
+    def _post(self, task, kind, payload):
+        self._events.put((task, kind, payload))
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            self._poll_job = self.root.after(self.poll_interval_ms, self._poll)
+
+    def _poll(self):
+        """
+        Deliver queued worker events to their callbacks on the Tk thread.
+        """
+        self._poll_job = None
+        while True:
+            try:
+                task, kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            self._dispatch(task, kind, payload)
+
+        # Drop tasks that were cancelled before they ever started
+        self._active = {task for task in self._active if not (task.cancelled and task.done())}
+        if self._active:
+            self._schedule_poll()
+
+    def _dispatch(self, task, kind, payload):
+        if kind != "progress":
+            self._active.discard(task)
+        if task.cancelled:
+            return
+        callback = {"result": task.on_result, "error": task.on_error, "progress": task.on_progress}[kind]
+        if callback is None:
+            return
+        try:
+            callback(*payload) if kind == "progress" else callback(payload)
+        except Exception:
+            logger.exception(f"OCR task {kind} callback failed")
+
+    @property
+    def pending_count(self):
+        """Number of jobs that are queued or running."""
+        return len(self._active)
+
+    def shutdown(self):
+        """
+        Cancel queued jobs and stop accepting new ones. Running jobs are left to finish.
+        """
+        for task in list(self._active):
+            task.cancel()
+        self._active.clear()
+        if self._poll_job is not None:
+            try:
+                self.root.after_cancel(self._poll_job)
+            except Exception:
+                pass
+            self._poll_job = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._priority_pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("OCRTaskExecutor shut down.")
@@ -1,39 +1,94 @@
+from utilities import setup_logger, parse_args, startup_timer, ROWS_DEFAULT, COLS_DEFAULT, GRID_STORAGE_DEFAULT, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW, TABLE_VIEW_DEFAULT
 from app import ControllerManager
-from app import OCRProcessorManager
-from utilities import setup_logger, parse_args, ROWS_DEFAULT, COLS_DEFAULT
+from ocr import shared_reader_pool, shutdown_shared_tiled_runner, OCRResultFilter
+
+import app
 
 import tkinter as tk
 import argparse
+import multiprocessing
 import os
 
 os.environ['TK_FORCE_LIGHT_MODE'] = '1'  # Force light mode for Tkinter
 
 logger = setup_logger()
+startup_timer.mark("imports")
 
 class TableOCRApp:
     """Main application class that wires together the UI and logic components."""
     def __init__(self, rows: int = ROWS_DEFAULT, cols: int = COLS_DEFAULT, args: argparse.Namespace = None):
         logger.info("Initializing OCR Table application...")
-        self.controller = ControllerManager(rows, cols)
-        try:
-            self.processor = OCRProcessorManager(args, self.controller.table_grid_controller)
-        except FileNotFoundError as e:
-            self.processor = None
+        self.args = args
+        if args is not None:
+            shared_reader_pool.set_max_readers(args.reader_pool_size)
+            shared_reader_pool.set_engine(args.engine, args.engine_options)
+        self.controller = ControllerManager(
+            rows, cols,
+            args.grid_storage if args is not None else GRID_STORAGE_DEFAULT,
+            args.undo_budget if args is not None else UNDO_MEMORY_BUDGET_MB,
+            args.undo_overflow if args is not None else UNDO_OVERFLOW,
+            args.table_view if args is not None else TABLE_VIEW_DEFAULT
+        )
+        if args is not None:
+            self.controller.table_grid_controller.configure_watch(args.watch_interval, args.watch_threshold)
+            self.controller.table_grid_controller.configure_ocr(args)
+            self.controller.table_grid_controller.exporter.default_filename = args.output_csv
+        startup_timer.mark("main window built")
+
+        # The OCR stack (OpenCV, Matplotlib, EasyOCR) is only loaded when an image was given
+        self.processor = None
+        if args is not None and args.image_path:
+            try:
+                self.processor = app.OCRProcessorManager(args, self.controller.table_grid_controller)
+            except FileNotFoundError as e:
+                self.processor = None
+            startup_timer.mark("image loaded")
 
     def run(self):
         logger.info("Launching application UI.")
         if self.processor:
-            self.processor.image.show()
-        
+            self.processor.show()
+
+        # Without an image at start-up, load the OCR model in the background meanwhile
+        if self.processor is None and self.args is not None and not self.args.no_warmup:
+            self.warmup = app.ModelWarmUp(
+                self.controller.window_manager.root,
+                self.controller.ocr_executor,
+                self.controller.components_manager.status_bar,
+                language=self.args.lang
+            )
+            self.warmup.start()
+
+        # Idle callbacks run after the initial layout and drawing of the window
+        self.controller.window_manager.root.after_idle(startup_timer.report)
         self.controller.window_manager.root.mainloop()
+        self.controller.ocr_executor.shutdown()
+        shutdown_shared_tiled_runner()
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Tiled OCR workers in frozen builds
     args = parse_args()
     logger.info("Starting application with arguments: %s", args)
-    app = TableOCRApp(
+    if args.batch:
+        # Headless batch mode: no Tk window is created
+        failures = app.BatchOCRProcessor(
+            args.batch,
+            output_dir=args.output_dir,
+            fmt=args.format,
+            scale_percent=args.scale_percent,
+            language=args.lang,
+            workers=args.ocr_workers,
+            use_cache=not args.no_cache,
+            engine=args.engine,
+            engine_options=args.engine_options,
+            result_filter=OCRResultFilter(args.min_confidence, args.nms_iou)
+        ).run()
+        raise SystemExit(1 if failures else 0)
+
+    ocr_app = TableOCRApp(
         rows=ROWS_DEFAULT,
         cols=COLS_DEFAULT,
         args=args
     )
 
-    app.run()
+    ocr_app.run()
@@ -1,5 +1,33 @@
-from .image_preprocessor import OCRImageProcessor
-from .ocr_reader import OCRReader
-from .word_selector_image import WordSelectorImage
-from .image_canvas_embedder import ImageCanvasEmbedder
-from .image_visualizer import OCRImageVisualizer
\ No newline at end of file
+from utilities import lazy_exports
+
+# Public names are imported from their submodules on first use, so that
+# `import ocr` does not load EasyOCR/torch, OpenCV or Matplotlib up front.
+_EXPORTS = {
+    "OCRImageProcessor": ".image_preprocessor",
+    "OCRReader": ".ocr_reader",
+    "OCREngine": ".engines",
+    "EasyOCREngine": ".engines",
+    "SyntheticOCREngine": ".engines",
+    "create_engine": ".engines",
+    "OCRReaderPool": ".reader_pool",
+    "shared_reader_pool": ".reader_pool",
+    "OCRResultCache": ".ocr_result_cache",
+    "shared_result_cache": ".ocr_result_cache",
+    "WordSelectorImage": ".word_selector_image",
+    "ImageCanvasEmbedder": ".image_canvas_embedder",
+    "TkImageViewer": ".tk_image_viewer",
+    "ImagePyramid": ".image_pyramid",
+    "OCRImageVisualizer": ".image_visualizer",
+    "OCRProgressPanel": ".ocr_progress_panel",
+    "WordSpatialIndex": ".word_spatial_index",
+    "OCRResultFilter": ".result_filter",
+    "TableStructureBuilder": ".table_structure",
+    "FrameChangeDetector": ".frame_change_detector",
+    "LazyWordRecognizer": ".lazy_recognizer",
+    "TiledOCRRunner": ".tiled_ocr",
+    "get_shared_tiled_runner": ".tiled_ocr",
+    "shutdown_shared_tiled_runner": ".tiled_ocr",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
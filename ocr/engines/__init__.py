@@ -0,0 +1,23 @@
+from .base_engine import OCREngine
+from .easyocr_engine import EasyOCREngine
+from .synthetic_engine import SyntheticOCREngine
+
+# Engine name -> class, as accepted by OCRReader(engine=...) and --engine
+ENGINES = {
+    EasyOCREngine.name: EasyOCREngine,
+    SyntheticOCREngine.name: SyntheticOCREngine,
+}
+
+def create_engine(name, **kwargs):
+    """
+    Instantiate an OCR engine by name.
+
+    Parameters:
+    - name: key of ENGINES
+    - kwargs: constructor arguments (languages, gpu, model_dir and engine-specific options)
+    """
+    try:
+        engine_class = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown OCR engine '{name}'. Available: {', '.join(ENGINES)}")
+    return engine_class(**kwargs)
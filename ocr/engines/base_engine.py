@@ -0,0 +1,58 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# === OCREngine: Interface for text detection + recognition backends ===
+class OCREngine(ABC):
+    name = "base"                   # Short identifier used in cache keys and on the CLI
+
+    @abstractmethod
+    def readtext(self, img):
+        """
+        Detect and recognize text in an image.
+
+        Parameters:
+        - img: grayscale (or BGR) NumPy image
+
+        Returns:
+        - list of (box, text, confidence), box being four [x, y] corner points
+        """
+        pass
+
+    def detect(self, img):
+        """
+        Find text regions without recognizing them. Engines with a separate
+        detector override this; the default runs the full pipeline.
+
+        Parameters:
+        - img: grayscale (or BGR) NumPy image
+
+        Returns:
+        - list of boxes, each four [x, y] corner points
+        """
+        return [box for box, _, _ in self.readtext(img)]
+
+    def recognize(self, img, boxes):
+        """
+        Recognize the text inside already detected boxes. The default runs
+        readtext on the bounding rectangle of each box.
+
+        Parameters:
+        - img: the image the boxes were detected in
+        - boxes: list of boxes, each four [x, y] corner points
+
+        Returns:
+        - list of (box, text, confidence), one per box and in the same order
+        """
+        height, width = img.shape[:2]
+        results = []
+        for box in boxes:
+            pts = np.asarray(box, dtype=np.float64)
+            x0, y0 = np.floor(pts.min(axis=0)).astype(int)
+            x1, y1 = np.ceil(pts.max(axis=0)).astype(int)
+            crop = img[max(y0, 0):min(y1, height), max(x0, 0):min(x1, width)]
+            found = self.readtext(crop) if crop.size else []
+            text = " ".join(t for _, t, _ in found)
+            confidence = float(np.mean([c for _, _, c in found])) if found else 0.0
+            results.append((box, text, confidence))
+        return results
@@ -0,0 +1,107 @@
+from .base_engine import OCREngine
+from utilities import LOGGER_NAME
+
+import os
+import sys
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# === EasyOCREngine: the EasyOCR detector + recognizer backend ===
+class EasyOCREngine(OCREngine):
+    name = "easyocr"
+
+    def __init__(self, languages, gpu=True, model_dir=None):
+        """
+        Build the EasyOCR reader, falling back to alternative model locations
+        when running from a PyInstaller bundle.
+
+        Parameters:
+        - languages: list of language codes
+        - gpu: whether EasyOCR should try to use the GPU
+        - model_dir: directory holding the EasyOCR weights
+        """
+        self.languages = languages
+        self.gpu = gpu
+        self.model_dir = model_dir
+
+        # Determine download settings
+        running_bundled = hasattr(sys, "_MEIPASS")
+        download_enabled = not running_bundled
+
+        # EasyOCR pulls in torch; import it only when a reader is actually built
+        import easyocr
+
+        # Initialize EasyOCR with proper parameters
+        try:
+            logger.info(f"Attempting EasyOCR initialization with model_storage_directory='{model_dir}'")
+            self.reader = easyocr.Reader(
+                self.languages, 
+                gpu=self.gpu,
+                model_storage_directory=model_dir if os.path.exists(model_dir) else None,
+                download_enabled=download_enabled
+            )
+            logger.info("✅ EasyOCR reader initialized successfully")
+            
+        except Exception as e:
+            logger.exception("❌ Primary EasyOCR initialization failed")
+            
+            # Fallback 1: Try without custom model directory
+            if running_bundled and os.path.exists(model_dir):
+                logger.info("Attempting fallback initialization without custom model directory...")
+                try:
+                    self.reader = easyocr.Reader(
+                        self.languages, 
+                        gpu=self.gpu,
+                        download_enabled=False
+                    )
+                    logger.info("✅ EasyOCR reader initialized with fallback method")
+                    return
+                except Exception as e2:
+                    logger.exception("❌ Fallback initialization also failed")
+            
+            # Fallback 2: Try with environment variable
+            if running_bundled:
+                logger.info("Attempting fallback with EASYOCR_MODULE_PATH...")
+                try:
+                    # Set environment variable for EasyOCR
+                    os.environ['EASYOCR_MODULE_PATH'] = model_dir
+                    self.reader = easyocr.Reader(
+                        self.languages, 
+                        gpu=self.gpu,
+                        download_enabled=False
+                    )
+                    logger.info("✅ EasyOCR reader initialized with environment variable")
+                    return
+                except Exception as e3:
+                    logger.exception("❌ Environment variable fallback failed")
+            
+            # If all fallbacks fail, raise the original error
+            raise Exception(f"All EasyOCR initialization attempts failed. Original error: {str(e)}")
+
+    def readtext(self, img):
+        return self.reader.readtext(img, detail=1, paragraph=False)
+
+    def detect(self, img):
+        # EasyOCR returns axis-aligned boxes as [x_min, x_max, y_min, y_max] and rotated ones as corner points
+        horizontal, free = self.reader.detect(img)
+        boxes = [[[x0, y0], [x1, y0], [x1, y1], [x0, y1]] for x0, x1, y0, y1 in horizontal[0]]
+        boxes.extend([[float(x), float(y)] for x, y in pts] for pts in free[0])
+        return boxes
+
+    def recognize(self, img, boxes):
+        # One box per call: EasyOCR sorts a batch by position, which would lose the box order
+        results = []
+        for box in boxes:
+            xs, ys = [p[0] for p in box], [p[1] for p in box]
+            axis_aligned = len(set(xs)) == 2 and len(set(ys)) == 2
+            found = self.reader.recognize(
+                img,
+                horizontal_list=[[int(min(xs)), int(max(xs)), int(min(ys)), int(max(ys))]] if axis_aligned else [],
+                free_list=[] if axis_aligned else [box],
+                detail=1, paragraph=False
+            )
+            text = " ".join(t for _, t, _ in found)
+            confidence = max((float(c) for _, _, c in found), default=0.0)
+            results.append((box, text, confidence))
+        return results
@@ -0,0 +1,102 @@
+from .base_engine import OCREngine
+from utilities import LOGGER_NAME
+
+import logging
+import time
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# === SyntheticOCREngine: deterministic fake results at a configurable cost ===
+class SyntheticOCREngine(OCREngine):
+    """
+    Produces a regular table of word boxes covering the image, without any
+    model. The same image shape and options always yield the same boxes and
+    texts, and each call can be made to take a fixed latency plus a cost per
+    megapixel, so the rest of the pipeline (preprocessing, visualization,
+    hit-testing, table filling) can be measured without loading EasyOCR.
+    """
+    name = "synthetic"
+
+    WORDS = ("total", "amount", "date", "item", "price", "qty", "net", "tax", "id", "note")
+
+    def __init__(self, languages=None, gpu=False, model_dir=None, rows=None, cols=8,
+                 word_height=24, latency_ms=0.0, ms_per_megapixel=0.0, confidence=0.9, seed=0,
+                 ms_per_word=0.0):
+        """
+        Parameters:
+        - languages, gpu, model_dir: accepted for interface compatibility, ignored
+        - rows: number of text rows (default: as many as fit at 2x word_height spacing)
+        - cols: number of words per row
+        - word_height: box height in pixels
+        - latency_ms: fixed time spent per call
+        - ms_per_megapixel: additional time per megapixel of input
+        - confidence: confidence reported for every word
+        - seed: seed for the generated texts
+        - ms_per_word: recognition time per word; latency_ms and ms_per_megapixel count as detection
+        """
+        self.rows = rows
+        self.cols = max(1, int(cols))
+        self.word_height = max(1, int(word_height))
+        self.latency_ms = float(latency_ms)
+        self.ms_per_megapixel = float(ms_per_megapixel)
+        self.confidence = float(confidence)
+        self.seed = int(seed)
+        self.ms_per_word = float(ms_per_word)
+        logger.info(f"Synthetic OCR engine: cols={self.cols}, word_height={self.word_height}, "
+                    f"latency={self.latency_ms}ms + {self.ms_per_megapixel}ms/MP")
+
+    def readtext(self, img):
+        height, width = img.shape[:2]
+        results = self.generate(height, width)
+        self._spend(self._detect_ms(height, width) + self.ms_per_word * len(results))
+        return results
+
+    def detect(self, img):
+        height, width = img.shape[:2]
+        self._spend(self._detect_ms(height, width))
+        return [box for box, _, _ in self.generate(height, width)]
+
+    def recognize(self, img, boxes):
+        height, width = img.shape[:2]
+        self._spend(self.ms_per_word * len(boxes))
+        texts = {self._box_key(box): (text, conf) for box, text, conf in self.generate(height, width)}
+        return [(box, *texts.get(self._box_key(box), ("", 0.0))) for box in boxes]
+
+    def _detect_ms(self, height, width):
+        return self.latency_ms + self.ms_per_megapixel * height * width / 1e6
+
+    @staticmethod
+    def _spend(cost_ms):
+        if cost_ms > 0:
+            time.sleep(cost_ms / 1000)  # Simulated inference; releases the GIL like a real engine
+
+    @staticmethod
+    def _box_key(box):
+        return tuple(round(float(v), 3) for point in box for v in point)
+
+    def generate(self, height, width):
+        """
+        Build the deterministic result list for an image of the given size.
+        """
+        pitch_y = 2 * self.word_height
+        rows = self.rows if self.rows is not None else max(0, (height - self.word_height) // pitch_y)
+        pitch_x = width / self.cols
+        if rows == 0 or pitch_x < 4:
+            return []
+
+        # Box corners for the whole grid at once: words fill 70% of their column
+        r, c = np.meshgrid(np.arange(rows), np.arange(self.cols), indexing='ij')
+        x0 = (c * pitch_x + 0.15 * pitch_x).ravel()
+        x1 = (c * pitch_x + 0.85 * pitch_x).ravel()
+        y0 = (r * pitch_y + self.word_height / 2).ravel()
+        y1 = y0 + self.word_height
+        boxes = np.stack([np.column_stack([x0, y0]), np.column_stack([x1, y0]),
+                          np.column_stack([x1, y1]), np.column_stack([x0, y1])], axis=1)
+
+        rng = np.random.default_rng(self.seed)
+        picks = rng.integers(0, len(self.WORDS), size=len(x0))
+        return [
+            (box.tolist(), f"{self.WORDS[p]}{i}", self.confidence)
+            for i, (box, p) in enumerate(zip(boxes, picks))
+        ]
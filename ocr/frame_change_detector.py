@@ -0,0 +1,80 @@
+from utilities import LOGGER_NAME, OCR_WATCH_THRESHOLD
+
+import cv2
+import logging
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class FrameChangeDetector:
+    """
+    Cheap change detection between consecutive captures of the same region.
+
+    Each frame is reduced to a small greyscale thumbnail with one pixel per
+    tile (INTER_AREA averages the tile), so comparing two frames costs a
+    resize and a subtraction of a few hundred values. Tiles whose mean grey
+    level moved by more than the threshold are changed, and changed tile
+    rows are merged into horizontal bands that can be recognized on their own.
+    """
+    TILE_SIZE = 16              # Tile edge length in frame pixels
+    BAND_PADDING = 1            # Extra tile rows around a changed band so text is not cut
+
+    def __init__(self, threshold=OCR_WATCH_THRESHOLD, tile_size=TILE_SIZE):
+        """
+        Parameters:
+        - threshold: mean grey-level difference of a tile that counts as a change
+        - tile_size: tile edge length in pixels
+        """
+        self.threshold = threshold
+        self.tile_size = max(1, int(tile_size))
+        self._previous = None           # Tile thumbnail of the last frame
+        self._shape = None
+
+    def reset(self):
+        """Forget the last frame; the next one counts as entirely changed."""
+        self._previous = None
+        self._shape = None
+
+    def changed_bands(self, frame):
+        """
+        Compare a frame with the previous one and remember it.
+
+        Parameters:
+        - frame: BGR, BGRA or greyscale image of the watched region
+
+        Returns:
+        - list of (y0, y1) row ranges that changed, end-exclusive; the whole
+          frame for the first call or after the region size changed, [] if nothing changed
+        """
+        height, width = frame.shape[:2]
+        thumbnail = self._thumbnail(frame)
+        previous, self._previous = self._previous, thumbnail
+        if previous is None or self._shape != (height, width):
+            self._shape = (height, width)
+            return [(0, height)]
+
+        changed_rows = (np.abs(thumbnail - previous) > self.threshold).any(axis=1)
+        if not changed_rows.any():
+            return []
+
+        # Grow each changed tile row by the padding, then split into contiguous runs
+        padded = changed_rows.copy()
+        for shift in range(1, self.BAND_PADDING + 1):
+            padded[shift:] |= changed_rows[:-shift]
+            padded[:-shift] |= changed_rows[shift:]
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], padded.astype(np.int8), [0]))))
+        bands = [(int(start) * self.tile_size, min(int(end) * self.tile_size, height))
+                 for start, end in zip(edges[::2], edges[1::2])]
+        logger.debug(f"Frame change: {int(changed_rows.sum())} tile row(s) in {len(bands)} band(s)")
+        return bands
+
+    def _thumbnail(self, frame):
+        """
+        One float per tile: the mean grey level of that tile.
+        """
+        if frame.ndim == 3:
+            code = cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            frame = cv2.cvtColor(frame, code)
+        height, width = frame.shape[:2]
+        size = (max(1, -(-width // self.tile_size)), max(1, -(-height // self.tile_size)))
+        return cv2.resize(frame, size, interpolation=cv2.INTER_AREA).astype(np.float32)
@@ -1,12 +1,13 @@
-import numpy as np
+from collections import deque
 import logging
 from utilities import LOGGER_NAME
-from table_core.grid_commands import InsertWordCommand
+from ..word_spatial_index import WordSpatialIndex
+from ..table_structure import TableStructureBuilder
 
 logger = logging.getLogger(LOGGER_NAME)
 
 class WordClickHandler:
-    def __init__(self, ax, ocr_results, visualizer, canvas_updater, controller):
+    def __init__(self, ax, ocr_results, visualizer, canvas_updater, controller, recognizer=None):
         """
         Handles user mouse clicks on an image to select OCR-detected words.
 
@@ -16,12 +17,20 @@ class WordClickHandler:
         - visualizer: Instance of OCRImageVisualizer for drawing selections.
         - canvas_updater: Object that updates the Tkinter-embedded matplotlib canvas.
         - controller: Logic controller for inserting selected text into the table.
+        - recognizer: Optional LazyWordRecognizer; words without text are recognized in the background on click.
         """
         self.ax = ax
         self.ocr_results = ocr_results
         self.visualizer = visualizer
         self.canvas_updater = canvas_updater
         self.controller = controller 
+        self.recognizer = recognizer
+
+        # Precompute box bounds once so each click is an index lookup, not a scan
+        self.index = WordSpatialIndex([box for box, _, _ in ocr_results])
+
+        # Selections waiting for their text, oldest first; inserted strictly in this order
+        self._pending = deque()
 
     def on_click(self, event):
         """
@@ -35,28 +44,97 @@ class WordClickHandler:
             return
 
         # Get (x, y) coordinates of the click
-        x, y = int(event.xdata), int(event.ydata)
-
-        # Loop through OCR results and check if the click is within a word's bounding box
-        for box, text, _ in self.ocr_results:
-            pts = np.array(box).astype(int)
-
-            # Compute rectangular bounds of the polygon for hit-testing
-            x_min, y_min = pts[:, 0].min(), pts[:, 1].min()
-            x_max, y_max = pts[:, 0].max(), pts[:, 1].max()
-
-            # If the click falls inside the box, handle the selection
-            if x_min <= x <= x_max and y_min <= y <= y_max:
-                logger.info(f"Word selected: '{text}' at ({x},{y})")
-                try:
-                    # Insert the word into the table via the controller
-                    self.controller.insert_word(text)
-
-                    # Highlight the selected word on the image (green box)
-                    self.visualizer.draw_selection(box)
-
-                    # Redraw the canvas with the updated image
-                    self.canvas_updater.update_image(self.visualizer.get_rgb_image())
-                except Exception:
-                    logger.exception(f"Failed to insert word '{text}'")
-                break  # Stop after the first match
+        x, y = event.xdata, event.ydata
+
+        # Look up the word whose polygon contains the click
+        word_index = self.index.query_point(x, y)
+        if word_index is None:
+            logger.debug(f"No word at ({x:.0f},{y:.0f}); click ignored.")
+            return
+
+        logger.info(f"Word {word_index} selected at ({x:.0f},{y:.0f})")
+        self._select([word_index], single=True)
+
+    def on_rubber_band(self, x0, y0, x1, y1):
+        """
+        Called when the user drags a rectangle over the image.
+        Every word whose centre lies inside the rectangle is inserted in
+        reading order as one command, and the image is redrawn once.
+        """
+        x_min, x_max = min(x0, x1), max(x0, x1)
+        y_min, y_max = min(y0, y1), max(y0, y1)
+        candidates = self.index.query_rect(x_min, y_min, x_max, y_max)
+        bounds = self.index.bounds[candidates]
+        cx, cy = (bounds[:, 0] + bounds[:, 2]) / 2, (bounds[:, 1] + bounds[:, 3]) / 2
+        selected = candidates[(cx >= x_min) & (cx <= x_max) & (cy >= y_min) & (cy <= y_max)]
+        if len(selected) == 0:
+            logger.debug(f"No words inside ({x_min:.0f},{y_min:.0f})-({x_max:.0f},{y_max:.0f}).")
+            return
+
+        boxes = [self.ocr_results[i][0] for i in selected]
+        ordered = [int(selected[i]) for i in TableStructureBuilder().reading_order(boxes)]
+        logger.info(f"Rubber-band selection: {len(ordered)} words")
+        self._select(ordered, single=False)
+
+    def _select(self, indices, single):
+        """
+        Queue a selection for insertion. Words without text yet (detect-first
+        mode) are recognized by a priority job on the OCR executor, never on
+        the Tk thread; selections are still inserted in the order they were made.
+        """
+        selection = {"indices": indices, "single": single, "texts": None}
+        self._pending.append(selection)
+
+        texts = [self.ocr_results[i][1] for i in indices]
+        executor = self.controller.ocr_executor
+        if None not in texts or self.recognizer is None:
+            selection["texts"] = texts
+        elif executor is None:
+            selection["texts"] = self.recognizer.texts_for(None, indices)
+        else:
+            logger.debug(f"Recognizing {texts.count(None)} pending word(s) in the background")
+            executor.submit(
+                self.recognizer.texts_for, indices,
+                on_result=lambda texts: self._on_recognized(selection, texts),
+                on_error=lambda error: self._on_recognition_failed(selection, error),
+                priority=True
+            )
+        self._flush()
+
+    def _on_recognized(self, selection, texts):
+        selection["texts"] = texts
+        self._flush()
+
+    def _on_recognition_failed(self, selection, error):
+        logger.error(f"Recognition of {len(selection['indices'])} selected word(s) failed: {error}")
+        selection["texts"] = []
+        self._flush()
+
+    def _flush(self):
+        """
+        Insert every selection at the head of the queue whose text is known.
+        """
+        while self._pending and self._pending[0]["texts"] is not None:
+            selection = self._pending.popleft()
+            if selection["texts"]:
+                self._insert(selection)
+
+    def _insert(self, selection):
+        boxes = [self.ocr_results[i][0] for i in selection["indices"]]
+        texts = selection["texts"]
+        try:
+            if selection["single"]:
+                # Insert the word into the table via the controller
+                self.controller.insert_word(texts[0])
+                logger.info(f"Word inserted: '{texts[0]}'")
+
+                # Highlight the selected word on the image (green box)
+                dirty_rect = self.visualizer.draw_selection(boxes[0])
+            else:
+                self.controller.insert_words(texts)
+                dirty_rect = self.visualizer.draw_selections(boxes)
+
+            # Redraw only the part of the canvas that changed
+            self.canvas_updater.update_region(self.visualizer.get_rgb_image(), dirty_rect)
+        except Exception:
+            logger.exception(f"Failed to insert {len(texts)} selected word(s)")
@@ -1,5 +1,6 @@
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.transforms import Bbox
 import logging
 from utilities import LOGGER_NAME
 
@@ -9,7 +10,14 @@ class ImageCanvasEmbedder:
     """
     Embeds a Matplotlib image canvas inside a Tkinter container.
     Handles initial display and updating of the image, as well as mouse click bindings.
+
+    Small changes (e.g. a highlighted word) are drawn as patch images on top of
+    the base image and blitted, so their cost does not depend on image size.
     """
+    MAX_PATCHES = 64    # Patches kept before they are folded back into the base image
+    PATCH_MARGIN = 3    # Unchanged pixels copied around each dirty rectangle
+    DRAG_THRESHOLD = 5  # Screen pixels a press must move to count as a rubber-band drag
+
     def __init__(self, tk_container, image_rgb):
         """
         Initializes the canvas and displays the given image inside the Tkinter UI.
@@ -18,8 +26,9 @@ class ImageCanvasEmbedder:
         - tk_container: the Tkinter frame or window to embed the canvas into
         - image_rgb: the RGB image (as a NumPy array) to display initially
         """
-        # Create a Matplotlib figure and axes
-        self.fig, self.ax = plt.subplots(figsize=(12, 10))
+        # Create a Matplotlib figure and axes (no pyplot: the figure is owned by this canvas only)
+        self.fig = Figure(figsize=(12, 10))
+        self.ax = self.fig.add_subplot()
 
         # Display the image using imshow and store the artist object
         self.im_artist = self.ax.imshow(image_rgb)
@@ -27,6 +36,14 @@ class ImageCanvasEmbedder:
         # Hide the axes for a clean image display
         self.ax.axis('off')
 
+        # Freeze the view so patch images never change the axes limits
+        self.ax.set_autoscale_on(False)
+        self.patches = []                       # Patch artists drawn over the base image
+        self._click_handler = None
+        self._band_handler = None
+        self._press_event = None                # Left press waiting to become a click or a drag
+        self._mouse_connected = False
+
         # Create a FigureCanvas and embed it in the given Tkinter container
         self.canvas = FigureCanvasTkAgg(self.fig, master=tk_container)
         self.canvas.draw()
@@ -43,9 +60,57 @@ class ImageCanvasEmbedder:
         Parameters:
         - image_rgb: the new RGB image to display
         """
+        self._clear_patches()
         self.im_artist.set_data(image_rgb)
         self.canvas.draw()
 
+    def update_region(self, image_rgb, rect):
+        """
+        Updates only a rectangular region of the displayed image.
+
+        The region is copied into a small image artist placed over the base
+        image, drawn on its own and blitted to the screen.
+
+        Parameters:
+        - image_rgb: the full RGB image that contains the change
+        - rect: (x0, y0, x1, y1) dirty rectangle in image pixels, end-exclusive
+        """
+        x0, y0, x1, y1 = rect
+        if x1 <= x0 or y1 <= y0:
+            return
+        # Include a margin of unchanged pixels so resampling at the patch edge blends seamlessly
+        height, width = image_rgb.shape[:2]
+        x0, y0 = max(x0 - self.PATCH_MARGIN, 0), max(y0 - self.PATCH_MARGIN, 0)
+        x1, y1 = min(x1 + self.PATCH_MARGIN, width), min(y1 + self.PATCH_MARGIN, height)
+        if len(self.patches) >= self.MAX_PATCHES:
+            self.update_image(image_rgb)        # Fold all patches back into the base image
+            return
+
+        patch = self.ax.imshow(
+            image_rgb[y0:y1, x0:x1].copy(),
+            extent=(x0 - 0.5, x1 - 0.5, y1 - 0.5, y0 - 0.5),   # Pixel-centre aligned with the base image
+            interpolation=self.im_artist.get_interpolation()
+        )
+        self.patches.append(patch)
+
+        try:
+            self.ax.draw_artist(patch)
+            region = Bbox.intersection(patch.get_window_extent(), self.ax.bbox)
+            if region is not None:
+                self.canvas.blit(region.padded(1))
+        except Exception:
+            # Nothing rendered yet (e.g. window not mapped) - fall back to a normal redraw
+            logger.debug("Blit not possible; scheduling full redraw.")
+            self.canvas.draw_idle()
+
+    def _clear_patches(self):
+        """
+        Remove all patch artists drawn by update_region.
+        """
+        for patch in self.patches:
+            patch.remove()
+        self.patches.clear()
+
     def bind_click(self, handler):
         """
         Binds a mouse click handler to the canvas.
@@ -53,4 +118,40 @@ class ImageCanvasEmbedder:
         Parameters:
         - handler: a function to call when the user clicks on the image
         """
-        self.canvas.mpl_connect('button_press_event', handler)
+        self._click_handler = handler
+        self._connect_mouse()
+
+    def bind_rubber_band(self, handler):
+        """
+        Binds a handler for rectangles dragged with the left button. Once this
+        is bound, left clicks are delivered on release, so a drag that starts
+        on a word does not also insert that word.
+
+        Parameters:
+        - handler: a function called with (x0, y0, x1, y1) in image pixels
+        """
+        self._band_handler = handler
+        self._connect_mouse()
+
+    def _connect_mouse(self):
+        if not self._mouse_connected:
+            self.canvas.mpl_connect('button_press_event', self._on_press)
+            self.canvas.mpl_connect('button_release_event', self._on_release)
+            self._mouse_connected = True
+
+    def _on_press(self, event):
+        if event.button == 1 and self._band_handler is not None:
+            self._press_event = event           # Click or drag is decided on release
+        elif self._click_handler is not None:
+            self._click_handler(event)
+
+    def _on_release(self, event):
+        press, self._press_event = self._press_event, None
+        if press is None or event.button != 1:
+            return
+        dragged = max(abs(event.x - press.x), abs(event.y - press.y)) > self.DRAG_THRESHOLD
+        if not dragged:
+            if self._click_handler is not None:
+                self._click_handler(press)
+        elif press.inaxes == self.ax and event.inaxes == self.ax:
+            self._band_handler(press.xdata, press.ydata, event.xdata, event.ydata)
@@ -2,39 +2,62 @@ from utilities import LOGGER_NAME
 
 import cv2
 import logging
+import numpy as np
 
 logger = logging.getLogger(LOGGER_NAME)
 
 # === Image processor: loads, resizes, and enhances an image for OCR ===
 class OCRImageProcessor:
-    def __init__(self, image_path, scale_percent):
+    CLAHE_CLIP_LIMIT = 2.0                          # Contrast limit for CLAHE
+    CLAHE_TILE_GRID = (8, 8)                        # CLAHE tile grid size
+
+    def __init__(self, image_path=None, scale_percent=150, image=None):
         """
-        Initialize the processor with image path and scale percentage.
+        Initialize the processor with an image path (or an in-memory image) and scale percentage.
         Automatically loads and preprocesses the image.
+
+        Parameters:
+        - image_path: path of the image file (ignored when `image` is given)
+        - scale_percent: percentage to resize the image
+        - image: optional NumPy image (grayscale, BGR or BGRA, e.g. an mss screen grab)
         """
         self.image_path = image_path                # Path to the image file
+        self.image = image                          # In-memory source image, if any
         self.scale_percent = scale_percent          # Percentage to resize the image
         self.img = None                             # Original resized image (in color) 
         self.gray_enhanced = None                   # Preprocessed grayscale image for OCR
 
-        logger.info(f"Initializing OCRImageProcessor for: {image_path} with scale {scale_percent}%")
+        source = "in-memory image" if image is not None else image_path
+        logger.info(f"Initializing OCRImageProcessor for: {source} with scale {scale_percent}%")
         self.load_and_preprocess()                  # Perform preprocessing immediately
 
 
     def load_and_preprocess(self):
         """
-        Load the image from disk, resize it, convert to grayscale,
+        Load the image from disk (or take the in-memory buffer), resize it, convert to grayscale,
         and apply contrast enhancement for better OCR results.
         """
-        # Load the image using OpenCV
-        logger.info("Loading image...")
-        img = cv2.imread(self.image_path)
-        if img is None:
-            logger.error(f"Image not found at path: {self.image_path}")
-            raise FileNotFoundError(f"Image not found: {self.image_path}")
-        
-        logger.info(f"Image loaded: {self.image_path} (original size: {img.shape[1]}x{img.shape[0]})")
-        
+        if self.image is not None:
+            # In-memory source: no disk round trip, just make sure OpenCV can use the buffer
+            img = np.ascontiguousarray(self.image)
+            logger.info(f"Using in-memory image (original size: {img.shape[1]}x{img.shape[0]})")
+        else:
+            # Load the image using OpenCV
+            logger.info("Loading image...")
+            img = cv2.imread(self.image_path)
+            if img is None:
+                logger.error(f"Image not found at path: {self.image_path}")
+                raise FileNotFoundError(f"Image not found: {self.image_path}")
+
+            logger.info(f"Image loaded: {self.image_path} (original size: {img.shape[1]}x{img.shape[0]})")
+
+        # === Normalise to a BGR display image before resizing (screen grabs are BGRA) ===
+        channels = 1 if img.ndim == 2 else img.shape[2]
+        if channels == 4:
+            img = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
+        elif channels == 1:
+            img = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+
         # === Resize the image by the given percentage ===
         new_dim = (
             int(img.shape[1] * self.scale_percent / 100), # New width
@@ -48,10 +71,21 @@ class OCRImageProcessor:
         logger.debug("Converted image to grayscale.")
         # === Apply CLAHE (Contrast Limited Adaptive Histogram Equalization) ===
         # Improves contrast in varying lighting conditions for better OCR accuracy
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        clahe = cv2.createCLAHE(clipLimit=self.CLAHE_CLIP_LIMIT, tileGridSize=self.CLAHE_TILE_GRID)
         gray_enhanced = clahe.apply(gray)
         logger.debug("Applied CLAHE for contrast enhancement.")
         # Save results to instance variables
         self.img = img                          # Resized color image (for display)
         self.gray_enhanced = gray_enhanced      # Enhanced grayscale image (for OCR)
-        logger.info("Image preprocessing complete.")
\ No newline at end of file
+        logger.info("Image preprocessing complete.")
+
+    def preprocessing_params(self):
+        """
+        Parameters that shape `gray_enhanced`; used to key cached OCR results.
+        """
+        return {
+            "scale_percent": self.scale_percent,
+            "interpolation": "cubic",
+            "clahe_clip_limit": self.CLAHE_CLIP_LIMIT,
+            "clahe_tile_grid": list(self.CLAHE_TILE_GRID),
+        }
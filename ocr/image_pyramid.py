@@ -0,0 +1,98 @@
+from utilities import LOGGER_NAME
+
+import cv2
+import logging
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class ImagePyramid:
+    """
+    Lazily built multi-resolution copies of a display image.
+
+    Level 0 is the full-resolution display buffer itself. Level k halves the
+    size of level k-1 and is only computed (and then cached) when a zoom
+    level first needs it. Downsampling starts from the clean image, without
+    overlays, and the overlays are then painted onto each level in that
+    level's own pixel coordinates. This way thin box outlines stay sharp
+    instead of being averaged away.
+    """
+    MIN_LEVEL_SIZE = 64         # Stop halving once a level would be smaller than this
+
+    def __init__(self, base_rgb, clean_source, painter=None):
+        """
+        Parameters:
+        - base_rgb: level 0, the full-resolution display image (with overlays)
+        - clean_source: callable returning the full-resolution image without overlays
+        - painter: optional callable(level_rgb, scale_x, scale_y) drawing overlays onto a level
+        """
+        self.base = base_rgb
+        self._clean_source = clean_source
+        self.painter = painter
+        self._clean = {}                    # level (>= 1) -> clean (overlay-free) image
+        self._levels = {0: base_rgb}        # level -> displayed image
+
+        height, width = base_rgb.shape[:2]
+        self.max_level = 0
+        while min(width, height) // 2 >= self.MIN_LEVEL_SIZE:
+            width, height = (width + 1) // 2, (height + 1) // 2
+            self.max_level += 1
+
+    def level_for_zoom(self, zoom):
+        """
+        Smallest level whose resolution is still at least `zoom` (screen px per base px).
+        """
+        level = 0
+        while level < self.max_level and 0.5 ** (level + 1) >= zoom:
+            level += 1
+        return level
+
+    def level(self, k):
+        """
+        Return the image of level k, computing it (and the levels above) on first use.
+        """
+        image = self._levels.get(k)
+        if image is not None:
+            return image
+
+        clean = self._clean_level(k)
+        image = clean.copy()
+        if self.painter is not None:
+            sx, sy = self._scale_of(image)
+            self.painter(image, sx, sy)
+        self._levels[k] = image
+        logger.debug(f"Image pyramid level {k} built ({image.shape[1]}x{image.shape[0]})")
+        return image
+
+    def _clean_level(self, k):
+        if k == 0:
+            # Only needed to build level 1, so the full-resolution copy is not cached
+            return np.ascontiguousarray(self._clean_source())
+        clean = self._clean.get(k)
+        if clean is None:
+            clean = cv2.pyrDown(self._clean_level(k - 1))
+            self._clean[k] = clean
+        return clean
+
+    def _scale_of(self, image):
+        height, width = self.base.shape[:2]
+        return image.shape[1] / width, image.shape[0] / height
+
+    def scale(self, k):
+        """
+        (scale_x, scale_y) from base pixels to level-k pixels.
+        """
+        return self._scale_of(self.level(k))
+
+    def paint_levels(self, painter):
+        """
+        Apply an incremental overlay change to every cached level above 0
+        (level 0 is the caller's own buffer). Levels not built yet will
+        include the change through the regular painter when they are built.
+
+        Parameters:
+        - painter: callable(level_rgb, scale_x, scale_y)
+        """
+        for k, image in self._levels.items():
+            if k > 0:
+                painter(image, *self._scale_of(image))
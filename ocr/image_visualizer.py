@@ -1,6 +1,7 @@
 import cv2
 import numpy as np
 import logging
+from .image_pyramid import ImagePyramid
 from utilities import LOGGER_NAME
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -21,7 +22,10 @@ class OCRImageVisualizer:
         """
         self.original_img = img                        # BGR image as input
         self.ocr_results = ocr_results                 # OCR results with bounding boxes
+        self.selections = []                           # (points, color, thickness) drawn over the boxes
+        self._pyramid = None                           # Downsampled display levels, built on first use
         self.display_img = self._draw_boxes()          # Image with red boxes over words
+        self.display_rgb = cv2.cvtColor(self.display_img, cv2.COLOR_BGR2RGB)  # Persistent RGB display buffer
 
     def _draw_boxes(self, color=(0, 0, 255)):
         """
@@ -42,20 +46,105 @@ class OCRImageVisualizer:
 
     def get_rgb_image(self):
         """
-        Convert the current display image from BGR to RGB for Matplotlib display.
+        Return the RGB display buffer for Matplotlib/Tk display.
+        The buffer is kept in sync with display_img and updated in place,
+        so no full-frame conversion happens per call.
 
         Returns:
-        - RGB version of the current image
+        - RGB version of the current image (shared, do not modify)
         """
-        return cv2.cvtColor(self.display_img, cv2.COLOR_BGR2RGB)
+        return self.display_rgb
 
-    def draw_selection(self, box, color=(0, 255, 0)):
+    @property
+    def pyramid(self):
+        """
+        Multi-resolution view of the display buffer for zoomed-out rendering.
+        Levels are downsampled from the image without boxes and the boxes are
+        drawn again at each level's own scale, so outlines stay two pixels wide.
+
+        Returns:
+        - ImagePyramid whose level 0 is the RGB display buffer
+        """
+        if self._pyramid is None:
+            self._pyramid = ImagePyramid(
+                self.display_rgb,
+                clean_source=lambda: self.original_img[..., ::-1],
+                painter=self._paint_level
+            )
+        return self._pyramid
+
+    def _paint_level(self, level_rgb, scale_x, scale_y):
+        """
+        Draw the word boxes and all selections onto one RGB pyramid level.
+        """
+        scale = np.array([scale_x, scale_y])
+        red = (255, 0, 0)
+        polygons = [(np.asarray(box, dtype=np.float64) * scale).astype(np.int32) for box, _, _ in self.ocr_results]
+        cv2.polylines(level_rgb, polygons, isClosed=True, color=red, thickness=2)
+        for pts, color, thickness in self.selections:
+            self._paint_selection(level_rgb, scale_x, scale_y, pts, color, thickness)
+
+    @staticmethod
+    def _paint_selection(level_rgb, scale_x, scale_y, pts, color, thickness):
+        scaled = (pts * np.array([scale_x, scale_y])).astype(np.int32)
+        cv2.polylines(level_rgb, [scaled], isClosed=True, color=color[::-1], thickness=thickness)
+
+    def draw_selection(self, box, color=(0, 255, 0), thickness=2):
         """
         Highlight a selected word by drawing a green (or custom-colored) box over it.
+        Only the rectangle around the box is converted into the RGB buffer;
+        pyramid levels that are already built get the box at their own scale.
 
         Parameters:
         - box: the bounding box of the word (polygon points)
         - color: the BGR color to use for highlighting (default: green)
+        - thickness: line thickness in pixels
+
+        Returns:
+        - the dirty rectangle (x0, y0, x1, y1) in image pixels, end-exclusive
         """
         pts = np.array(box).astype(int)
-        cv2.polylines(self.display_img, [pts], isClosed=True, color=color, thickness=2)
+        cv2.polylines(self.display_img, [pts], isClosed=True, color=color, thickness=thickness)
+        self.selections.append((pts, color, thickness))
+        if self._pyramid is not None:
+            self._pyramid.paint_levels(
+                lambda level, sx, sy: self._paint_selection(level, sx, sy, pts, color, thickness))
+        return self._sync_rgb(self._dirty_rect(pts, thickness))
+
+    def draw_selections(self, boxes, color=(0, 255, 0), thickness=2):
+        """
+        Highlight several words at once.
+
+        Parameters:
+        - boxes: bounding boxes of the words (polygon points)
+        - color: the BGR color to use for highlighting (default: green)
+        - thickness: line thickness in pixels
+
+        Returns:
+        - the dirty rectangle covering all boxes, or None if there were none
+        """
+        rects = [self.draw_selection(box, color, thickness) for box in boxes]
+        if not rects:
+            return None
+        x0s, y0s, x1s, y1s = zip(*rects)
+        return min(x0s), min(y0s), max(x1s), max(y1s)
+
+    def _dirty_rect(self, pts, thickness):
+        """
+        Bounding rectangle of a polyline including its stroke, clipped to the image.
+        """
+        height, width = self.display_img.shape[:2]
+        pad = thickness // 2 + 2                   # Stroke width plus anti-alias margin
+        x0 = max(int(pts[:, 0].min()) - pad, 0)
+        y0 = max(int(pts[:, 1].min()) - pad, 0)
+        x1 = min(int(pts[:, 0].max()) + pad + 1, width)
+        y1 = min(int(pts[:, 1].max()) + pad + 1, height)
+        return x0, y0, max(x1, x0), max(y1, y0)
+
+    def _sync_rgb(self, rect):
+        """
+        Copy one rectangle of the BGR display image into the RGB buffer.
+        """
+        x0, y0, x1, y1 = rect
+        self.display_rgb[y0:y1, x0:x1] = self.display_img[y0:y1, x0:x1, ::-1]
+        return rect
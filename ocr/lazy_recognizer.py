@@ -0,0 +1,99 @@
+from .table_structure import TableStructureBuilder
+from utilities import LOGGER_NAME
+
+import logging
+import threading
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class LazyWordRecognizer:
+    """
+    Text for detected word boxes, recognized only when it is needed.
+
+    The OCR window can open as soon as detection has finished: every word
+    starts out as (box, None, 0.0) in the shared result list. A clicked
+    word is recognized on the spot, and a background job fills in the rest
+    in reading order, so words that nobody clicks cost nothing until then.
+    Entries in the list are replaced in place once recognized.
+    """
+    PROGRESS_STEPS = 50             # Progress reports per background pass
+
+    def __init__(self, reader, image, boxes):
+        """
+        Parameters:
+        - reader: OCRReader (or anything with recognize(img, boxes))
+        - image: the image the boxes were detected in
+        - boxes: list of detected boxes, each four [x, y] corner points
+        """
+        self.reader = reader
+        self.image = image
+        self.ocr_results = [(box, None, 0.0) for box in boxes]
+        self.order = TableStructureBuilder().reading_order(boxes)
+        self.recognized = 0
+        self._lock = threading.Lock()       # Guards the bookkeeping; recognition runs outside it
+
+    def __len__(self):
+        return len(self.ocr_results)
+
+    @property
+    def complete(self):
+        return self.recognized == len(self.ocr_results)
+
+    def is_recognized(self, index):
+        return self.ocr_results[index][1] is not None
+
+    def text_for(self, index):
+        """
+        Text of one word, recognizing it now if the background job has not reached it yet.
+        """
+        self.recognize_index(index)
+        return self.ocr_results[index][1]
+
+    def recognize_index(self, index):
+        """
+        Recognize one word unless that already happened.
+        """
+        if self.is_recognized(index):
+            return
+        box = self.ocr_results[index][0]
+        (result,) = self.reader.recognize(self.image, [box])
+        with self._lock:
+            if not self.is_recognized(index):
+                self.ocr_results[index] = (box, result[1] or "", result[2])
+                self.recognized += 1
+
+    def texts_for(self, task, indices):
+        """
+        Text of several words, recognizing the pending ones. Meant for a worker
+        thread (OCRTaskExecutor job), so a click never waits on the Tk thread.
+
+        Parameters:
+        - task: OCRTask of the job (unused; part of the executor contract)
+        - indices: word indices, in the order the texts are wanted
+
+        Returns:
+        - list of texts, one per index
+        """
+        return [self.text_for(index) for index in indices]
+
+    def recognize_remaining(self, task=None):
+        """
+        Recognize every word that is still pending, in reading order. Meant for a
+        worker thread: checks task.cancelled between words and reports progress.
+
+        Parameters:
+        - task: optional OCRTask used for cancellation and progress
+
+        Returns:
+        - the completed result list, or None if cancelled
+        """
+        total = len(self.ocr_results)
+        step = max(total // self.PROGRESS_STEPS, 1)
+        for n, index in enumerate(self.order, start=1):
+            if task is not None and task.cancelled:
+                return None
+            self.recognize_index(index)
+            if task is not None and (n % step == 0 or n == total):
+                task.report_progress(self.recognized, total)
+        logger.info(f"Background recognition finished: {total} words")
+        return self.ocr_results
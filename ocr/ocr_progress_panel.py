@@ -0,0 +1,70 @@
+from utilities import LOGGER_NAME, BG_COLOR, BUTTON_COLOR, BUTTON_HIGHLIGHT, FONT
+
+import tkinter as tk
+from tkinter import ttk
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class OCRProgressPanel:
+    """
+    Progress indicator with a Cancel button, shown in an OCR window
+    while the image is being recognized in the background.
+    """
+
+    def __init__(self, tk_container, on_cancel):
+        """
+        Parameters:
+        - tk_container: the OCR window to place the panel in
+        - on_cancel: called when the user presses Cancel
+        """
+        self.frame = tk.Frame(tk_container, bg=BG_COLOR)
+        self.frame.pack(fill='x', pady=6)
+
+        self.label = tk.Label(self.frame, text="", font=FONT, bg=BG_COLOR, anchor='w')
+        self.label.pack(side='left', padx=4)
+
+        self.cancel_button = tk.Button(
+            self.frame, text="Cancel", command=on_cancel,
+            font=FONT, bg=BUTTON_COLOR,
+            activebackground=BUTTON_HIGHLIGHT,
+            relief="groove", padx=12, pady=4
+        )
+        self.cancel_button.pack(side='right', padx=4)
+
+        self.progress_bar = ttk.Progressbar(self.frame, mode='indeterminate', length=260)
+        self.progress_bar.pack(side='right', padx=8)
+        logger.debug("OCR progress panel created.")
+
+    def start(self, message="Recognizing text..."):
+        """
+        Show an indeterminate (busy) progress animation.
+        """
+        self.label.config(text=message)
+        self.progress_bar.config(mode='indeterminate')
+        self.progress_bar.start(15)
+
+    def set_progress(self, done, total, message=None):
+        """
+        Switch to a determinate bar showing `done` out of `total` steps.
+        """
+        if total <= 0:
+            return
+        self.progress_bar.stop()
+        self.progress_bar.config(mode='determinate', maximum=total, value=done)
+        self.label.config(text=message or f"Recognizing text... {done}/{total}")
+
+    def show_error(self, message):
+        """
+        Stop the animation and display an error message.
+        """
+        self.progress_bar.stop()
+        self.label.config(text=message, fg="#b00020")
+        self.cancel_button.config(text="Close")
+
+    def destroy(self):
+        """
+        Remove the panel from the window.
+        """
+        self.progress_bar.stop()
+        self.frame.destroy()
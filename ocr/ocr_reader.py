@@ -1,75 +1,72 @@
-from utilities import resource_path, LOGGER_NAME
+from .engines import create_engine
+from utilities import resource_path, LOGGER_NAME, OCR_ENGINE_DEFAULT
 
-import os
-import sys
 import logging
-import easyocr
+import threading
+import numpy as np
 
 logger = logging.getLogger(LOGGER_NAME)
 
 class OCRReader:
-    def __init__(self, language='en', gpu=True):
+    def __init__(self, language='en', gpu=True, model_dir=None, engine=OCR_ENGINE_DEFAULT, engine_options=None):
         """
         Initialize the OCR reader with language and GPU usage.
+
+        Parameters:
+        - language: a language code ('en') or a list of codes (['en', 'de'])
+        - gpu: whether EasyOCR should try to use the GPU
+        - model_dir: directory holding the EasyOCR weights (default: bundled "models")
+        - engine: OCR backend name (see ocr.engines.ENGINES)
+        - engine_options: extra keyword arguments for the engine (e.g. synthetic cost)
         """
-        self.language = language
+        self.languages = self.normalize_languages(language)
+        self.language = self.languages[0]
         self.gpu = gpu
+        self._read_lock = threading.Lock()      # One inference at a time per reader
 
-        logger.info(f"Initializing OCRReader (lang='{language}', gpu={gpu})")
+        logger.info(f"Initializing OCRReader (lang={self.languages}, gpu={gpu}, engine={engine})")
 
         # Get model directory path
-        model_dir = resource_path("models")
-        
-        # Determine download settings
-        running_bundled = hasattr(sys, "_MEIPASS")
-        download_enabled = not running_bundled
+        model_dir = model_dir or self.default_model_dir()
+        self.model_dir = model_dir
 
-        # Initialize EasyOCR with proper parameters
-        try:
-            logger.info(f"Attempting EasyOCR initialization with model_storage_directory='{model_dir}'")
-            self.reader = easyocr.Reader(
-                [self.language], 
-                gpu=self.gpu,
-                model_storage_directory=model_dir if os.path.exists(model_dir) else None,
-                download_enabled=download_enabled
-            )
-            logger.info("✅ EasyOCR reader initialized successfully")
-            
-        except Exception as e:
-            logger.exception("❌ Primary EasyOCR initialization failed")
-            
-            # Fallback 1: Try without custom model directory
-            if running_bundled and os.path.exists(model_dir):
-                logger.info("Attempting fallback initialization without custom model directory...")
-                try:
-                    self.reader = easyocr.Reader(
-                        [self.language], 
-                        gpu=self.gpu,
-                        download_enabled=False
-                    )
-                    logger.info("✅ EasyOCR reader initialized with fallback method")
-                    return
-                except Exception as e2:
-                    logger.exception("❌ Fallback initialization also failed")
-            
-            # Fallback 2: Try with environment variable
-            if running_bundled:
-                logger.info("Attempting fallback with EASYOCR_MODULE_PATH...")
-                try:
-                    # Set environment variable for EasyOCR
-                    os.environ['EASYOCR_MODULE_PATH'] = model_dir
-                    self.reader = easyocr.Reader(
-                        [self.language], 
-                        gpu=self.gpu,
-                        download_enabled=False
-                    )
-                    logger.info("✅ EasyOCR reader initialized with environment variable")
-                    return
-                except Exception as e3:
-                    logger.exception("❌ Environment variable fallback failed")
-            
-            # If all fallbacks fail, raise the original error
-            raise Exception(f"All EasyOCR initialization attempts failed. Original error: {str(e)}")
+        # Build the OCR backend (EasyOCR unless another engine is requested)
+        self.engine_options = dict(engine_options or {})
+        self.engine = create_engine(engine, languages=self.languages, gpu=gpu, model_dir=model_dir,
+                                    **self.engine_options)
+        self.engine_name = self.engine.name
+        logger.info(f"OCR engine ready: {self.engine_name}")
+
+    @staticmethod
+    def normalize_languages(language):
+        """
+        Turn a language code or a list of codes into a list without duplicates.
+        """
+        if isinstance(language, str):
+            language = language.split(',')
+        languages = []
+        for lang in language:
+            lang = lang.strip()
+            if lang and lang not in languages:
+                languages.append(lang)
+        return languages or ['en']
+
+    @staticmethod
+    def engine_signature(engine=OCR_ENGINE_DEFAULT, engine_options=None):
+        """
+        Engine name and options as a dict; part of the OCR result cache key.
+        """
+        return {"engine": engine, "engine_options": dict(engine_options or {})}
+
+    def signature(self):
+        return self.engine_signature(self.engine_name, self.engine_options)
+
+    @staticmethod
+    def default_model_dir():
+        """
+        Path of the model directory shipped next to the app (or inside the bundle).
+        """
+        return resource_path("models")
 
     def read(self, img):
         """
@@ -77,9 +74,46 @@ class OCRReader:
         """
         logger.info("Starting OCR scan...")
         try:
-            results = self.reader.readtext(img, detail=1, paragraph=False)
+            # The reader is shared between background jobs; engines are not re-entrant
+            with self._read_lock:
+                results = self.engine.readtext(img)
             logger.info(f"OCR scan complete: {len(results)} text regions found")
             return results
         except Exception as e:
             logger.exception("OCR reading failed")
             raise
+
+    def detect(self, img):
+        """
+        Find the text regions of an image without recognizing them.
+
+        Returns:
+        - list of boxes, each four [x, y] corner points
+        """
+        logger.info("Starting text detection...")
+        with self._read_lock:
+            boxes = self.engine.detect(img)
+        logger.info(f"Text detection complete: {len(boxes)} regions found")
+        return boxes
+
+    def recognize(self, img, boxes):
+        """
+        Recognize the text inside already detected boxes.
+
+        Returns:
+        - list of (box, text, confidence), one per box and in the same order
+        """
+        with self._read_lock:
+            return self.engine.recognize(img, boxes)
+
+    def warm_up(self):
+        """
+        Run one tiny dummy inference so the first real scan does not pay for
+        lazy initialisation (CUDA/cuDNN setup, first-call allocations).
+        """
+        # White strip with a few dark strokes, so both detector and recognizer run
+        dummy = np.full((48, 160), 255, dtype=np.uint8)
+        for x in range(16, 144, 24):
+            dummy[12:36, x:x + 8] = 0
+        logger.info("Warming up OCR reader with a dummy image...")
+        self.read(dummy)
@@ -0,0 +1,174 @@
+from .ocr_reader import OCRReader
+from utilities import LOGGER_NAME, OCR_CACHE_DIR, OCR_CACHE_MAX_BYTES
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class OCRResultCache:
+    """
+    Persistent, content-addressed cache of OCR results.
+
+    Entries are keyed by a hash of the preprocessed image buffer together with
+    the OCR language and preprocessing parameters, so an identical screenshot
+    or a re-opened file skips `readtext` entirely. Each entry is a small .npz
+    file holding the boxes, confidences and UTF-8 encoded texts. The total
+    size is kept under `max_bytes` by evicting the least recently used files.
+    """
+
+    FILE_SUFFIX = ".ocr.npz"
+
+    def __init__(self, cache_dir=OCR_CACHE_DIR, max_bytes=OCR_CACHE_MAX_BYTES):
+        """
+        Parameters:
+        - cache_dir: directory the entries are stored in (created on demand)
+        - max_bytes: size budget for all entries together
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()      # Entries are written from OCR worker threads
+
+    @staticmethod
+    def make_key(gray_enhanced, languages, params=None):
+        """
+        Compute the cache key for a preprocessed image.
+
+        Parameters:
+        - gray_enhanced: the preprocessed image passed to the OCR engine
+        - languages: OCR language code or list of codes
+        - params: dict of preprocessing/recognition parameters that affect the result
+        """
+        # "en,de" (GUI) and ["en", "de"] (batch workers) must give the same key
+        languages = OCRReader.normalize_languages(languages)
+        buffer = np.ascontiguousarray(gray_enhanced)
+        digest = hashlib.sha256()
+        digest.update(str((buffer.shape, buffer.dtype.str)).encode())
+        digest.update(buffer.data)
+        digest.update(json.dumps([languages, params or {}], sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + self.FILE_SUFFIX)
+
+    def get(self, key):
+        """
+        Load the cached OCR results for `key`.
+
+        Returns:
+        - list of (box, text, confidence) tuples, or None on a cache miss
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                boxes = data["boxes"]
+                confidences = data["confidences"]
+                blob = data["texts"].tobytes()
+                offsets = data["offsets"]
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.exception(f"Corrupt OCR cache entry {path}; discarding it")
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)                 # Refresh recency for LRU eviction
+        except OSError:
+            pass
+
+        results = []
+        for i in range(len(confidences)):
+            text = blob[offsets[i]:offsets[i + 1]].decode("utf-8")
+            results.append((boxes[i].tolist(), text, float(confidences[i])))
+        logger.info(f"OCR cache hit: {len(results)} text regions loaded")
+        return results
+
+    def put(self, key, ocr_results):
+        """
+        Store OCR results under `key` and enforce the size budget.
+
+        Parameters:
+        - ocr_results: list of (box, text, confidence) as returned by the OCR engine
+        """
+        encoded = [text.encode("utf-8") for _, text, _ in ocr_results]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        if encoded:
+            np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        boxes = np.array([np.asarray(box, dtype=np.float32).reshape(4, 2) for box, _, _ in ocr_results],
+                         dtype=np.float32).reshape(-1, 4, 2)
+        confidences = np.array([conf for _, _, conf in ocr_results], dtype=np.float32)
+        texts = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, boxes=boxes, confidences=confidences, texts=texts, offsets=offsets)
+            os.replace(tmp_path, path)     # Atomic: readers never see a half-written entry
+        except OSError:
+            logger.exception("Failed to write OCR cache entry")
+            self._remove(tmp_path)
+            return
+        logger.debug(f"OCR results cached at {path}")
+        self._enforce_budget()
+
+    def _enforce_budget(self):
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            try:
+                names = os.listdir(self.cache_dir)
+            except OSError:
+                return
+            for name in names:
+                if not name.endswith(self.FILE_SUFFIX):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+            entries.sort()                 # Oldest access first
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+            logger.info(f"OCR cache trimmed to {total} bytes")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Remove every cached entry.
+        """
+        with self._lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(self.FILE_SUFFIX):
+                    self._remove(os.path.join(self.cache_dir, name))
+        logger.info("OCR cache cleared")
+
+
+# Shared cache used by every OCR entry point in the application
+shared_result_cache = OCRResultCache()
@@ -0,0 +1,77 @@
+from .ocr_reader import OCRReader
+from .ocr_result_cache import shared_result_cache
+from utilities import LOGGER_NAME, OCR_ENGINE_DEFAULT
+
+import logging
+import os
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# === Process-pool worker helpers ===
+# Each worker process builds one OCRReader in its initializer and keeps it
+# warm for every job it receives, so model loading is paid once per worker.
+
+_worker_reader = None
+
+
+def init_worker(language='en', gpu=True, model_dir=None, engine=OCR_ENGINE_DEFAULT, engine_options=None):
+    """
+    ProcessPoolExecutor initializer: load the OCR models in this worker process.
+    """
+    global _worker_reader
+    logger.info(f"OCR worker {os.getpid()} loading reader (lang={language}, gpu={gpu}, engine={engine})")
+    _worker_reader = OCRReader(language=language, gpu=gpu, model_dir=model_dir,
+                               engine=engine, engine_options=engine_options)
+
+
+def get_worker_reader():
+    """
+    Return the warm reader of this worker process.
+    """
+    if _worker_reader is None:
+        raise RuntimeError("OCR worker used before init_worker() ran")
+    return _worker_reader
+
+
+def recognize_tile(origin, tile):
+    """
+    Run OCR on one tile and return its results in tile coordinates.
+
+    Parameters:
+    - origin: (x, y) of the tile's top-left corner in the full image, passed through
+    - tile: grayscale tile as a NumPy array
+
+    Returns:
+    - (origin, list of (box, text, confidence))
+    """
+    return origin, get_worker_reader().read(tile)
+
+
+def recognize_file(image_path, scale_percent, use_cache=True):
+    """
+    Load, preprocess and recognize one image file in this worker process.
+
+    Parameters:
+    - image_path: path of the image on disk
+    - scale_percent: resize percent applied before OCR
+    - use_cache: answer from (and store into) the shared OCR result cache
+
+    Returns:
+    - (ocr_results, scale_percent) with boxes in preprocessed-image coordinates
+    """
+    from .image_preprocessor import OCRImageProcessor   # OpenCV is only needed in batch workers
+
+    reader = get_worker_reader()
+    processor = OCRImageProcessor(image_path, scale_percent)
+    cache_key = None
+    if use_cache:
+        cache_key = shared_result_cache.make_key(
+            processor.gray_enhanced, reader.languages, {**processor.preprocessing_params(), **reader.signature()})
+        ocr_results = shared_result_cache.get(cache_key)
+        if ocr_results is not None:
+            return ocr_results, scale_percent
+
+    ocr_results = reader.read(processor.gray_enhanced)
+    if cache_key is not None:
+        shared_result_cache.put(cache_key, ocr_results)
+    return ocr_results, scale_percent
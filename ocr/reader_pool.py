@@ -0,0 +1,124 @@
+from .ocr_reader import OCRReader
+from utilities import LOGGER_NAME, OCR_READER_POOL_SIZE, OCR_ENGINE_DEFAULT
+
+import logging
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class OCRReaderPool:
+    """
+    Process-wide registry of warm OCRReader instances.
+
+    Building an EasyOCR reader loads the detector and recognizer weights,
+    which takes seconds and hundreds of MB. The pool keeps the readers it has
+    built, keyed by (languages, gpu, model_dir, engine), and hands the same instance
+    out again on the next request. At most `max_readers` are kept alive; the
+    least recently used one is evicted when the cap is exceeded.
+    """
+
+    def __init__(self, max_readers=OCR_READER_POOL_SIZE):
+        """
+        Parameters:
+        - max_readers: how many readers may be cached at the same time
+        """
+        self.max_readers = max(1, int(max_readers))
+        self.engine = OCR_ENGINE_DEFAULT        # Engine used when a caller does not ask for one
+        self.engine_options = {}
+        self._readers = OrderedDict()      # key -> OCRReader, oldest first
+        self._lock = threading.RLock()     # Readers may be requested from worker threads
+
+    @staticmethod
+    def make_key(language='en', gpu=True, model_dir=None, engine=OCR_ENGINE_DEFAULT, engine_options=None):
+        """
+        Build the cache key for a reader configuration.
+        """
+        languages = tuple(OCRReader.normalize_languages(language))
+        model_dir = model_dir or OCRReader.default_model_dir()
+        options = tuple(sorted((engine_options or {}).items()))
+        return languages, bool(gpu), model_dir, engine, options
+
+    def set_engine(self, engine, engine_options=None):
+        """
+        Choose the engine handed out by default (e.g. from --engine).
+        """
+        with self._lock:
+            self.engine = engine
+            self.engine_options = dict(engine_options or {})
+        logger.info(f"Default OCR engine set to '{engine}'")
+
+    def engine_signature(self):
+        """
+        Signature of the default engine, for keying cached OCR results.
+        """
+        return OCRReader.engine_signature(self.engine, self.engine_options)
+
+    def get_reader(self, language='en', gpu=True, model_dir=None, engine=None, engine_options=None):
+        """
+        Return a warm reader for the given configuration, creating it on first use.
+
+        Parameters:
+        - language: language code or list of codes
+        - gpu: whether the reader should try to use the GPU
+        - model_dir: optional custom EasyOCR model directory
+        - engine: engine name (default: the pool's default engine)
+        - engine_options: engine-specific options (default: the pool's default options)
+        """
+        if engine is None:
+            engine, engine_options = self.engine, self.engine_options
+        key = self.make_key(language, gpu, model_dir, engine, engine_options)
+        with self._lock:
+            reader = self._readers.get(key)
+            if reader is not None:
+                self._readers.move_to_end(key)   # Mark as most recently used
+                logger.info(f"Reusing warm OCR reader for {key[0]} (gpu={key[1]})")
+                return reader
+
+            logger.info(f"No warm OCR reader for {key[0]} (gpu={key[1]}, engine={engine}); creating one")
+            reader = OCRReader(language=list(key[0]), gpu=key[1], model_dir=key[2],
+                               engine=engine, engine_options=engine_options)
+            self._readers[key] = reader
+            self._evict_if_needed()
+            return reader
+
+    def warm_up(self, language='en', gpu=True, model_dir=None, engine=None, engine_options=None):
+        """
+        Build (or fetch) the reader for a configuration and run a dummy inference on it.
+        Meant to run on a background thread shortly after start-up.
+        """
+        reader = self.get_reader(language, gpu, model_dir, engine, engine_options)
+        reader.warm_up()
+        return reader
+
+    def _evict_if_needed(self):
+        """
+        Drop least recently used readers until the pool is within its cap.
+        """
+        while len(self._readers) > self.max_readers:
+            key, _ = self._readers.popitem(last=False)
+            logger.info(f"Evicted OCR reader for {key[0]} (gpu={key[1]}) from pool")
+
+    def set_max_readers(self, max_readers):
+        """
+        Change the pool cap, evicting readers immediately if it shrinks.
+        """
+        with self._lock:
+            self.max_readers = max(1, int(max_readers))
+            self._evict_if_needed()
+
+    def clear(self):
+        """
+        Release every cached reader.
+        """
+        with self._lock:
+            self._readers.clear()
+            logger.info("OCR reader pool cleared")
+
+    def __len__(self):
+        with self._lock:
+            return len(self._readers)
+
+
+# Shared pool used by every OCR entry point in the application
+shared_reader_pool = OCRReaderPool()
@@ -0,0 +1,124 @@
+from utilities import LOGGER_NAME, OCR_MIN_CONFIDENCE, OCR_NMS_IOU
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class OCRResultFilter:
+    """
+    Post-processing stage for raw OCR results.
+
+    Results below a confidence threshold are dropped, then overlapping boxes
+    are thinned out with non-maximum suppression: the most confident box is
+    kept and every remaining box overlapping it by more than the IoU
+    threshold is discarded. Boxes are sorted by their left edge once, so each
+    suppression step is one vectorized comparison against the slice of boxes
+    that can overlap horizontally, not against all of them. The original
+    result order is preserved.
+    """
+
+    def __init__(self, min_confidence=OCR_MIN_CONFIDENCE, iou_threshold=OCR_NMS_IOU):
+        """
+        Parameters:
+        - min_confidence: results with a lower confidence are dropped (0 keeps all)
+        - iou_threshold: boxes overlapping a kept box by more than this IoU are dropped (>= 1 disables NMS)
+        """
+        self.min_confidence = min_confidence
+        self.iou_threshold = iou_threshold
+
+    def config(self):
+        """
+        Filter parameters, e.g. for logging or keying derived data.
+        """
+        return {"min_confidence": self.min_confidence, "nms_iou": self.iou_threshold}
+
+    def apply(self, ocr_results):
+        """
+        Filter a list of (box, text, confidence).
+
+        Returns:
+        - the surviving results, in their original order
+        """
+        if not ocr_results:
+            return ocr_results
+
+        confidences = np.array([conf for _, _, conf in ocr_results], dtype=np.float64)
+        keep = np.flatnonzero(confidences >= self.min_confidence)
+
+        if self.iou_threshold < 1 and len(keep) > 1:
+            bounds = self._bounds([ocr_results[i][0] for i in keep])
+            keep = keep[self.non_max_suppression(bounds, confidences[keep], self.iou_threshold)]
+
+        logger.info(f"OCR result filter kept {len(keep)} of {len(ocr_results)} regions")
+        return [ocr_results[i] for i in keep]
+
+    def apply_to_boxes(self, boxes):
+        """
+        Non-maximum suppression for detected boxes that have no text or confidence
+        yet (detect-first mode). Without a confidence, the larger box wins, so a
+        word box is kept over fragments of it. The confidence cut cannot be applied.
+
+        Returns:
+        - the surviving boxes, in their original order
+        """
+        if self.iou_threshold >= 1 or len(boxes) < 2:
+            return boxes
+        bounds = self._bounds(boxes)
+        areas = (bounds[:, 2] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 1])
+        keep = self.non_max_suppression(bounds, areas, self.iou_threshold)
+        logger.info(f"OCR box filter kept {len(keep)} of {len(boxes)} detected regions")
+        return [boxes[i] for i in keep]
+
+    @staticmethod
+    def _bounds(boxes):
+        """
+        (N, 4) array of x_min, y_min, x_max, y_max of four-point boxes.
+        """
+        polygons = np.array([np.asarray(box, dtype=np.float64).reshape(4, 2) for box in boxes])
+        return np.column_stack([polygons[:, :, 0].min(1), polygons[:, :, 1].min(1),
+                                polygons[:, :, 0].max(1), polygons[:, :, 1].max(1)])
+
+    @staticmethod
+    def non_max_suppression(bounds, scores, iou_threshold):
+        """
+        Greedy NMS over axis-aligned boxes.
+
+        Parameters:
+        - bounds: (N, 4) array of x_min, y_min, x_max, y_max
+        - scores: (N,) array; higher scores win
+        - iou_threshold: overlap above which the lower-scoring box is suppressed
+
+        Returns:
+        - sorted indices of the kept boxes
+        """
+        n = len(bounds)
+        x0, y0, x1, y1 = bounds.T
+        areas = np.maximum(x1 - x0, 0) * np.maximum(y1 - y0, 0)
+        order = np.argsort(-scores, kind='stable')
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.arange(n)                  # Position of each box in score order
+
+        # Boxes sorted by left edge: overlap candidates of box i lie in one contiguous slice
+        by_x = np.argsort(x0, kind='stable')
+        sorted_x0 = x0[by_x]
+        max_width = float(np.max(x1 - x0))
+
+        suppressed = np.zeros(n, dtype=bool)
+        for i in order:
+            if suppressed[i]:
+                continue
+            lo = np.searchsorted(sorted_x0, x0[i] - max_width, side='left')
+            hi = np.searchsorted(sorted_x0, x1[i], side='right')
+            cand = by_x[lo:hi]
+            cand = cand[(rank[cand] > rank[i]) & ~suppressed[cand]]
+            if len(cand) == 0:
+                continue
+            iw = np.minimum(x1[cand], x1[i]) - np.maximum(x0[cand], x0[i])
+            ih = np.minimum(y1[cand], y1[i]) - np.maximum(y0[cand], y0[i])
+            inter = np.clip(iw, 0, None) * np.clip(ih, 0, None)
+            union = areas[cand] + areas[i] - inter
+            iou = np.divide(inter, union, out=np.zeros_like(inter), where=union > 0)
+            suppressed[cand[iou > iou_threshold]] = True
+
+        return np.flatnonzero(~suppressed)
@@ -0,0 +1,117 @@
+from utilities import LOGGER_NAME
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class TableStructureBuilder:
+    """
+    Reconstructs a table from OCR word boxes.
+
+    Rows are found by clustering the vertical box centres: sorted centres
+    that are further apart than a fraction of the median text height start
+    a new row. Columns are found from the horizontal projection of all
+    boxes: a gutter wider than the column gap threshold that no box crosses
+    separates two columns. Everything is computed with NumPy over all boxes
+    at once; only the final text join per cell is a Python loop.
+    """
+
+    ROW_TOLERANCE = 0.5     # Max y-centre distance (in median text heights) within one row
+    COLUMN_GAP = 1.0        # Min empty gutter (in median text heights) between two columns
+    SPAN_FRACTION = 0.5     # Boxes wider than this share of the table ignore gutters (titles)
+
+    def __init__(self, row_tolerance=ROW_TOLERANCE, column_gap=COLUMN_GAP):
+        """
+        Parameters:
+        - row_tolerance: y-centre distance, in median text heights, that still counts as the same row
+        - column_gap: horizontal gap, in median text heights, that separates two columns
+        """
+        self.row_tolerance = row_tolerance
+        self.column_gap = column_gap
+
+    def build(self, ocr_results):
+        """
+        Arrange OCR results into a 2D table.
+
+        Parameters:
+        - ocr_results: list of (box, text, confidence)
+
+        Returns:
+        - list of rows, each a list of cell strings (all rows have the same length)
+        """
+        if not ocr_results:
+            return []
+
+        polygons = np.array([np.asarray(box, dtype=np.float64).reshape(4, 2) for box, _, _ in ocr_results])
+        x0, y0 = polygons[:, :, 0].min(axis=1), polygons[:, :, 1].min(axis=1)
+        x1, y1 = polygons[:, :, 0].max(axis=1), polygons[:, :, 1].max(axis=1)
+        line_height = max(float(np.median(y1 - y0)), 1.0)
+
+        row_ids = self._cluster_rows((y0 + y1) / 2, line_height)
+        col_ids, n_cols = self._cluster_columns(x0, x1, line_height)
+        n_rows = int(row_ids.max()) + 1
+
+        # Reading order inside each cell: row, column, then left to right
+        order = np.lexsort((x0, col_ids, row_ids))
+        cells = [['' for _ in range(n_cols)] for _ in range(n_rows)]
+        for i in order:
+            r, c = row_ids[i], col_ids[i]
+            text = ocr_results[i][1]
+            cells[r][c] = f"{cells[r][c]} {text}" if cells[r][c] else text
+
+        logger.info(f"Table structure reconstructed: {n_rows} rows x {n_cols} columns from {len(ocr_results)} words")
+        return cells
+
+    def reading_order(self, boxes):
+        """
+        Order boxes line by line, left to right within a line.
+
+        Parameters:
+        - boxes: list of boxes, each four [x, y] corner points
+
+        Returns:
+        - list of box indices in reading order
+        """
+        if not boxes:
+            return []
+        polygons = np.array([np.asarray(box, dtype=np.float64).reshape(4, 2) for box in boxes])
+        x0 = polygons[:, :, 0].min(axis=1)
+        y0, y1 = polygons[:, :, 1].min(axis=1), polygons[:, :, 1].max(axis=1)
+        line_height = max(float(np.median(y1 - y0)), 1.0)
+        row_ids = self._cluster_rows((y0 + y1) / 2, line_height)
+        return np.lexsort((x0, row_ids)).tolist()
+
+    def _cluster_rows(self, y_centres, line_height):
+        """
+        Assign a row index to every box from its vertical centre.
+        """
+        order = np.argsort(y_centres, kind='stable')
+        breaks = np.diff(y_centres[order]) > self.row_tolerance * line_height
+        row_ids = np.empty(len(y_centres), dtype=np.int64)
+        row_ids[order] = np.concatenate(([0], np.cumsum(breaks)))
+        return row_ids
+
+    def _cluster_columns(self, x0, x1, line_height):
+        """
+        Assign a column index to every box from empty vertical gutters.
+
+        Returns:
+        - (column index per box, number of columns)
+        """
+        table_width = max(float(x1.max() - x0.min()), 1.0)
+        regular = (x1 - x0) <= self.SPAN_FRACTION * table_width
+        if not regular.any():
+            return np.zeros(len(x0), dtype=np.int64), 1
+
+        # Sweep the regular boxes left to right; a gap after the running right edge is a gutter
+        order = np.argsort(x0[regular], kind='stable')
+        starts = x0[regular][order]
+        right_edge = np.maximum.accumulate(x1[regular][order])
+        gutter = starts[1:] > right_edge[:-1] + self.column_gap * line_height
+        boundaries = (right_edge[:-1][gutter] + starts[1:][gutter]) / 2
+
+        # Regular boxes go to the column containing their centre, spanning boxes to where they start
+        anchors = np.where(regular, (x0 + x1) / 2, x0)
+        col_ids = np.searchsorted(boundaries, anchors).astype(np.int64)
+        return col_ids, len(boundaries) + 1
@@ -0,0 +1,239 @@
+from .ocr_worker import init_worker, recognize_tile
+from utilities import LOGGER_NAME, OCR_TILE_SIZE, OCR_TILE_OVERLAP, OCR_TILE_WORKERS, OCR_ENGINE_DEFAULT
+
+import logging
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class TiledOCRRunner:
+    """
+    Recognizes very large images tile by tile across a process pool.
+
+    The preprocessed image is split into overlapping tiles, each tile is sent
+    to a worker process holding a warm OCR reader, and the detections are
+    shifted back into global coordinates. Words that were detected twice in
+    an overlap band are de-duplicated, preferring the copy that was not cut
+    by a tile edge.
+    """
+
+    DUPLICATE_OVERLAP = 0.5    # Fraction of the smaller box that must overlap to count as duplicate
+    EDGE_MARGIN = 2            # Pixels from an inner tile edge at which a box counts as cut
+
+    def __init__(self, language='en', gpu=True, tile_size=OCR_TILE_SIZE,
+                 overlap=OCR_TILE_OVERLAP, workers=OCR_TILE_WORKERS,
+                 engine=OCR_ENGINE_DEFAULT, engine_options=None):
+        """
+        Parameters:
+        - language: OCR language code or list of codes
+        - gpu: whether the worker readers should try to use the GPU
+        - tile_size: edge length of a square tile in pixels
+        - overlap: pixels shared by neighbouring tiles (should exceed the tallest word)
+        - workers: number of worker processes
+        - engine: OCR engine name used by the workers
+        - engine_options: engine-specific options
+        """
+        if overlap >= tile_size:
+            raise ValueError(f"Tile overlap ({overlap}) must be smaller than tile size ({tile_size})")
+        self.language = language
+        self.gpu = gpu
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.workers = max(1, workers)
+        self.engine = engine
+        self.engine_options = dict(engine_options or {})
+        self._pool = None
+
+    def config(self):
+        """
+        Parameters that affect the merged result; used for caching and pool reuse.
+        """
+        return {"tile_size": self.tile_size, "tile_overlap": self.overlap}
+
+    def _get_pool(self):
+        if self._pool is None:
+            logger.info(f"Starting {self.workers} OCR worker process(es) for tiled OCR")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=init_worker,
+                initargs=(self.language, self.gpu, None, self.engine, self.engine_options)
+            )
+        return self._pool
+
+    @staticmethod
+    def split_tiles(shape, tile_size, overlap):
+        """
+        Compute overlapping tile rectangles covering an image.
+
+        Returns:
+        - list of (x0, y0, x1, y1) rectangles, end-exclusive
+        """
+        height, width = shape[:2]
+        step = tile_size - overlap
+
+        def starts(length):
+            if length <= tile_size:
+                return [0]
+            positions = list(range(0, length - tile_size, step))
+            positions.append(length - tile_size)   # Last tile flush with the image edge
+            return positions
+
+        return [
+            (x, y, min(x + tile_size, width), min(y + tile_size, height))
+            for y in starts(height)
+            for x in starts(width)
+        ]
+
+    def read(self, gray_enhanced, on_tile_done=None, should_cancel=None):
+        """
+        Run tiled OCR on a preprocessed image.
+
+        Parameters:
+        - gray_enhanced: the full preprocessed grayscale image
+        - on_tile_done: optional callback(done, total, tile_results) as each tile finishes;
+          tile_results are already in global coordinates
+        - should_cancel: optional callable; when it returns True, remaining tiles are dropped
+
+        Returns:
+        - merged list of (box, text, confidence) in full-image coordinates
+        """
+        tiles = self.split_tiles(gray_enhanced.shape, self.tile_size, self.overlap)
+        logger.info(f"Tiled OCR: {len(tiles)} tile(s) of {self.tile_size}px, overlap {self.overlap}px")
+
+        pool = self._get_pool()
+        futures = {
+            pool.submit(recognize_tile, (x0, y0), np.ascontiguousarray(gray_enhanced[y0:y1, x0:x1])): i
+            for i, (x0, y0, x1, y1) in enumerate(tiles)
+        }
+
+        tile_results = [None] * len(tiles)
+        done = 0
+        try:
+            for future in as_completed(futures):
+                if should_cancel is not None and should_cancel():
+                    logger.info("Tiled OCR cancelled; dropping remaining tiles")
+                    return []
+                (ox, oy), results = future.result()
+                tile_results[futures[future]] = [
+                    ((np.asarray(box, dtype=np.float64) + (ox, oy)).tolist(), text, conf)
+                    for box, text, conf in results
+                ]
+                done += 1
+                logger.debug(f"Tile {done}/{len(tiles)} finished with {len(results)} regions")
+                if on_tile_done is not None:
+                    on_tile_done(done, len(tiles), tile_results[futures[future]])
+        finally:
+            for future in futures:
+                future.cancel()
+
+        merged = self.merge(tiles, tile_results, gray_enhanced.shape)
+        logger.info(f"Tiled OCR complete: {len(merged)} text regions after merging")
+        return merged
+
+    @classmethod
+    def merge(cls, tiles, tile_results, shape):
+        """
+        Combine per-tile results and drop duplicates found in overlap bands.
+
+        Parameters:
+        - tiles: tile rectangles as returned by split_tiles
+        - tile_results: per-tile result lists in global coordinates
+        - shape: shape of the full image
+
+        Returns:
+        - list of (box, text, confidence)
+        """
+        results, tile_ids = [], []
+        for i, per_tile in enumerate(tile_results):
+            results.extend(per_tile or [])
+            tile_ids.extend([i] * len(per_tile or []))
+        if len(tiles) < 2 or not results:
+            return results
+
+        height, width = shape[:2]
+        polygons = np.array([np.asarray(box, dtype=np.float64).reshape(4, 2) for box, _, _ in results])
+        bounds = np.column_stack([polygons[:, :, 0].min(1), polygons[:, :, 1].min(1),
+                                  polygons[:, :, 0].max(1), polygons[:, :, 1].max(1)])
+        tile_ids = np.array(tile_ids)
+        rects = np.array(tiles, dtype=np.float64)[tile_ids]
+
+        # A box is "cut" when it touches a tile edge that is not also an image edge
+        m = cls.EDGE_MARGIN
+        cut = (((bounds[:, 0] <= rects[:, 0] + m) & (rects[:, 0] > 0)) |
+               ((bounds[:, 1] <= rects[:, 1] + m) & (rects[:, 1] > 0)) |
+               ((bounds[:, 2] >= rects[:, 2] - m) & (rects[:, 2] < width)) |
+               ((bounds[:, 3] >= rects[:, 3] - m) & (rects[:, 3] < height)))
+
+        # Only boxes lying in a region covered by more than one tile can be duplicates
+        all_rects = np.array(tiles, dtype=np.float64)
+        covering = ((bounds[:, None, 0] < all_rects[None, :, 2]) & (bounds[:, None, 2] > all_rects[None, :, 0]) &
+                    (bounds[:, None, 1] < all_rects[None, :, 3]) & (bounds[:, None, 3] > all_rects[None, :, 1]))
+        in_overlap = np.flatnonzero(covering.sum(axis=1) > 1)
+
+        areas = np.maximum(bounds[:, 2] - bounds[:, 0], 0) * np.maximum(bounds[:, 3] - bounds[:, 1], 0)
+        # Preference: uncut boxes first, then larger boxes
+        order = in_overlap[np.lexsort((-areas[in_overlap], cut[in_overlap]))]
+
+        suppressed = np.zeros(len(results), dtype=bool)
+        for pos, i in enumerate(order):
+            if suppressed[i]:
+                continue
+            rest = order[pos + 1:]
+            rest = rest[~suppressed[rest] & (tile_ids[rest] != tile_ids[i])]
+            if len(rest) == 0:
+                continue
+            iw = np.minimum(bounds[rest, 2], bounds[i, 2]) - np.maximum(bounds[rest, 0], bounds[i, 0])
+            ih = np.minimum(bounds[rest, 3], bounds[i, 3]) - np.maximum(bounds[rest, 1], bounds[i, 1])
+            inter = np.clip(iw, 0, None) * np.clip(ih, 0, None)
+            smaller = np.maximum(np.minimum(areas[rest], areas[i]), 1e-9)
+            suppressed[rest[inter / smaller > cls.DUPLICATE_OVERLAP]] = True
+
+        logger.debug(f"Tile merge removed {int(suppressed.sum())} duplicate region(s)")
+        return [result for result, dropped in zip(results, suppressed) if not dropped]
+
+    def shutdown(self):
+        """
+        Stop the worker processes.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            logger.info("Tiled OCR worker pool shut down")
+
+
+_shared_runner = None
+_shared_runner_key = None
+_shared_runner_lock = threading.Lock()
+
+
+def get_shared_tiled_runner(language='en', gpu=True, tile_size=OCR_TILE_SIZE,
+                            overlap=OCR_TILE_OVERLAP, workers=OCR_TILE_WORKERS,
+                            engine=OCR_ENGINE_DEFAULT, engine_options=None):
+    """
+    Return a process-wide TiledOCRRunner, keeping its warm worker pool between calls.
+    The previous runner is shut down when a different configuration is requested.
+    """
+    global _shared_runner, _shared_runner_key
+    key = (str(language), bool(gpu), tile_size, overlap, max(1, workers),
+           engine, tuple(sorted((engine_options or {}).items())))
+    with _shared_runner_lock:
+        if _shared_runner is not None and _shared_runner_key != key:
+            _shared_runner.shutdown()
+            _shared_runner = None
+        if _shared_runner is None:
+            _shared_runner = TiledOCRRunner(language, gpu, tile_size, overlap, workers, engine, engine_options)
+            _shared_runner_key = key
+        return _shared_runner
+
+
+def shutdown_shared_tiled_runner():
+    """
+    Stop the shared runner's worker processes (called on application exit).
+    """
+    global _shared_runner
+    with _shared_runner_lock:
+        if _shared_runner is not None:
+            _shared_runner.shutdown()
+            _shared_runner = None
@@ -0,0 +1,337 @@
+from utilities import LOGGER_NAME
+
+import cv2
+import logging
+import math
+import sys
+import tkinter as tk
+from types import SimpleNamespace
+
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class TkImageViewer:
+    """
+    Image viewer drawn directly on a Tk canvas.
+
+    Only the part of the image inside the viewport is cropped, scaled and
+    handed to Tk, so the cost of a redraw depends on the window size and not
+    on the image size. Mouse wheel zooms around the cursor, dragging with the
+    right or middle button pans, and a double right-click fits the image to
+    the window again. When zoomed out and given an ImagePyramid, the crop is
+    taken from the smallest pyramid level that still has enough detail, so
+    a huge scan is never resampled at full resolution.
+
+    Offers the same update_image / update_region / bind_click contract as
+    ImageCanvasEmbedder. Click handlers receive an event with `inaxes`,
+    `xdata` and `ydata` (image pixel coordinates), like Matplotlib events.
+    """
+    MIN_ZOOM = 0.02
+    MAX_ZOOM = 16.0
+    ZOOM_STEP = 1.25            # Zoom factor per wheel notch
+    DRAG_THRESHOLD = 5          # Screen pixels a left press must move to start a rubber band
+    BAND_COLOR = "#00c853"
+    BG_COLOR = "#2b2b2b"
+
+    def __init__(self, tk_container, image_rgb, pyramid=None):
+        """
+        Initializes the canvas and displays the given image inside the Tkinter UI.
+
+        Parameters:
+        - tk_container: the Tkinter frame or window to embed the canvas into
+        - image_rgb: the RGB image (as a NumPy array) to display initially
+        - pyramid: optional ImagePyramid whose level 0 is image_rgb
+        """
+        self.image = image_rgb
+        self.pyramid = pyramid
+        self.ax = self                      # Stands in for the Matplotlib axes in click events
+        self.zoom = 1.0                     # Screen pixels per image pixel
+        self.offset = (0.0, 0.0)            # Image coordinate shown at the viewport's top-left
+        self._fitted = False                # Fit to window once the canvas has a size
+        self._render_pending = False
+        self._drag_origin = None
+        self._photo = None                  # Keeps the Tk image alive while displayed
+        self._click_handler = None
+        self._band_handler = None
+        self._band_origin = None            # Screen point of a left press that may become a drag
+        self._band_item = None              # Canvas rectangle shown while dragging
+
+        self.canvas = tk.Canvas(tk_container, bg=self.BG_COLOR, highlightthickness=0,
+                                width=1000, height=800)
+        self.canvas.pack(fill='both', expand=True)
+        self._image_item = self.canvas.create_image(0, 0, anchor='nw')
+        self._bind_view_events()
+
+        logger.info("Tk image viewer embedded in Tkinter container.")
+
+    # === Public contract shared with ImageCanvasEmbedder ===
+
+    def update_image(self, image_rgb):
+        """
+        Replace the displayed image.
+
+        Parameters:
+        - image_rgb: the new RGB image to display
+        """
+        if self.pyramid is not None and image_rgb is not self.pyramid.base:
+            self.pyramid = None             # Levels belong to the previous image
+        self.image = image_rgb
+        self._schedule_render()
+
+    def update_region(self, image_rgb, rect):
+        """
+        Refresh after a rectangular change; ignored when the change is off screen.
+
+        Parameters:
+        - image_rgb: the full RGB image that contains the change
+        - rect: (x0, y0, x1, y1) dirty rectangle in image pixels, end-exclusive
+        """
+        self.image = image_rgb
+        vx0, vy0, vx1, vy1 = self.visible_rect()
+        x0, y0, x1, y1 = rect
+        if x1 > vx0 and x0 < vx1 and y1 > vy0 and y0 < vy1:
+            self._schedule_render()
+
+    def bind_click(self, handler):
+        """
+        Binds a mouse click handler to the canvas.
+
+        Parameters:
+        - handler: a function to call with a click event (inaxes, xdata, ydata, button)
+        """
+        self._click_handler = handler
+        self._bind_left_button()
+
+    def bind_rubber_band(self, handler):
+        """
+        Binds a handler for rectangles dragged with the left button. Once this
+        is bound, left clicks are delivered on release, so a drag that starts
+        on a word does not also insert that word.
+
+        Parameters:
+        - handler: a function called with (x0, y0, x1, y1) in image pixels
+        """
+        self._band_handler = handler
+        self._bind_left_button()
+
+    def _bind_left_button(self):
+        self.canvas.bind("<ButtonPress-1>", self._on_left_press)
+        self.canvas.bind("<B1-Motion>", self._on_left_drag)
+        self.canvas.bind("<ButtonRelease-1>", self._on_left_release)
+
+    # === View geometry ===
+
+    def viewport_size(self):
+        return max(self.canvas.winfo_width(), 1), max(self.canvas.winfo_height(), 1)
+
+    def image_size(self):
+        return self.image.shape[1], self.image.shape[0]
+
+    def to_image(self, sx, sy):
+        """
+        Convert canvas (screen) coordinates into image pixel coordinates.
+        """
+        return self.offset[0] + sx / self.zoom, self.offset[1] + sy / self.zoom
+
+    def visible_rect(self):
+        """
+        Image rectangle (x0, y0, x1, y1) currently inside the viewport, end-exclusive.
+        """
+        vw, vh = self.viewport_size()
+        iw, ih = self.image_size()
+        x0 = max(int(math.floor(self.offset[0])), 0)
+        y0 = max(int(math.floor(self.offset[1])), 0)
+        x1 = min(int(math.ceil(self.offset[0] + vw / self.zoom)), iw)
+        y1 = min(int(math.ceil(self.offset[1] + vh / self.zoom)), ih)
+        return x0, y0, max(x1, x0), max(y1, y0)
+
+    def fit(self):
+        """
+        Zoom so the whole image fits into the viewport, centred.
+        """
+        vw, vh = self.viewport_size()
+        iw, ih = self.image_size()
+        self.zoom = min(max(min(vw / iw, vh / ih), self.MIN_ZOOM), self.MAX_ZOOM)
+        self.offset = self._clamp_offset(0.0, 0.0)
+        self._schedule_render()
+
+    def zoom_at(self, factor, sx, sy):
+        """
+        Multiply the zoom, keeping the image point under (sx, sy) in place.
+        """
+        new_zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        if new_zoom == self.zoom:
+            return
+        ix, iy = self.to_image(sx, sy)
+        self.zoom = new_zoom
+        self.offset = self._clamp_offset(ix - sx / new_zoom, iy - sy / new_zoom)
+        self._schedule_render()
+
+    def pan_by(self, dx, dy):
+        """
+        Move the view by (dx, dy) screen pixels.
+        """
+        ox, oy = self.offset
+        self.offset = self._clamp_offset(ox - dx / self.zoom, oy - dy / self.zoom)
+        self._schedule_render()
+
+    def _clamp_offset(self, ox, oy):
+        """
+        Keep the image inside the viewport; centre it along axes where it is smaller.
+        """
+        vw, vh = self.viewport_size()
+        iw, ih = self.image_size()
+        span_x, span_y = vw / self.zoom, vh / self.zoom
+        ox = (iw - span_x) / 2 if span_x >= iw else min(max(ox, 0.0), iw - span_x)
+        oy = (ih - span_y) / 2 if span_y >= ih else min(max(oy, 0.0), ih - span_y)
+        return ox, oy
+
+    # === Rendering ===
+
+    def _schedule_render(self):
+        """
+        Coalesce bursts of updates (wheel, drag, clicks) into one render per idle cycle.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            self.canvas.after_idle(self._render)
+
+    def _source_level(self):
+        """
+        Pick the image to crop from for the current zoom.
+
+        Returns:
+        - (image, scale_x, scale_y), the scales mapping base pixels to that image's pixels
+        """
+        if self.pyramid is None:
+            return self.image, 1.0, 1.0
+        level = self.pyramid.level_for_zoom(self.zoom)
+        return (self.pyramid.level(level), *self.pyramid.scale(level))
+
+    def _render(self):
+        """
+        Crop the visible image region, scale it to screen size and show it.
+        """
+        self._render_pending = False
+        if not self.canvas.winfo_exists():
+            return
+        x0, y0, x1, y1 = self.visible_rect()
+        if x1 <= x0 or y1 <= y0:
+            return
+
+        # Visible rectangle in the pixels of the chosen pyramid level
+        source, sx, sy = self._source_level()
+        lh, lw = source.shape[:2]
+        lx0, ly0 = min(int(math.floor(x0 * sx)), lw - 1), min(int(math.floor(y0 * sy)), lh - 1)
+        lx1, ly1 = max(min(int(math.ceil(x1 * sx)), lw), lx0 + 1), max(min(int(math.ceil(y1 * sy)), lh), ly0 + 1)
+        zoom_x, zoom_y = self.zoom / sx, self.zoom / sy
+
+        out_w = max(int(round((lx1 - lx0) * zoom_x)), 1)
+        out_h = max(int(round((ly1 - ly0) * zoom_y)), 1)
+        crop = source[ly0:ly1, lx0:lx1]
+        if (out_w, out_h) != (lx1 - lx0, ly1 - ly0):
+            interpolation = cv2.INTER_AREA if zoom_x < 1 else cv2.INTER_NEAREST
+            crop = cv2.resize(crop, (out_w, out_h), interpolation=interpolation)
+
+        self._photo = self._to_photo(crop)
+        self.canvas.itemconfigure(self._image_item, image=self._photo)
+        self.canvas.coords(self._image_item,
+                           (lx0 / sx - self.offset[0]) * self.zoom, (ly0 / sy - self.offset[1]) * self.zoom)
+
+    @staticmethod
+    def _to_photo(rgb):
+        """
+        Wrap an RGB array as a Tk PhotoImage via an in-memory binary PPM.
+        """
+        height, width = rgb.shape[:2]
+        header = f"P6 {width} {height} 255 ".encode()
+        return tk.PhotoImage(data=header + np.ascontiguousarray(rgb, dtype=np.uint8).tobytes(), format="PPM")
+
+    # === Event handling ===
+
+    def _bind_view_events(self):
+        c = self.canvas
+        c.bind("<Configure>", self._on_configure)
+        for button in ("2", "3"):
+            c.bind(f"<ButtonPress-{button}>", self._on_pan_start)
+            c.bind(f"<B{button}-Motion>", self._on_pan_drag)
+            c.bind(f"<ButtonRelease-{button}>", self._on_pan_end)
+        c.bind("<Double-Button-3>", lambda e: self.fit())
+        if sys.platform.startswith("linux"):
+            c.bind("<Button-4>", lambda e: self._on_wheel(e, 1))
+            c.bind("<Button-5>", lambda e: self._on_wheel(e, -1))
+        else:
+            c.bind("<MouseWheel>", lambda e: self._on_wheel(e, 1 if e.delta > 0 else -1))
+
+    def _on_configure(self, event):
+        if not self._fitted:
+            self._fitted = True
+            self.fit()
+        else:
+            self.offset = self._clamp_offset(*self.offset)
+            self._schedule_render()
+
+    def _on_wheel(self, event, direction):
+        factor = self.ZOOM_STEP if direction > 0 else 1 / self.ZOOM_STEP
+        self.zoom_at(factor, event.x, event.y)
+        return "break"                      # Keep the table's global wheel binding out of it
+
+    def _on_pan_start(self, event):
+        self._drag_origin = (event.x, event.y)
+
+    def _on_pan_drag(self, event):
+        if self._drag_origin is None:
+            return
+        dx, dy = event.x - self._drag_origin[0], event.y - self._drag_origin[1]
+        self._drag_origin = (event.x, event.y)
+        self.pan_by(dx, dy)
+
+    def _on_pan_end(self, event):
+        self._drag_origin = None
+
+    def _on_left_press(self, event):
+        if self._band_handler is not None:
+            self._band_origin = (event.x, event.y)      # Click or drag is decided on release
+        else:
+            self._dispatch_click(event)
+
+    def _on_left_drag(self, event):
+        if self._band_origin is None:
+            return
+        ox, oy = self._band_origin
+        if self._band_item is None:
+            if max(abs(event.x - ox), abs(event.y - oy)) <= self.DRAG_THRESHOLD:
+                return
+            self._band_item = self.canvas.create_rectangle(ox, oy, ox, oy, outline=self.BAND_COLOR,
+                                                           width=2, dash=(4, 3))
+        self.canvas.coords(self._band_item, ox, oy, event.x, event.y)
+
+    def _on_left_release(self, event):
+        origin, self._band_origin = self._band_origin, None
+        if origin is None:
+            return
+        if self._band_item is None:
+            self._dispatch_click(SimpleNamespace(x=origin[0], y=origin[1]))
+            return
+
+        self.canvas.delete(self._band_item)
+        self._band_item = None
+        iw, ih = self.image_size()
+        x0, y0 = self.to_image(*origin)
+        x1, y1 = self.to_image(event.x, event.y)
+        self._band_handler(min(max(x0, 0), iw), min(max(y0, 0), ih),
+                           min(max(x1, 0), iw), min(max(y1, 0), ih))
+
+    def _dispatch_click(self, event):
+        if self._click_handler is None:
+            return
+        x, y = self.to_image(event.x, event.y)
+        iw, ih = self.image_size()
+        inside = 0 <= x < iw and 0 <= y < ih
+        self._click_handler(SimpleNamespace(
+            inaxes=self.ax if inside else None,
+            xdata=x if inside else None,
+            ydata=y if inside else None,
+            button=1, x=event.x, y=event.y
+        ))
@@ -1,9 +1,10 @@
 from .image_visualizer import OCRImageVisualizer
-from .image_canvas_embedder import ImageCanvasEmbedder
+from .tk_image_viewer import TkImageViewer
 from .handlers import WordClickHandler
-from utilities import LOGGER_NAME
+from utilities import LOGGER_NAME, BG_COLOR, BUTTON_COLOR, BUTTON_HIGHLIGHT, FONT, OCR_IMAGE_VIEWER
 
 import logging
+import tkinter as tk
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -15,7 +16,9 @@ class WordSelectorImage:
     - Handles word-click interaction and insertion
     """
 
-    def __init__(self, img, ocr_results, controller, tk_container):
+    VIEWERS = ("tk", "matplotlib")
+
+    def __init__(self, img, ocr_results, controller, tk_container, viewer=OCR_IMAGE_VIEWER, recognizer=None):
         """
         Initializes the full word selector interface.
 
@@ -24,14 +27,36 @@ class WordSelectorImage:
         - ocr_results: list of (box, text, confidence) from OCR
         - controller: logic handler for inserting selected words into a table
         - tk_container: Tkinter widget to host the embedded image viewer
+        - viewer: "tk" (viewport-only Tk canvas with zoom/pan) or "matplotlib"
+        - recognizer: LazyWordRecognizer when the words are still being recognized (detect-first mode)
         """
         logger.info("Initializing WordSelectorImage...")
+        self.ocr_results = ocr_results
+        self.controller = controller
+        self.recognizer = recognizer
+
+        # Toolbar above the image with actions that use all OCR results at once
+        self.toolbar = tk.Frame(tk_container, bg=BG_COLOR)
+        self.toolbar.pack(side='top', fill='x')
+        self.auto_layout_button = tk.Button(
+            self.toolbar, text="Auto-layout table", command=self.auto_layout,
+            font=FONT, bg=BUTTON_COLOR,
+            activebackground=BUTTON_HIGHLIGHT,
+            relief="groove", padx=12, pady=6
+        )
+        self.auto_layout_button.pack(side='left', padx=4, pady=4)
+        self.status_label = tk.Label(self.toolbar, text="", font=FONT, bg=BG_COLOR, fg="#555555")
+        self.status_label.pack(side='left', padx=8)
+
+        # Auto-layout needs every text; it becomes available once background recognition is done
+        if recognizer is not None and not recognizer.complete:
+            self.set_recognition_progress(recognizer.recognized, len(recognizer))
 
         # Prepare image with red OCR bounding boxes
         self.visualizer = OCRImageVisualizer(img, ocr_results)
 
-        # Embed the RGB image in a Tkinter + Matplotlib canvas
-        self.canvas = ImageCanvasEmbedder(tk_container, self.visualizer.get_rgb_image())
+        # Embed the RGB image; both viewers share the update_image/update_region/bind_click contract
+        self.canvas = self._create_viewer(viewer, tk_container, self.visualizer)
 
         # Handle click events for inserting words
         self.click_handler = WordClickHandler(
@@ -39,12 +64,50 @@ class WordSelectorImage:
             ocr_results=ocr_results,
             visualizer=self.visualizer,
             canvas_updater=self.canvas,
-            controller=controller
+            controller=controller,
+            recognizer=recognizer
         )
 
+    def _create_viewer(self, viewer, tk_container, visualizer):
+        """
+        Build the requested image viewer. Matplotlib is only imported when it is chosen.
+        The Tk viewer also gets the visualizer's image pyramid for zoomed-out rendering.
+        """
+        image_rgb = visualizer.get_rgb_image()
+        if viewer == "matplotlib":
+            from .image_canvas_embedder import ImageCanvasEmbedder
+            return ImageCanvasEmbedder(tk_container, image_rgb)
+        if viewer != "tk":
+            logger.warning(f"Unknown image viewer '{viewer}'; using the Tk viewer.")
+        return TkImageViewer(tk_container, image_rgb, pyramid=visualizer.pyramid)
+
     def show(self):
         """
         Enables the image display and activates click-based word selection.
+        Dragging a rectangle selects every word inside it.
         """
         logger.info("Activating word selection UI...")
         self.canvas.bind_click(self.click_handler.on_click)
+        self.canvas.bind_rubber_band(self.click_handler.on_rubber_band)
+
+    def set_recognition_progress(self, done, total):
+        """
+        Show how many detected words have been recognized so far.
+
+        Parameters:
+        - done: number of recognized words
+        - total: number of detected words
+        """
+        if done < total:
+            self.auto_layout_button.config(state="disabled")
+            self.status_label.config(text=f"Recognizing words {done}/{total}…")
+        else:
+            self.auto_layout_button.config(state="normal")
+            self.status_label.config(text=f"{total} words recognized")
+
+    def auto_layout(self):
+        """
+        Reconstructs the table from all OCR boxes and fills the grid in one step.
+        """
+        logger.info("Auto-layout requested from the OCR window.")
+        self.controller.auto_layout(self.ocr_results)
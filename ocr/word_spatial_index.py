@@ -0,0 +1,161 @@
+from utilities import LOGGER_NAME
+
+import logging
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class WordSpatialIndex:
+    """
+    Uniform-grid spatial index over OCR word boxes.
+
+    The polygon corners and their bounding rectangles are converted to NumPy
+    arrays once. Every box is registered in each grid cell its bounds touch,
+    stored as two parallel sorted arrays (cell id, word index), so a query
+    only looks at the handful of words registered in the cells it covers.
+    Point queries finish with an exact point-in-polygon test, so rotated
+    boxes are hit-tested against their real outline.
+    """
+
+    def __init__(self, boxes, cell_size=None):
+        """
+        Parameters:
+        - boxes: list of 4-point word polygons, as returned by the OCR engine
+        - cell_size: grid cell size in pixels (default: about two text lines)
+        """
+        self.polygons = np.array(
+            [np.asarray(box, dtype=np.float64).reshape(4, 2) for box in boxes], dtype=np.float64
+        ).reshape(-1, 4, 2)
+        self.bounds = np.column_stack([
+            self.polygons[:, :, 0].min(axis=1), self.polygons[:, :, 1].min(axis=1),
+            self.polygons[:, :, 0].max(axis=1), self.polygons[:, :, 1].max(axis=1),
+        ]) if len(self.polygons) else np.zeros((0, 4))
+
+        if cell_size is None:
+            heights = self.bounds[:, 3] - self.bounds[:, 1]
+            cell_size = 2 * float(np.median(heights)) if len(heights) else 0.0
+        self.cell_size = max(float(cell_size), 16.0)
+        self._build_grid()
+        logger.info(f"Spatial index built for {len(self)} words (cell size {self.cell_size:.0f}px)")
+
+    def __len__(self):
+        return len(self.polygons)
+
+    def _cell_range(self, x_min, y_min, x_max, y_max):
+        """
+        Convert pixel bounds into inclusive grid cell ranges (vectorized).
+        """
+        cs = self.cell_size
+        cx0 = np.clip(np.floor((x_min - self.origin[0]) / cs).astype(np.int64), 0, self.grid_w - 1)
+        cy0 = np.clip(np.floor((y_min - self.origin[1]) / cs).astype(np.int64), 0, self.grid_h - 1)
+        cx1 = np.clip(np.floor((x_max - self.origin[0]) / cs).astype(np.int64), 0, self.grid_w - 1)
+        cy1 = np.clip(np.floor((y_max - self.origin[1]) / cs).astype(np.int64), 0, self.grid_h - 1)
+        return cx0, cy0, cx1, cy1
+
+    def _build_grid(self):
+        """
+        Register every box in all grid cells covered by its bounding rectangle.
+        """
+        n = len(self)
+        if n == 0:
+            self.origin = np.zeros(2)
+            self.grid_w = self.grid_h = 1
+            self._cell_ids = np.zeros(0, dtype=np.int64)
+            self._items = np.zeros(0, dtype=np.int64)
+            return
+
+        self.origin = self.bounds[:, :2].min(axis=0)
+        extent = self.bounds[:, 2:].max(axis=0) - self.origin
+        self.grid_w = int(extent[0] // self.cell_size) + 1
+        self.grid_h = int(extent[1] // self.cell_size) + 1
+
+        cx0, cy0, cx1, cy1 = self._cell_range(*self.bounds.T)
+        widths = cx1 - cx0 + 1
+        counts = widths * (cy1 - cy0 + 1)
+
+        # Expand each box into one (cell, word) pair per covered cell
+        items = np.repeat(np.arange(n), counts)
+        starts = np.repeat(np.cumsum(counts) - counts, counts)
+        local = np.arange(counts.sum()) - starts
+        w = widths[items]
+        cell_ids = (cy0[items] + local // w) * self.grid_w + (cx0[items] + local % w)
+
+        order = np.lexsort((items, cell_ids))
+        self._cell_ids = cell_ids[order]
+        self._items = items[order]
+
+    def _candidates(self, x_min, y_min, x_max, y_max):
+        """
+        Indices of words registered in any grid cell overlapping the rectangle.
+        """
+        if len(self) == 0:
+            return np.zeros(0, dtype=np.int64)
+        cx0, cy0, cx1, cy1 = (int(v) for v in self._cell_range(
+            np.float64(x_min), np.float64(y_min), np.float64(x_max), np.float64(y_max)))
+        chunks = []
+        for cy in range(cy0, cy1 + 1):
+            row_start = cy * self.grid_w
+            lo = np.searchsorted(self._cell_ids, row_start + cx0, side='left')
+            hi = np.searchsorted(self._cell_ids, row_start + cx1, side='right')
+            chunks.append(self._items[lo:hi])
+        return np.unique(np.concatenate(chunks))
+
+    def query_point(self, x, y):
+        """
+        Find the word whose polygon contains the point (x, y).
+
+        Returns:
+        - index of the matching word (the first one in OCR order), or None
+        """
+        candidates = self._candidates(x, y, x, y)
+        if len(candidates) == 0:
+            return None
+
+        b = self.bounds[candidates]
+        candidates = candidates[(b[:, 0] <= x) & (x <= b[:, 2]) & (b[:, 1] <= y) & (y <= b[:, 3])]
+        if len(candidates) == 0:
+            return None
+
+        hits = candidates[self._contains_point(self.polygons[candidates], x, y)]
+        return int(hits[0]) if len(hits) else None
+
+    @staticmethod
+    def _contains_point(polygons, x, y):
+        """
+        Vectorized even-odd (ray casting) test of one point against many polygons.
+        Points lying exactly on a polygon edge count as inside.
+        """
+        xi, yi = polygons[:, :, 0], polygons[:, :, 1]
+        xj, yj = np.roll(xi, 1, axis=1), np.roll(yi, 1, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crosses = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+            # On-edge check: collinear with an edge and within its span
+            cross = (xj - xi) * (y - yi) - (yj - yi) * (x - xi)
+            on_edge = (np.abs(cross) <= 1e-9 * (1 + np.abs(xj - xi) + np.abs(yj - yi))) & \
+                      (np.minimum(xi, xj) <= x) & (x <= np.maximum(xi, xj)) & \
+                      (np.minimum(yi, yj) <= y) & (y <= np.maximum(yi, yj))
+        return (crosses.sum(axis=1) % 2 == 1) | on_edge.any(axis=1)
+
+    def query_rect(self, x0, y0, x1, y1, fully_inside=False):
+        """
+        Find all words overlapping (or fully inside) a rectangle.
+
+        Parameters:
+        - x0, y0, x1, y1: rectangle corners in image pixels (any order)
+        - fully_inside: only return words whose bounds lie entirely inside the rectangle
+
+        Returns:
+        - sorted NumPy array of word indices
+        """
+        x_min, x_max = min(x0, x1), max(x0, x1)
+        y_min, y_max = min(y0, y1), max(y0, y1)
+        candidates = self._candidates(x_min, y_min, x_max, y_max)
+        if len(candidates) == 0:
+            return candidates
+
+        b = self.bounds[candidates]
+        if fully_inside:
+            mask = (b[:, 0] >= x_min) & (b[:, 2] <= x_max) & (b[:, 1] >= y_min) & (b[:, 3] <= y_max)
+        else:
+            mask = (b[:, 0] <= x_max) & (b[:, 2] >= x_min) & (b[:, 1] <= y_max) & (b[:, 3] >= y_min)
+        return candidates[mask]
@@ -10,3 +10,5 @@ from .insert_row_handler import InsertRowHandler
 from .insert_col_handler import InsertColHandler
 from .mode_manager_handler import ModeManagerHandler
 from .delete_cell_handler import DeleteCellHandler
+from .auto_layout_handler import AutoLayoutHandler
+from .watch_ocr_handler import WatchOCRHandler
\ No newline at end of file
@@ -0,0 +1,36 @@
+from utilities import LOGGER_NAME
+from table_ui import CanvasLogicHelper
+from table_core.grid_commands import FillGridCommand
+from ocr.table_structure import TableStructureBuilder
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class AutoLayoutHandler:
+    """
+    Fills the table from the structure of the OCR results in one step.
+    """
+    def __init__(self, controller):
+        self.controller = controller
+        self.builder = TableStructureBuilder()
+
+    def auto_layout(self, ocr_results):
+        """
+        Cluster the OCR boxes into rows and columns and write them into the
+        grid, starting at the current cell, as a single undoable command
+        followed by a single table refresh.
+
+        Args:
+            ocr_results: list of (box, text, confidence) from OCR
+        """
+        cells = self.builder.build(ocr_results)
+        if not cells:
+            logger.info("Auto-layout skipped: no OCR results.")
+            return
+
+        command = FillGridCommand(self.controller.state, cells)
+        self.controller.command_manager.execute(command)
+        logger.info(f"Auto-layout filled {len(cells)}x{len(cells[0])} cells at {self.controller.state.current_pos}")
+
+        CanvasLogicHelper.refresh_table(self.controller)
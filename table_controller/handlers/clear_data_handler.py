@@ -19,10 +19,7 @@ class ClearDataHandler:
         Clear all data with user confirmation dialog.
         """  
         # Check if there's any data to clear
-        has_data = any(
-            any(cell.strip() for cell in row) 
-            for row in self.controller.state.grid_data
-        )
+        has_data = self.controller.state.has_data()
         
         if not has_data:
             logger.info("No data to clear - grid is already empty")
@@ -49,10 +46,7 @@ class ClearDataHandler:
             logger.info("Clearing all data from the grid")
             
             # Check if there's any data to clear
-            has_data = any(
-                any(cell.strip() for cell in row) 
-                for row in self.controller.state.grid_data
-            )
+            has_data = self.controller.state.has_data()
             
             if not has_data:
                 logger.info("No data to clear - grid is already empty")
@@ -62,6 +56,6 @@ class ClearDataHandler:
             command = ClearDataCommand(self.controller.state)
             self.controller.command_manager.execute(command)
             
-            # Rebuild the UI to reflect the changes
-            CanvasLogicHelper.rebuild_table(self.controller)
-            logger.debug("Canvas rebuilt after clearing data.")
\ No newline at end of file
+            # The cleared cells were emptied on the canvas; refresh the highlighting
+            CanvasLogicHelper.refresh_table(self.controller)
+            logger.debug("Canvas refreshed after clearing data.")
\ No newline at end of file
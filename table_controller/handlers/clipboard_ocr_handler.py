@@ -1,11 +1,8 @@
 from utilities import LOGGER_NAME
-from .handler_utils.clipboard_helper import get_image_from_clipboard
-from app.ocr_processor_manager import OCRProcessorManager
 
 import logging
 import tkinter as tk
 from tkinter import messagebox
-from types import SimpleNamespace
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -20,11 +17,14 @@ class ClipboardOCRHandler:
         logger.info("ClipboardOCRHandler initialized.")
 
     def _setup(self):
+        # Pillow and the OCR stack load on first use, not at application start
+        from .handler_utils.clipboard_helper import get_image_from_clipboard
+
         try:
             # Get image from clipboard
-            path = get_image_from_clipboard()
+            image = get_image_from_clipboard()
             
-            if path is None:
+            if image is None:
                 messagebox.showwarning(
                     "No Image", 
                     "No image found in clipboard. Please copy an image first."
@@ -32,7 +32,7 @@ class ClipboardOCRHandler:
                 logger.warning("No image found in clipboard")
                 return False
             
-            self.path = path
+            self.image = image
             return True
         except Exception as e:
             logger.exception(f"Failed to get image from clipboard: {e}")
@@ -47,15 +47,13 @@ class ClipboardOCRHandler:
         
         logger.info("Starting clipboard OCR process...")
         
-        args = SimpleNamespace(
-            image_path=self.path,
-            scale_percent=150,  # Adjustable scaling
-            lang="en"           # Language for OCR
-        )
+        args = self.controller.capture_ocr_args(self.image, "Clipboard image")
+
+        from app.ocr_processor_manager import OCRProcessorManager
 
         try:
             self.processor = OCRProcessorManager(args, self.controller)
-            logger.info("OCRProcessorManager initialized and image passed for display.")
-            self.processor.image.show()
+            logger.info("OCRProcessorManager initialized; recognition running in the background.")
+            self.processor.show()
         except Exception as e:
             logger.exception(f"OCR processing failed: {e}")
\ No newline at end of file
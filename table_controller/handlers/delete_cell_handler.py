@@ -2,7 +2,6 @@ from utilities import LOGGER_NAME
 from table_core.grid_commands import EditCellCommand
 
 import logging
-import tkinter as tk
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -17,15 +16,6 @@ class DeleteCellHandler:
             
         # Create command to clear cell
         command = EditCellCommand(self.controller.state, row, col, "")
-        self.controller.command_manager.execute(command)
-        
-        # Update the UI entry
-        if (row < len(self.controller.canvas_table.entries) and 
-            col < len(self.controller.canvas_table.entries[row])):
-            entry = self.controller.canvas_table.entries[row][col]
-            # Temporarily enable to clear content
-            entry.config(state="normal")
-            entry.delete(0, tk.END)
-            entry.config(state="readonly")  # Back to readonly
+        self.controller.command_manager.execute(command)   # The canvas clears the entry on notification
         
         logger.info(f"Cell ({row}, {col}) content cleared")
\ No newline at end of file
@@ -1 +1 @@
-from .take_screenshot import ScreenshotTaker
\ No newline at end of file
+from .take_screenshot import ScreenshotTaker, grab_region
\ No newline at end of file
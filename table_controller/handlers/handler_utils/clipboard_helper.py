@@ -1,25 +1,26 @@
-from utilities import generate_unique_filename, LOGGER_NAME
-from PIL import ImageGrab
+from utilities import LOGGER_NAME
+from PIL import Image, ImageGrab
 import logging
+import numpy as np
 
 logger = logging.getLogger(LOGGER_NAME)
 
 def get_image_from_clipboard():
     """
     Get image from clipboard (cross-platform).
-    Returns the file path of the saved image, or None if no image found.
+    Returns the image as a BGR NumPy array, or None if no image found.
     """
     try:
         img = ImageGrab.grabclipboard()
-        if img is not None:
-            file_path = generate_unique_filename()
-            img.save(file_path, "PNG")
-            logger.info(f"Clipboard image saved: {file_path}")
-            return file_path
+        if isinstance(img, Image.Image):
+            # Swap to OpenCV channel order inside PIL; no PNG encode/decode or temp file
+            rgb = img.convert("RGB")
+            bgr = Image.merge("RGB", rgb.split()[::-1])
+            logger.info(f"Clipboard image read into memory ({img.width}x{img.height})")
+            return np.asarray(bgr)
         else:
             logger.warning("No image found in clipboard")
             return None
     except Exception as e:
         logger.error(f"Failed to get clipboard image: {e}")
         return None
-
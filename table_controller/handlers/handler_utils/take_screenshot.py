@@ -1,23 +1,41 @@
 from .screenshot_helper import get_virtual_screen_bbox
-from utilities import LOGGER_NAME, generate_unique_filename
+from utilities import LOGGER_NAME
 
 from tkinter import Tk, Toplevel, Canvas, Label, BOTH
-from PIL import Image, ImageGrab
 import logging
 import sys
 import mss
+import numpy as np
 
 logger = logging.getLogger(LOGGER_NAME)
 
 
+def grab_region(region):
+    """
+    Capture a screen region straight into memory.
+
+    Parameters:
+    - region: mss monitor dict with left, top, width and height
+
+    Returns:
+    - BGRA NumPy array; a zero-copy view over mss' buffer, no PIL conversion or PNG file
+    """
+    with mss.mss() as sct:
+        sct_img = sct.grab(region)
+    return np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(sct_img.height, sct_img.width, 4)
+
+
 class SnipTool(Toplevel):
-    def __init__(self, master, on_snip_done_callback):
+    def __init__(self, master, on_snip_done_callback, on_region_selected=None):
         """
         A fullscreen overlay window that lets the user select a rectangular region
-        on the screen to capture as an image.
+        on the screen to capture as an image. The callback receives the capture
+        as a BGRA NumPy array; the optional on_region_selected callback receives
+        the selected region as an mss monitor dict before that.
         """
         super().__init__(master)
         self.on_snip_done_callback = on_snip_done_callback
+        self.on_region_selected = on_region_selected
 
         self.vx, self.vy, self.vw, self.vh = get_virtual_screen_bbox()
         self.geometry(f"{self.vw}x{self.vh}+{self.vx}+{self.vy}")
@@ -105,17 +123,15 @@ class SnipTool(Toplevel):
         y2 = int(max(self.start_y, self.end_y)) + self.vy
         logger.debug(f"Selection completed: ({x1}, {y1}) to ({x2}, {y2})")
 
-        # Capture and save the screenshot
+        # Capture the screenshot straight into memory
         if x2 > x1 and y2 > y1:
             try:
-                with mss.mss() as sct:
-                    monitor = {"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1}
-                    sct_img = sct.grab(monitor)
-                    img = Image.frombytes("RGB", sct_img.size, sct_img.rgb)
-                    file_path = generate_unique_filename()
-                    img.save(file_path)
-                    logger.info(f"Screenshot saved to {file_path}")
-                    self.on_snip_done_callback(file_path)
+                monitor = {"left": x1, "top": y1, "width": x2 - x1, "height": y2 - y1}
+                if self.on_region_selected is not None:
+                    self.on_region_selected(monitor)
+                image = grab_region(monitor)
+                logger.info(f"Screenshot captured in memory ({image.shape[1]}x{image.shape[0]})")
+                self.on_snip_done_callback(image)
             except Exception as e:
                 logger.error(f"Failed to capture screenshot: {e}")
         else:
@@ -136,7 +152,7 @@ class SnipTool(Toplevel):
 
 
 class ScreenshotTaker:
-    def __init__(self, on_snip_done_callback):
+    def __init__(self, on_snip_done_callback, on_region_selected=None):
         """
         Orchestrates launching the snipping tool and handling the captured result.
         """
@@ -144,9 +160,10 @@ class ScreenshotTaker:
         root.withdraw()
         self.root = root
         self.on_snip_done_callback = on_snip_done_callback
+        self.on_region_selected = on_region_selected
         logger.info("ScreenshotTaker initialized.")
 
     def start(self):
         """Launches the SnipTool window."""
         logger.info("Launching SnipTool for region selection.")
-        SnipTool(self.root, self.on_snip_done_callback)
+        SnipTool(self.root, self.on_snip_done_callback, self.on_region_selected)
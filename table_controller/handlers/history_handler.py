@@ -18,7 +18,7 @@ class HistoryHandler:
         """
         logger.info("Undo triggered.")
         self.controller.command_manager.undo()
-        CanvasLogicHelper.rebuild_table(self.controller)
+        CanvasLogicHelper.refresh_table(self.controller)
 
     def redo(self):
         """
@@ -26,4 +26,4 @@ class HistoryHandler:
         """
         logger.info("Redo triggered.")
         self.controller.command_manager.redo()
-        CanvasLogicHelper.rebuild_table(self.controller)
+        CanvasLogicHelper.refresh_table(self.controller)
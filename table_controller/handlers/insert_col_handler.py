@@ -31,9 +31,9 @@ class InsertColHandler:
         command = InsertColumnCommand(self.controller.state, col_index)
         self.controller.command_manager.execute(command)
         
-        # Rebuild the UI to reflect the changes
-        CanvasLogicHelper.rebuild_table(self.controller)
-        logger.debug("Canvas rebuilt after column insertion.")
+        # The canvas already shifted the cell texts; refresh the highlighting
+        CanvasLogicHelper.refresh_table(self.controller)
+        logger.debug("Canvas refreshed after column insertion.")
 
     def insert_col_after_current(self):
         """
@@ -31,9 +31,9 @@ class InsertRowHandler:
         command = InsertRowCommand(self.controller.state, row_index)
         self.controller.command_manager.execute(command)
         
-        # Rebuild the UI to reflect the changes
-        CanvasLogicHelper.rebuild_table(self.controller)
-        logger.debug("Canvas rebuilt after row insertion.")
+        # The canvas already shifted the cell texts; refresh the highlighting
+        CanvasLogicHelper.refresh_table(self.controller)
+        logger.debug("Canvas refreshed after row insertion.")
 
     def insert_row_after_current(self):
         """
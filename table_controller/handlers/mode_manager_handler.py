@@ -25,9 +25,8 @@ class ModeManagerHandler:
         self.controller.canvas_table.highlight_active_cell()
         
         # Set focus and cursor position
-        if (row < len(self.controller.canvas_table.entries) and 
-            col < len(self.controller.canvas_table.entries[row])):
-            entry = self.controller.canvas_table.entries[row][col]
+        entry = self.controller.canvas_table.entry_at(row, col)
+        if entry is not None:
             entry.focus_set()  # Set focus
             entry.icursor(tk.END)  # Position cursor at end
         
@@ -44,9 +43,8 @@ class ModeManagerHandler:
         logger.debug(f"Exiting edit mode for cell ({row}, {col})")
         
         # Save any changes before exiting
-        if (row < len(self.controller.canvas_table.entries) and 
-            col < len(self.controller.canvas_table.entries[row])):
-            entry = self.controller.canvas_table.entries[row][col]
+        entry = self.controller.canvas_table.entry_at(row, col)
+        if entry is not None:
             new_value = entry.get()
             old_value = self.controller.state.get_cell(row, col)
             
@@ -21,10 +21,11 @@ class NavigationHandler:
             r, c = GridLogicHelper.next_cell_position(self.controller.state, self.controller.nav)
             logger.debug(f"Computed next position from Tab: ({r}, {c})")
 
-            # If new position exceeds grid size, expand and rebuild UI
-            if GridLogicHelper.expand_if_needed(self.controller.state, r, c, self.controller.command_manager):
-                logger.info(f"Grid expanded due to Tab key at position ({r}, {c})")
-                CanvasLogicHelper.rebuild_table(self.controller)
+            # If new position exceeds grid size, expand (the canvas adds the new cells).
+            # A new row and column together are one undo step.
+            with self.controller.command_manager.transaction("tab_expand"):
+                if GridLogicHelper.expand_if_needed(self.controller.state, r, c, self.controller.command_manager):
+                    logger.info(f"Grid expanded due to Tab key at position ({r}, {c})")
 
             CanvasLogicHelper.move_cursor_and_focus(self.controller.state, self.controller.nav, self.controller)
             logger.debug(f"Tab navigation complete. Current position: {self.controller.state.current_pos}")
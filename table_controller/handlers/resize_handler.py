@@ -21,5 +21,5 @@ class ResizeHandler:
         logger.info(f"Applying resize: rows={new_rows}, cols={new_cols}")        
         if new_rows and new_cols:
             self.controller.command_manager.execute(ResizeGridCommand(self.controller.state, new_rows, new_cols))
-            CanvasLogicHelper.rebuild_table(self.controller)
-            logger.debug("Canvas rebuilt after resize.")
\ No newline at end of file
+            CanvasLogicHelper.refresh_table(self.controller)
+            logger.debug("Canvas refreshed after resize.")
\ No newline at end of file
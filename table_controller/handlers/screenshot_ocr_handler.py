@@ -1,10 +1,6 @@
 from utilities import LOGGER_NAME
-from .handler_utils import ScreenshotTaker
-from app.ocr_processor_manager import OCRProcessorManager
 
 import logging
-from types import SimpleNamespace
-import os
 
 logger = logging.getLogger(LOGGER_NAME)
 
@@ -38,32 +34,33 @@ class ScreenshotOCRHandler:
         Prepares and starts the screenshot region selector tool.
         When done, it will trigger `_on_screenshot_ready`.
         """
+        # mss and Pillow load on first use, not at application start
+        from .handler_utils import ScreenshotTaker
+
         self.taker = ScreenshotTaker(self._on_screenshot_ready)
         self.taker.start()
 
-    def _on_screenshot_ready(self, path):
+    def _on_screenshot_ready(self, image):
         """
         Callback executed after screenshot is taken.
-        Validates the file and passes it to the OCR processor.
+        Validates the capture and passes it to the OCR processor.
         
         Args:
-            path: File path of the saved screenshot
+            image: BGRA NumPy array of the captured region
         """
-        if not path or not os.path.exists(path):
-            logger.error(f"Screenshot path invalid or file not found: {path}")
+        if image is None or image.size == 0:
+            logger.error("Screenshot capture is empty.")
             return
 
-        logger.info(f"Screenshot successfully captured at: {path}")
+        logger.info(f"Screenshot successfully captured: {image.shape[1]}x{image.shape[0]}")
+
+        args = self.controller.capture_ocr_args(image, "Screenshot")
 
-        args = SimpleNamespace(
-            image_path=path,
-            scale_percent=150,  # Adjustable scaling
-            lang="en"           # Language for OCR
-        )
+        from app.ocr_processor_manager import OCRProcessorManager
 
         try:
             self.processor = OCRProcessorManager(args, self.controller)
-            logger.info("OCRProcessorManager initialized and image passed for display.")
-            self.processor.image.show()
+            logger.info("OCRProcessorManager initialized; recognition running in the background.")
+            self.processor.show()
         except Exception as e:
             logger.exception(f"OCR processing failed: {e}")
@@ -0,0 +1,196 @@
+from utilities import LOGGER_NAME, OCR_WATCH_INTERVAL_MS, OCR_WATCH_THRESHOLD, OCR_MIN_CONFIDENCE, OCR_NMS_IOU
+from table_ui import CanvasLogicHelper
+from table_core.grid_commands import FillGridCommand
+
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class WatchOCRHandler:
+    """
+    Watch mode: a screen region selected once is captured again on an
+    interval, and whatever changed in it is appended to the table as new rows.
+
+    Every capture is compared with the previous one by a FrameChangeDetector.
+    Unchanged frames end right there. Changed frames have only their changed
+    horizontal bands preprocessed and recognized. Capture, comparison and
+    OCR run on the OCR executor; the next capture is scheduled only after
+    the previous one has been handled, so slow OCR never piles up.
+    """
+    SCALE_PERCENT = 150
+
+    def __init__(self, controller):
+        """
+        Initialize with a reference to the main table controller.
+
+        Args:
+            controller: An instance of TableGridController
+        """
+        self.controller = controller
+        self.interval_ms = OCR_WATCH_INTERVAL_MS
+        self.threshold = OCR_WATCH_THRESHOLD
+        self.language = "en"
+        self.region = None              # mss monitor dict of the watched area
+        self._pending_region = None     # Region reported by the snipping tool, before its first frame
+        self.detector = None
+        self.task = None                # OCRTask of the capture in flight
+        self.next_row = 0               # Grid row that receives the next recognized row
+        self.rows_logged = 0
+        self._after_id = None
+        logger.info("WatchOCRHandler initialized.")
+
+    @property
+    def watching(self):
+        return self.region is not None
+
+    def configure(self, interval_ms=None, threshold=None):
+        """
+        Args:
+            interval_ms (int): Milliseconds between two captures
+            threshold (float): Mean grey-level difference that counts as a change
+        """
+        if interval_ms is not None:
+            self.interval_ms = max(int(interval_ms), 100)
+        if threshold is not None:
+            self.threshold = float(threshold)
+
+    def toggle_watch(self):
+        """
+        Start watching a newly selected region, or stop the running watch.
+        """
+        if self.watching:
+            self.stop_watch()
+        else:
+            self.start_watch()
+
+    def start_watch(self):
+        """
+        Let the user select the region to watch with the snipping tool.
+        """
+        # mss and the OCR stack load on first use, not at application start
+        from .handler_utils import ScreenshotTaker
+
+        logger.info("Select the screen region to watch...")
+        self.taker = ScreenshotTaker(self._on_first_frame, on_region_selected=self._on_region_selected)
+        self.taker.start()
+
+    def stop_watch(self):
+        """
+        Stop capturing; a recognition that is still running is discarded.
+        """
+        if self._after_id is not None:
+            self.controller.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+        self.region = None
+        self.controller.nav_bar.set_watching(False)
+        self._set_status(f"Watch stopped; {self.rows_logged} row(s) logged", busy=False)
+        logger.info(f"Watch mode stopped after {self.rows_logged} row(s).")
+
+    def _on_region_selected(self, region):
+        self._pending_region = region
+
+    def _on_first_frame(self, image):
+        """
+        Snipping finished: remember the region and process the snip as the first frame.
+        """
+        from ocr import FrameChangeDetector
+
+        region, self._pending_region = self._pending_region, None
+        if region is None or image is None or image.size == 0:
+            logger.error("Watch mode needs a non-empty screen region.")
+            return
+
+        self.region = region
+        self.detector = FrameChangeDetector(threshold=self.threshold)
+        self.next_row = self._first_empty_row()
+        self.rows_logged = 0
+        self.controller.nav_bar.set_watching(True)
+        logger.info(f"Watching region {region} every {self.interval_ms} ms, appending from row {self.next_row}")
+        self._submit(image)
+
+    def _first_empty_row(self):
+        """
+        Row below the last row that holds any value, so watching never overwrites data.
+        """
+        return max((r for r, _, _ in self.controller.state.non_empty_cells()), default=-1) + 1
+
+    def _tick(self):
+        self._after_id = None
+        if self.watching:
+            self._submit(None)
+
+    def _submit(self, frame):
+        from ocr import OCRResultFilter, TableStructureBuilder
+
+        # Same OCR options as screenshot and clipboard OCR, taken from the command line
+        args = self.controller.capture_ocr_args(None, "Watch region")
+        result_filter = OCRResultFilter(getattr(args, "min_confidence", OCR_MIN_CONFIDENCE),
+                                        getattr(args, "nms_iou", OCR_NMS_IOU))
+
+        self._set_status(f"Watching {self.region['width']}x{self.region['height']} region; "
+                         f"{self.rows_logged} row(s) logged", busy=True)
+        self.task = self.controller.ocr_executor.submit(
+            self._capture_and_read, self.region, frame, self.detector, self.language,
+            result_filter, TableStructureBuilder(),
+            on_result=self._on_rows,
+            on_error=self._on_failed
+        )
+
+    @classmethod
+    def _capture_and_read(cls, task, region, frame, detector, language, result_filter, builder):
+        """
+        Worker-thread part: grab the region (unless a frame is given), find the
+        changed bands and recognize only those.
+
+        Returns:
+            list[list[str]]: New table rows, top to bottom ([] when nothing changed)
+        """
+        from ocr import OCRImageProcessor, shared_reader_pool
+        from .handler_utils import grab_region
+
+        if frame is None:
+            frame = grab_region(region)
+        bands = detector.changed_bands(frame)
+        if not bands:
+            return []
+
+        reader = shared_reader_pool.get_reader(language=language)
+        rows = []
+        for y0, y1 in bands:
+            if task.cancelled:
+                return None
+            processor = OCRImageProcessor(image=frame[y0:y1], scale_percent=cls.SCALE_PERCENT)
+            ocr_results = result_filter.apply(reader.read(processor.gray_enhanced))
+            rows.extend(row for row in builder.build(ocr_results) if any(row))
+        logger.info(f"Watch frame: {len(bands)} changed band(s), {len(rows)} row(s) recognized")
+        return rows
+
+    def _on_rows(self, rows):
+        """
+        Called on the Tk thread: append the recognized rows and schedule the next capture.
+        """
+        self.task = None
+        if not self.watching:
+            return
+        if rows:
+            command = FillGridCommand(self.controller.state, rows, origin=(self.next_row, 0))
+            self.controller.command_manager.execute(command)
+            self.next_row += len(rows)
+            self.rows_logged += len(rows)
+            CanvasLogicHelper.refresh_table(self.controller)
+        self._set_status(f"Watching {self.region['width']}x{self.region['height']} region; "
+                         f"{self.rows_logged} row(s) logged", busy=False)
+        self._after_id = self.controller.root.after(self.interval_ms, self._tick)
+
+    def _on_failed(self, error):
+        logger.error(f"Watch capture failed: {error}")
+        self.task = None
+        self.stop_watch()
+        self._set_status(f"Watch stopped: {error}", busy=False)
+
+    def _set_status(self, message, busy):
+        if self.controller.status_bar is not None:
+            self.controller.status_bar.set_status(message, busy=busy)
@@ -1,9 +1,8 @@
 from utilities import LOGGER_NAME
-from table_core import GridLogicHelper, GridStateManager
+from table_core import GridLogicHelper
 from table_ui import CanvasLogicHelper
-from table_core.grid_commands import InsertWordCommand
+from table_core.grid_commands import InsertWordCommand, InsertWordsCommand
 
-import tkinter as tk
 import logging
 
 logger = logging.getLogger(LOGGER_NAME)
@@ -22,37 +21,35 @@ class WordInserterHandler:
         updating the grid state, expanding the grid if needed,
         and moving the cursor to the next cell.
         """        
-        # Use WordInserter to insert the word and get the new position
-        command = InsertWordCommand(self.controller.state, self.controller.nav, word)
-        self.controller.command_manager.execute(command)
+        # The word and any row/column it makes the grid grow by are one undo step;
+        # the canvas follows the grid changes, so nothing has to be rebuilt
+        with self.controller.command_manager.transaction("insert_word"):
+            # Use WordInserter to insert the word and get the new position
+            command = InsertWordCommand(self.controller.state, self.controller.nav, word)
+            self.controller.command_manager.execute(command)
+
+            r, c, new_text = command.result
+            logger.info(f"Inserted word '{word}' at ({r}, {c}). New text: '{new_text}'")
 
-        r, c, new_text = command.result
-        logger.info(f"Inserted word '{word}' at ({r}, {c}). New text: '{new_text}'")
- 
-        # If new position exceeds grid size, expand and rebuild UI
-        if GridLogicHelper.expand_if_needed(self.controller.state, r, c, self.controller.command_manager):
-            logger.info(f"Grid expanded due to Tab key at position ({r}, {c})")
-            CanvasLogicHelper.rebuild_table(self.controller)
-
-        # Update the UI for the edited cell - FIXED: Handle readonly state
-        if (r < len(self.controller.canvas_table.entries) and 
-            c < len(self.controller.canvas_table.entries[r])):
-            entry = self.controller.canvas_table.entries[r][c]
-            
-            # Get current state and temporarily enable for editing
-            current_state = entry['state']
-            entry.config(state='normal')
-            
-            # Update the content
-            entry.delete(0, tk.END)
-            entry.insert(0, new_text)
-            
-            # Restore the original state
-            entry.config(state=current_state)
-            
-            logger.debug(f"UI cell ({r}, {c}) updated with text '{new_text}'")
-        else:
-            logger.warning(f"Cannot update UI cell ({r}, {c}) - out of bounds")
+            # If new position exceeds grid size, expand
+            if GridLogicHelper.expand_if_needed(self.controller.state, r, c, self.controller.command_manager):
+                logger.info(f"Grid expanded due to word insertion at position ({r}, {c})")
 
         CanvasLogicHelper.move_cursor_and_focus(self.controller.state, self.controller.nav, self.controller)
-        logger.debug(f"Cursor moved to new cell: {self.controller.state.current_pos}")
\ No newline at end of file
+        logger.debug(f"Cursor moved to new cell: {self.controller.state.current_pos}")
+
+    def insert_words(self, words):
+        """
+        Inserts several words (e.g. a rubber-band selection) as one undoable
+        command. Cells are filled and the cursor advances exactly as with
+        single insertions, but the highlighting is refreshed only once at the end.
+        """
+        if not words:
+            return
+        command = InsertWordsCommand(self.controller.state, self.controller.nav, words)
+        self.controller.command_manager.execute(command)
+        logger.info(f"Inserted {len(words)} words into {len(command.result)} cell(s); cursor at {self.controller.state.current_pos}")
+
+        r, c = self.controller.state.current_pos
+        self.controller.canvas_table.highlight_active_cell()
+        self.controller.canvas_table.focus_cell(r, c)
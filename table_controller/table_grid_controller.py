@@ -2,13 +2,18 @@ from utilities import BG_COLOR, LOGGER_NAME
 from table_ui import TableUIBuilder
 from .table_interaction_coordinator import TableInteractionCoordinator
 
+from types import SimpleNamespace
 import logging
 
 logger = logging.getLogger(LOGGER_NAME)
 
 # === TableGridController: Wires together all table UI components and behaviors ===
 class TableGridController:
-    def __init__(self, window_manager, state, command_manager, nav, exporter, nav_bar, lower_controls, canvas_table):
+    # Command-line OCR options that also apply to screenshot and clipboard OCR
+    CAPTURE_OCR_OPTIONS = ("detect_first", "min_confidence", "nms_iou", "viewer",
+                           "tiled", "tile_size", "tile_overlap", "ocr_workers")
+
+    def __init__(self, window_manager, state, command_manager, nav, exporter, nav_bar, lower_controls, canvas_table, status_bar=None, ocr_executor=None):
         """
         Initialize the table controller with all required components.
 
@@ -20,6 +25,8 @@ class TableGridController:
         - nav_bar: NavigationBar (direction buttons)
         - lower_controls: LowerControls (row/col adjustment)
         - canvas_table: TableCanvas (grid rendering)
+        - status_bar: StatusBar (background activity indicator)
+        - ocr_executor: OCRTaskExecutor (runs OCR off the Tk thread)
         """
         self.window_manager = window_manager
         self.state = state
@@ -29,6 +36,9 @@ class TableGridController:
         self.canvas_table = canvas_table
         self.nav_bar = nav_bar
         self.lower_controls = lower_controls
+        self.status_bar = status_bar
+        self.ocr_executor = ocr_executor
+        self.cli_args = None               # Parsed command line, see configure_ocr()
 
         self.callbacks = {
             "select_cell": self.select_cell,
@@ -52,7 +62,8 @@ class TableGridController:
             "redo": self.redo,
             "export": self.export,
             "screenshot_ocr": self.take_screenshot_and_ocr,
-            "clipboard_ocr": self.handle_clipboard_ocr
+            "clipboard_ocr": self.handle_clipboard_ocr,
+            "watch_ocr": self.toggle_watch
         }
 
         self.root = window_manager.root
@@ -86,6 +97,12 @@ class TableGridController:
     def insert_word(self, word):
         self.handler.word_inserter_handler.insert_word(word)
 
+    def insert_words(self, words):
+        self.handler.word_inserter_handler.insert_words(words)
+
+    def auto_layout(self, ocr_results):
+        self.handler.auto_layout_handler.auto_layout(ocr_results)
+
     def handle_tab(self):
         return self.handler.nav_handler.handle_tab()
     
@@ -110,6 +127,35 @@ class TableGridController:
     def handle_clipboard_ocr(self):
         self.handler.clipboard_ocr_handler.run_ocr_from_clipboard()
 
+    def toggle_watch(self):
+        self.handler.watch_ocr_handler.toggle_watch()
+
+    def configure_watch(self, interval_ms=None, threshold=None):
+        self.handler.watch_ocr_handler.configure(interval_ms, threshold)
+
+    def configure_ocr(self, cli_args):
+        """
+        Remember the parsed command line so its OCR options also apply to captures.
+        """
+        self.cli_args = cli_args
+
+    def capture_ocr_args(self, image, source_name):
+        """
+        Arguments for an OCRProcessorManager run on a captured image (screenshot
+        or clipboard), carrying over the OCR options given on the command line.
+        """
+        args = SimpleNamespace(
+            image_path=None,
+            image=image,
+            source_name=source_name,
+            scale_percent=150,  # Adjustable scaling
+            lang="en"           # Language for OCR
+        )
+        for name in self.CAPTURE_OCR_OPTIONS:
+            if hasattr(self.cli_args, name):
+                setattr(args, name, getattr(self.cli_args, name))
+        return args
+
     def insert_row(self):
         self.handler.insert_row_handler.insert_row_before_current()
 
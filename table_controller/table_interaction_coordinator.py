@@ -11,7 +11,9 @@ from .handlers import (
         InsertRowHandler,
         InsertColHandler,
         ModeManagerHandler,
-        DeleteCellHandler
+        DeleteCellHandler,
+        AutoLayoutHandler,
+        WatchOCRHandler
 )
 
 import logging
@@ -34,6 +36,8 @@ class TableInteractionCoordinator:
         self.insert_col_handler = InsertColHandler(controller)
         self.mode_manager_handler = ModeManagerHandler(controller)
         self.delete_cell_handler = DeleteCellHandler(controller)
+        self.auto_layout_handler = AutoLayoutHandler(controller)
+        self.watch_ocr_handler = WatchOCRHandler(controller)
 
 
  
\ No newline at end of file
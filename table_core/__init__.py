@@ -1,4 +1,6 @@
-from .grid_state import GridStateManager
+from .grid_state import GridStateManager, GridChange
 from .navigation import NavigationController
 from .table_core_utils.grid_helper import GridLogicHelper
-from .command_manager import GridCommandManager
\ No newline at end of file
+from .command_manager import GridCommandManager
+from .grid_store import GridStore, ListGridStore, ArrayGridStore, SparseGridStore, create_grid_store
+from .undo_history import UndoHistory
\ No newline at end of file
@@ -1,25 +1,125 @@
+from .grid_commands import CompositeCommand
+from .undo_history import UndoHistory
+from utilities import LOGGER_NAME, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW
+
+from contextlib import contextmanager
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
 class GridCommandManager:
     """
     A class to manage commands in the application.
     It handles the execution and undoing of commands.
+
+    Commands executed between begin() and commit() (or inside a
+    `with transaction():` block) are grouped into one CompositeCommand, so
+    the whole user action is a single undo/redo step. Work registered with
+    defer() while a transaction is open - typically the table rebuild - runs
+    once, after the outermost commit.
+
+    The undo stack is an UndoHistory with a memory budget: beyond it the
+    oldest commands are spilled to a temp file (or dropped) and paged back
+    in when undo reaches them.
     """
 
-    def __init__(self):
+    def __init__(self, undo_budget_mb=UNDO_MEMORY_BUDGET_MB, undo_overflow=UNDO_OVERFLOW):
         # Stack to keep track of executed commands for undo
-        self.undo_stack = []
+        self.undo_stack = UndoHistory(undo_budget_mb, undo_overflow)
         # Stack to keep track of undone commands for redo
         self.redo_stack = []
+        # Open transaction: CompositeCommand collecting commands, nesting depth and deferred callbacks
+        self._transaction = None
+        self._depth = 0
+        self._deferred = {}
+
+    @property
+    def in_transaction(self):
+        return self._transaction is not None
 
     def execute(self, command):
-        # Execute the command and store it in the undo stack
+        # Execute the command and store it in the undo stack (or in the open transaction)
         command.execute()
+        if self._transaction is not None:
+            self._transaction.add(command)
+            return
         self.undo_stack.append(command)
         # Clear the redo stack since new action invalidates redo history
         self.redo_stack.clear()
 
+    def begin(self, label="transaction"):
+        """
+        Open a transaction; nested begin() calls join the outermost one.
+        """
+        if self._transaction is None:
+            self._transaction = CompositeCommand(label)
+        self._depth += 1
+
+    def commit(self):
+        """
+        Close the transaction. The outermost commit pushes the grouped commands
+        as one undo step and then runs the deferred callbacks.
+        """
+        if self._transaction is None:
+            logger.warning("commit() called without an open transaction.")
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+
+        composite, self._transaction = self._transaction, None
+        if len(composite) == 1:
+            self.undo_stack.append(composite.commands[0])
+        elif composite.commands:
+            self.undo_stack.append(composite)
+        if composite.commands:
+            self.redo_stack.clear()
+            logger.debug(f"Committed '{composite.label}' with {len(composite)} command(s)")
+        self._run_deferred()
+
+    def rollback(self):
+        """
+        Abandon the whole transaction: undo what it executed and drop the deferred callbacks.
+        """
+        if self._transaction is None:
+            return
+        composite, self._transaction = self._transaction, None
+        self._depth = 0
+        self._deferred.clear()
+        composite.undo()
+        logger.info(f"Rolled back '{composite.label}' ({len(composite)} command(s))")
+
+    @contextmanager
+    def transaction(self, label="transaction"):
+        """
+        Group the commands executed in the block into one undo step; rolls back on error.
+        """
+        self.begin(label)
+        try:
+            yield self
+        except Exception:
+            self.rollback()
+            raise
+        self.commit()
+
+    def defer(self, key, callback):
+        """
+        Run callback after the outermost commit, or right away when no transaction
+        is open. Callbacks with the same key run only once per transaction.
+        """
+        if self._transaction is None:
+            callback()
+        else:
+            self._deferred[key] = callback
+
+    def _run_deferred(self):
+        deferred, self._deferred = self._deferred, {}
+        for callback in deferred.values():
+            callback()
+
     def undo(self):
         # If nothing to undo, return early
-        if not self.undo_stack:
+        if not self.undo_stack or self.in_transaction:
             return
         # Pop the last executed command and undo it
         command = self.undo_stack.pop()
@@ -29,7 +129,7 @@ class GridCommandManager:
 
     def redo(self):
         # If nothing to redo, return early
-        if not self.redo_stack:
+        if not self.redo_stack or self.in_transaction:
             return
         # Pop the last undone command and re-execute it
         command = self.redo_stack.pop()
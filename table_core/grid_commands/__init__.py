@@ -6,4 +6,7 @@ from .resize_command import ResizeGridCommand
 from .word_insert_command import InsertWordCommand
 from .insert_row_command import InsertRowCommand
 from .insert_column_command import InsertColumnCommand
-from .clear_data_command import ClearDataCommand
\ No newline at end of file
+from .clear_data_command import ClearDataCommand
+from .fill_grid_command import FillGridCommand
+from .insert_words_command import InsertWordsCommand
+from .composite_command import CompositeCommand
\ No newline at end of file
@@ -21,10 +21,7 @@ class AddColumnCommand(Command):
         logger.info("Executing AddColumnCommand...")
         self.added_col_index = self.grid_state.cols  # Track where column is added
 
-        for row in self.grid_state.grid_data:
-            row.append('')                           # Add empty cell to each row
-
-        self.grid_state.cols += 1                    # Update total column count
+        self.grid_state.insert_col(self.added_col_index)  # Add empty cell to each row
         logger.info(f"Column added at index {self.added_col_index}")
 
     def undo(self):
@@ -37,10 +34,5 @@ class AddColumnCommand(Command):
             return
 
         # Store the content of the column being removed for potential redo
-        self.removed_cells = [row[-1] for row in self.grid_state.grid_data]
-
-        for row in self.grid_state.grid_data:
-            row.pop()                                # Remove the last column from each row
-
-        self.grid_state.cols -= 1                    # Decrease column count
+        self.removed_cells = self.grid_state.delete_col(self.grid_state.cols - 1)  # Remove the last column
         logger.info(f"Column removed from index {self.added_col_index}")
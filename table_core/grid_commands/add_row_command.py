@@ -22,8 +22,7 @@ class AddRowCommand(Command):
         """
         self.added_row_index = self.grid_state.rows  # Index where the row will be inserted
         self.old_row_data = ['' for _ in range(self.grid_state.cols)]  # Create empty row
-        self.grid_state.grid_data.append(self.old_row_data.copy())     # Append row to grid
-        self.grid_state.rows += 1  # Update row count
+        self.grid_state.insert_row(self.added_row_index)               # Append row to grid
         logger.info("Row added at index %d", self.added_row_index)
 
     def undo(self):
@@ -34,8 +33,7 @@ class AddRowCommand(Command):
             logger.warning("Cannot undo AddRowCommand: no rows to remove.")
             return
 
-        removed_row = self.grid_state.grid_data.pop()  # Remove the last row
-        self.grid_state.rows -= 1                      # Decrease row count
+        removed_row = self.grid_state.delete_row(self.grid_state.rows - 1)  # Remove the last row
         logger.info("Row removed from index %d", self.added_row_index)
 
         # Optional validation: checks whether the row removed matches what was added
@@ -7,11 +7,12 @@ logger = logging.getLogger(LOGGER_NAME)
 class ClearDataCommand(Command):
     """
     Command that clears all data from the grid while preserving structure and supports undo/redo.
+    Undo keeps only the non-empty cells, as a list of (row, col, value) entries.
     """
 
     def __init__(self, grid_state):
         self.grid_state = grid_state                 # Reference to the grid manager
-        self.backup_data = []                        # Stores all cell data for undo
+        self.backup_data = None                      # Non-empty (row, col, value) cells, for undo
 
     def execute(self):
         """
@@ -19,15 +20,11 @@ class ClearDataCommand(Command):
         """
         logger.info("Executing ClearDataCommand...")
         
-        # Store current data for undo
-        self.backup_data = []
-        for row in self.grid_state.grid_data:
-            self.backup_data.append(row[:])  # Create a copy of each row
+        # Store the non-empty cells for undo
+        self.backup_data = list(self.grid_state.non_empty_cells())
         
         # Clear all cells
-        for row in self.grid_state.grid_data:
-            for i in range(len(row)):
-                row[i] = ''
+        self.grid_state.clear()
         
         logger.info("All grid data cleared")
 
@@ -37,15 +34,12 @@ class ClearDataCommand(Command):
         """
         logger.info("Undoing ClearDataCommand...")
         
-        if not self.backup_data:
+        if self.backup_data is None:
             logger.warning("Cannot undo ClearDataCommand: no backup data available.")
             return
         
-        # Restore the backed up data
-        for i, backup_row in enumerate(self.backup_data):
-            if i < len(self.grid_state.grid_data):
-                for j, cell_value in enumerate(backup_row):
-                    if j < len(self.grid_state.grid_data[i]):
-                        self.grid_state.grid_data[i][j] = cell_value
+        # Restore the backed up cells
+        for r, c, value in self.backup_data:
+            self.grid_state.set_cell(r, c, value)
         
-        logger.info("Grid data restored from backup")
\ No newline at end of file
+        logger.info(f"Grid data restored from backup ({len(self.backup_data)} cells)")
\ No newline at end of file
@@ -0,0 +1,47 @@
+from .command import Command
+from utilities import LOGGER_NAME
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class CompositeCommand(Command):
+    """
+    Command made of several commands that form one user action (e.g. a word
+    insertion plus the row and column it made the grid grow by). It is one
+    entry in the undo history: undo reverts the parts in reverse order and
+    redo replays them in order.
+    """
+
+    def __init__(self, label="composite", commands=None):
+        """
+        Args:
+            label (str): Name of the action, for logging
+            commands (list[Command]): Parts of the action, in execution order
+        """
+        self.label = label
+        self.commands = list(commands or [])
+
+    def __len__(self):
+        return len(self.commands)
+
+    def add(self, command):
+        """
+        Append a part that has already been executed.
+        """
+        self.commands.append(command)
+
+    def execute(self):
+        """
+        Execute every part in order.
+        """
+        logger.info(f"Executing CompositeCommand '{self.label}' ({len(self.commands)} parts)")
+        for command in self.commands:
+            command.execute()
+
+    def undo(self):
+        """
+        Undo every part, last one first.
+        """
+        logger.info(f"Undoing CompositeCommand '{self.label}' ({len(self.commands)} parts)")
+        for command in reversed(self.commands):
+            command.undo()
@@ -32,7 +32,7 @@ class EditCellCommand(Command):
             return
 
         # Perform the update
-        self.grid_state.grid_data[self.row][self.col] = self.new_text
+        self.grid_state.set_cell(self.row, self.col, self.new_text)
         self.grid_state.current_pos = (self.row, self.col)
         logger.info(f"Cell ({self.row}, {self.col}) updated from '{self.old_text}' to '{self.new_text}'")
 
@@ -45,7 +45,7 @@ class EditCellCommand(Command):
             return
 
         # Restore previous cell content
-        self.grid_state.grid_data[self.row][self.col] = self.old_text
+        self.grid_state.set_cell(self.row, self.col, self.old_text)
         self.grid_state.current_pos = (self.row, self.col)
         logger.info(f"Cell ({self.row}, {self.col}) restored to '{self.old_text}'")
 
@@ -0,0 +1,69 @@
+from .command import Command
+from .resize_command import ResizeGridCommand
+from utilities import LOGGER_NAME
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class FillGridCommand(Command):
+    """
+    Command that writes a whole block of values into the grid at once.
+    The grid is enlarged if the block does not fit, and the whole fill is
+    undone as a single step.
+    """
+
+    def __init__(self, grid_state, values, origin=None):
+        """
+        Args:
+            grid_state: GridStateManager to fill
+            values (list[list[str]]): Block of cell values, row by row
+            origin (tuple[int, int]): Top-left cell of the block (default: current cursor)
+        """
+        self.grid_state = grid_state
+        self.values = [list(row) for row in values]
+        self.row, self.col = origin if origin is not None else grid_state.current_pos
+
+        height = len(self.values)
+        width = max((len(row) for row in self.values), default=0)
+
+        # Grow the grid through an inner ResizeGridCommand when the block does not fit
+        new_rows = max(grid_state.rows, self.row + height)
+        new_cols = max(grid_state.cols, self.col + width)
+        self.resize_command = (
+            ResizeGridCommand(grid_state, new_rows, new_cols)
+            if (new_rows, new_cols) != (grid_state.rows, grid_state.cols)
+            else None
+        )
+        self.old_values = None                       # Overwritten cells, captured on execute
+
+    def execute(self):
+        """
+        Enlarge the grid if needed and write every value of the block.
+        """
+        logger.info(f"Executing FillGridCommand: {len(self.values)} rows at ({self.row}, {self.col})")
+        if self.resize_command:
+            self.resize_command.execute()
+
+        state = self.grid_state
+        self.old_values = []
+        for dr, row_values in enumerate(self.values):
+            r = self.row + dr
+            self.old_values.append([state.get_cell(r, self.col + dc) for dc in range(len(row_values))])
+            for dc, value in enumerate(row_values):
+                state.set_cell(r, self.col + dc, value)
+
+    def undo(self):
+        """
+        Restore the overwritten cells and the previous grid size.
+        """
+        logger.info(f"Undoing FillGridCommand at ({self.row}, {self.col})")
+        if self.old_values is None:
+            logger.warning("Cannot undo FillGridCommand: it was never executed.")
+            return
+
+        for dr, old_row in enumerate(self.old_values):
+            for dc, value in enumerate(old_row):
+                self.grid_state.set_cell(self.row + dr, self.col + dc, value)
+
+        if self.resize_command:
+            self.resize_command.undo()
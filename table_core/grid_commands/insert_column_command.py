@@ -26,10 +26,7 @@ class InsertColumnCommand(Command):
             self.col_index = self.grid_state.cols  # Default to append at end
         
         # Insert empty cell at specified index in each row
-        for row in self.grid_state.grid_data:
-            row.insert(self.col_index, '')           # Insert empty cell at specified index
-
-        self.grid_state.cols += 1                    # Update total column count
+        self.grid_state.insert_col(self.col_index)
         logger.info(f"Column inserted at index {self.col_index}")
 
     def undo(self):
@@ -46,12 +43,6 @@ class InsertColumnCommand(Command):
             logger.warning(f"Cannot undo InsertColumnCommand: invalid column index {self.col_index}")
             return
 
-        # Store the content of the column being removed for potential redo
-        self.removed_cells = [row[self.col_index] for row in self.grid_state.grid_data]
-
-        # Remove the column at the specified index from each row
-        for row in self.grid_state.grid_data:
-            row.pop(self.col_index)                  # Remove column at specified index
-
-        self.grid_state.cols -= 1                    # Decrease column count
+        # Remove the column at the specified index, keeping its content for potential redo
+        self.removed_cells = self.grid_state.delete_col(self.col_index)
         logger.info(f"Column removed from index {self.col_index}")
\ No newline at end of file
@@ -25,13 +25,8 @@ class InsertRowCommand(Command):
             logger.warning(f"Invalid row index {self.row_index}. Must be between 0 and {self.grid_state.rows}")
             self.row_index = self.grid_state.rows  # Default to append at end
         
-        # Create new empty row with the same number of columns
-        new_row = [''] * self.grid_state.cols
-        
-        # Insert the new row at the specified index
-        self.grid_state.grid_data.insert(self.row_index, new_row)
-
-        self.grid_state.rows += 1                    # Update total row count
+        # Insert a new empty row at the specified index
+        self.grid_state.insert_row(self.row_index)
         logger.info(f"Row inserted at index {self.row_index}")
 
     def undo(self):
@@ -48,11 +43,6 @@ class InsertRowCommand(Command):
             logger.warning(f"Cannot undo InsertRowCommand: invalid row index {self.row_index}")
             return
 
-        # Store the content of the row being removed for potential redo
-        self.removed_row = self.grid_state.grid_data[self.row_index][:]
-
-        # Remove the row at the specified index
-        self.grid_state.grid_data.pop(self.row_index)
-
-        self.grid_state.rows -= 1                    # Decrease row count
+        # Remove the row at the specified index, keeping its content for potential redo
+        self.removed_row = self.grid_state.delete_row(self.row_index)
         logger.info(f"Row removed from index {self.row_index}")
\ No newline at end of file
@@ -0,0 +1,87 @@
+from .command import Command
+from .resize_command import ResizeGridCommand
+from utilities import LOGGER_NAME
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class InsertWordsCommand(Command):
+    """
+    Command that inserts several words as one step, exactly as if they had
+    been inserted one by one: each word goes into the cursor cell (appended
+    in ⟳ mode), the grid grows when the cursor reaches its last row or
+    column, and the cursor then advances according to the navigation mode.
+    The whole batch is undone and redone at once.
+    """
+
+    def __init__(self, grid_state, nav_controller, words):
+        """
+        Args:
+            grid_state: GridStateManager to write into
+            nav_controller: NavigationController that decides where the cursor moves
+            words (list[str]): Words in insertion order
+        """
+        self.grid_state = grid_state
+        self.words = list(words)
+        self.old_pos = grid_state.current_pos
+
+        # Replay the cursor walk up front to know the cells, the final size and the final cursor
+        rows, cols = grid_state.rows, grid_state.cols
+        r, c = grid_state.current_pos
+        self.new_values = {}                        # (row, col) -> text after insertion
+        for word in self.words:
+            if (r, c) in self.new_values:
+                old_text = self.new_values[(r, c)]
+            else:
+                old_text = grid_state.get_cell(r, c) if r < grid_state.rows and c < grid_state.cols else ''
+            self.new_values[(r, c)] = (
+                old_text + (' ' if old_text else '') + word
+                if nav_controller.nav_mode == '⟳'
+                else word
+            )
+            # Same growth rule as GridLogicHelper.expand_if_needed
+            if r >= rows - 1:
+                rows += 1
+            if c >= cols - 1:
+                cols += 1
+            r, c = nav_controller.next_position(r, c, rows, cols)
+        self.new_pos = (r, c)
+
+        self.resize_command = (
+            ResizeGridCommand(grid_state, rows, cols)
+            if (rows, cols) != (grid_state.rows, grid_state.cols)
+            else None
+        )
+        self.old_values = None                      # (row, col) -> text before insertion, captured on execute
+        self.result = None                          # [(row, col, new_text), ...] after execution
+
+    def execute(self):
+        """
+        Grow the grid if needed, write every word and move the cursor past the last one.
+        """
+        logger.info(f"Executing InsertWordsCommand: {len(self.words)} words from {self.old_pos}")
+        if self.resize_command:
+            self.resize_command.execute()
+
+        self.old_values = {}
+        for (r, c), text in self.new_values.items():
+            self.old_values[(r, c)] = self.grid_state.get_cell(r, c)
+            self.grid_state.set_cell(r, c, text)
+        self.grid_state.current_pos = self.new_pos
+        self.result = [(r, c, text) for (r, c), text in self.new_values.items()]
+
+    def undo(self):
+        """
+        Restore the overwritten cells, the previous grid size and the cursor.
+        """
+        logger.info(f"Undoing InsertWordsCommand: {len(self.words)} words from {self.old_pos}")
+        if self.old_values is None:
+            logger.warning("Cannot undo InsertWordsCommand: it was never executed.")
+            return
+
+        for (r, c), text in self.old_values.items():
+            self.grid_state.set_cell(r, c, text)
+
+        if self.resize_command:
+            self.resize_command.undo()
+        self.grid_state.current_pos = self.old_pos
@@ -1,27 +1,143 @@
-from utilities import LOGGER_NAME
+from .grid_store import create_grid_store
+from utilities import LOGGER_NAME, GRID_STORAGE_DEFAULT
 
+from dataclasses import dataclass
+from typing import Optional, Tuple
 import logging
-from copy import deepcopy
 
 logger = logging.getLogger(LOGGER_NAME)
 
+@dataclass(frozen=True)
+class GridChange:
+    """
+    One change of the grid, as reported to GridStateManager listeners.
+
+    kind is one of:
+    - "cells": the values of `cells` ((row, col) pairs) changed
+    - "insert_row" / "delete_row": a row was inserted at / removed from `index`
+    - "insert_col" / "delete_col": the same for a column
+    - "resize": the grid was truncated or extended at its bottom/right edges
+    - "reset": size and content may both have changed
+    """
+    kind: str
+    index: Optional[int] = None
+    cells: Tuple[Tuple[int, int], ...] = ()
+
+
 class GridStateManager:
-    def __init__(self, rows, cols):
-        self.rows = rows # Number of rows in the grid
-        self.cols = cols # Number of columns in the grid
-        # 2D list initialized with empty strings (""), representing the grid's cells
-        self.grid_data = [['' for _ in range(cols)] for _ in range(rows)]
+    def __init__(self, rows, cols, storage=GRID_STORAGE_DEFAULT):
+        # Cell storage: nested lists ("list"), interned codes with row/column index maps ("array")
+        # or non-empty cells only with a logical size ("sparse")
+        self.store = create_grid_store(storage, rows, cols)
         self.current_pos = (0, 0) # Tracks the currently selected cell (row, col)
         self.undo_stack = [] # Stack to store past grid states (for undo)
         self.redo_stack = [] # Stack to store undone states (for redo)
 
         self.interaction_mode = 'SELECT'
         self.editing_cell = None   # (row, col) of cell being edited in EDIT mode
+        self.listeners = []        # Callables taking a GridChange, called after every mutation
 
         logger.info(f"Grid initialized with size {rows}x{cols}")
 
+    @property
+    def rows(self):
+        return self.store.rows # Number of rows in the grid
+
+    @property
+    def cols(self):
+        return self.store.cols # Number of columns in the grid
+
+    @property
+    def grid_data(self):
+        """
+        The grid as a list of row lists (e.g. for export). With "list" storage
+        this is the live data; other stores return a snapshot, so cells must be
+        changed through set_cell and the row/column methods.
+        """
+        if self.store.name == "list":
+            return self.store.data
+        return self.store.to_list()
+
+    @grid_data.setter
+    def grid_data(self, grid):
+        self.load(grid)
+
+    def add_listener(self, listener):
+        """Call listener(GridChange) after every change of the grid."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def _notify(self, kind, index=None, cells=()):
+        if self.listeners:
+            change = GridChange(kind, index, tuple(cells))
+            for listener in self.listeners:
+                listener(change)
+
     def get_cell(self, row, col):
         if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
             logger.error(f"Attempted to access invalid cell ({row}, {col})")
             raise IndexError("Cell coordinates out of bounds")
-        return self.grid_data[row][col]
+        return self.store.get(row, col)
+
+    def set_cell(self, row, col, value):
+        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
+            logger.error(f"Attempted to write invalid cell ({row}, {col})")
+            raise IndexError("Cell coordinates out of bounds")
+        self.store.set(row, col, value)
+        self._notify("cells", cells=((row, col),))
+
+    def get_row(self, row):
+        return self.store.row_values(row)
+
+    def insert_row(self, index, values=None):
+        self.store.insert_row(index, values)
+        self._notify("insert_row", index)
+
+    def delete_row(self, index):
+        values = self.store.delete_row(index)
+        self._notify("delete_row", index)
+        return values
+
+    def insert_col(self, index, values=None):
+        self.store.insert_col(index, values)
+        self._notify("insert_col", index)
+
+    def delete_col(self, index):
+        values = self.store.delete_col(index)
+        self._notify("delete_col", index)
+        return values
+
+    def resize(self, rows, cols):
+        if (rows, cols) != (self.rows, self.cols):
+            self.store.resize(rows, cols)
+            self._notify("resize")
+
+    def load(self, grid, rows=None, cols=None):
+        self.store.load(grid, rows, cols)
+        self._notify("reset")
+
+    def to_list(self):
+        return self.store.to_list()
+
+    def snapshot(self):
+        """Copy of the whole content for undo; sparse storage copies only non-empty cells."""
+        return self.store.snapshot()
+
+    def restore(self, snapshot):
+        self.store.restore(snapshot)
+        self._notify("reset")
+
+    def non_empty_cells(self):
+        """Iterate (row, col, value) over the cells that hold text."""
+        return self.store.items()
+
+    def has_data(self):
+        return any(value.strip() for _, _, value in self.store.items())
+
+    def clear(self):
+        cleared = [(r, c) for r, c, _ in self.store.items()] if self.listeners else ()
+        self.store.clear()
+        self._notify("cells", cells=cleared)
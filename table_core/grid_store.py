@@ -0,0 +1,448 @@
+from utilities import LOGGER_NAME
+
+from abc import ABC, abstractmethod
+import logging
+import numpy as np
+
+logger = logging.getLogger(LOGGER_NAME)
+
+# === GridStore: storage backend behind GridStateManager ===
+class GridStore(ABC):
+    """
+    Cell storage of the table. All coordinates are logical (row, col)
+    positions; empty cells read as ''.
+    """
+    name = "base"
+
+    def __init__(self):
+        self.rows = 0
+        self.cols = 0
+
+    @abstractmethod
+    def get(self, row, col):
+        pass
+
+    @abstractmethod
+    def set(self, row, col, value):
+        pass
+
+    @abstractmethod
+    def insert_row(self, index, values=None):
+        """Insert a row before `index` (rows == append), empty unless values are given."""
+        pass
+
+    @abstractmethod
+    def delete_row(self, index):
+        """Remove a row and return its values."""
+        pass
+
+    @abstractmethod
+    def insert_col(self, index, values=None):
+        """Insert a column before `index` (cols == append), empty unless values are given."""
+        pass
+
+    @abstractmethod
+    def delete_col(self, index):
+        """Remove a column and return its values."""
+        pass
+
+    @abstractmethod
+    def resize(self, rows, cols):
+        """Truncate or extend to the given size; new cells are empty."""
+        pass
+
+    def row_values(self, row):
+        return [self.get(row, c) for c in range(self.cols)]
+
+    def to_list(self):
+        """The whole grid as a new list of row lists."""
+        return [self.row_values(r) for r in range(self.rows)]
+
+    def load(self, grid, rows=None, cols=None):
+        """
+        Replace the content with a list of row lists. Without explicit sizes
+        the grid takes the size of the data.
+        """
+        rows = len(grid) if rows is None else rows
+        cols = max((len(row) for row in grid), default=0) if cols is None else cols
+        self.resize(0, 0)
+        self.resize(rows, cols)
+        for r, row in enumerate(grid[:rows]):
+            for c, value in enumerate(row[:cols]):
+                if value:
+                    self.set(r, c, value)
+
+    def items(self):
+        """Yield (row, col, value) for every non-empty cell, row by row."""
+        for r in range(self.rows):
+            for c, value in enumerate(self.row_values(r)):
+                if value:
+                    yield r, c, value
+
+    def clear(self):
+        for r, c, _ in list(self.items()):
+            self.set(r, c, '')
+
+    def snapshot(self):
+        """Opaque copy of the whole content, for restore()."""
+        return self.rows, self.cols, self.to_list()
+
+    def restore(self, snapshot):
+        rows, cols, grid = snapshot
+        self.load(grid, rows, cols)
+
+
+class ListGridStore(GridStore):
+    """
+    The classic layout: one Python list of strings per row.
+    """
+    name = "list"
+
+    def __init__(self, rows, cols):
+        super().__init__()
+        self.data = []
+        self.resize(rows, cols)
+
+    def get(self, row, col):
+        return self.data[row][col]
+
+    def set(self, row, col, value):
+        self.data[row][col] = value
+
+    def row_values(self, row):
+        return self.data[row][:]
+
+    def insert_row(self, index, values=None):
+        row = list(values) if values is not None else [''] * self.cols
+        self.data.insert(index, row + [''] * (self.cols - len(row)))
+        self.rows += 1
+
+    def delete_row(self, index):
+        self.rows -= 1
+        return self.data.pop(index)
+
+    def insert_col(self, index, values=None):
+        for r, row in enumerate(self.data):
+            row.insert(index, values[r] if values is not None else '')
+        self.cols += 1
+
+    def delete_col(self, index):
+        self.cols -= 1
+        return [row.pop(index) for row in self.data]
+
+    def resize(self, rows, cols):
+        del self.data[rows:]
+        for row in self.data:
+            del row[cols:]
+            row.extend([''] * (cols - len(row)))
+        self.data.extend([''] * cols for _ in range(rows - len(self.data)))
+        self.rows, self.cols = rows, cols
+
+    def to_list(self):
+        return [row[:] for row in self.data]
+
+    def clear(self):
+        for row in self.data:
+            row[:] = [''] * self.cols
+
+    def restore(self, snapshot):
+        self.rows, self.cols, grid = snapshot
+        self.data = [row[:] for row in grid]
+
+
+class ArrayGridStore(GridStore):
+    """
+    Compact storage for large tables.
+
+    Cell values are interned: every distinct string is stored once in a
+    pool, and a NumPy int32 matrix holds pool codes (0 is ''). Rows and
+    columns are reached through index maps from logical to physical
+    position. Inserting or deleting a row or column therefore only updates
+    the map (O(rows) or O(cols) pointer moves) and allocates or frees one
+    physical row or column, instead of moving every cell behind it.
+
+    Strings that are overwritten stay in the pool until the next
+    compaction, which drops unused strings and shrinks the matrix back to
+    the logical size. It runs on clear(), when the grid shrinks, and when
+    the pool has doubled since the last compaction.
+    """
+    name = "array"
+    COMPACT_MIN_POOL = 1024                     # Never compact a pool smaller than this on growth alone
+
+    def __init__(self, rows, cols):
+        super().__init__()
+        self.pool = ['']                        # code -> string
+        self.codes = {'': 0}                    # string -> code
+        self.cells = np.zeros((max(rows, 1), max(cols, 1)), dtype=np.int32)
+        self.row_map = []                       # logical row -> physical row
+        self.col_map = []                       # logical col -> physical col
+        self.free_rows = list(range(self.cells.shape[0] - 1, -1, -1))
+        self.free_cols = list(range(self.cells.shape[1] - 1, -1, -1))
+        self._compact_at = self.COMPACT_MIN_POOL  # Pool size that triggers the next compaction
+        self.resize(rows, cols)
+
+    def _code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.pool)
+            self.pool.append(value)
+        return code
+
+    def _maybe_compact(self):
+        if len(self.pool) > self._compact_at:
+            self._compact()
+
+    def _compact(self):
+        """
+        Rebuild the pool from the codes still in use and copy the cells into a
+        matrix of the logical size, in logical order.
+        """
+        if self.rows and self.cols:
+            block = self.cells[np.ix_(self.row_map, self.col_map)]
+        else:
+            block = np.zeros((self.rows, self.cols), dtype=np.int32)
+        used, inverse = np.unique(block.ravel(), return_inverse=True)
+        if not used.size or used[0] != 0:
+            # Keep '' at code 0 even when no cell is empty
+            used = np.concatenate(([0], used))
+            inverse = inverse + 1
+        dropped = len(self.pool) - len(used)
+        self.pool = [self.pool[code] for code in used.tolist()]
+        self.codes = {value: code for code, value in enumerate(self.pool)}
+
+        shape = (max(self.rows, 1), max(self.cols, 1))
+        self.cells = np.zeros(shape, dtype=np.int32)
+        self.cells[:self.rows, :self.cols] = inverse.reshape(block.shape)
+        self.row_map = list(range(self.rows))
+        self.col_map = list(range(self.cols))
+        self.free_rows = list(range(shape[0] - 1, self.rows - 1, -1))
+        self.free_cols = list(range(shape[1] - 1, self.cols - 1, -1))
+        self._compact_at = max(2 * len(self.pool), self.COMPACT_MIN_POOL)
+        logger.debug(f"Compacted array grid store: {dropped} unused string(s) dropped, "
+                     f"{len(self.pool)} in the pool, matrix {shape[0]}x{shape[1]}")
+
+    def get(self, row, col):
+        return self.pool[self.cells[self.row_map[row], self.col_map[col]]]
+
+    def set(self, row, col, value):
+        self.cells[self.row_map[row], self.col_map[col]] = self._code(value)
+        self._maybe_compact()
+
+    def row_values(self, row):
+        pool = self.pool
+        return [pool[code] for code in self.cells[self.row_map[row], self.col_map].tolist()]
+
+    def _allocate_rows(self, count):
+        """Take `count` cleared physical rows, doubling the matrix when none are free."""
+        while len(self.free_rows) < count:
+            old = self.cells.shape[0]
+            self.cells = np.vstack([self.cells, np.zeros_like(self.cells)])
+            self.free_rows[:0] = range(2 * old - 1, old - 1, -1)
+        physical = self.free_rows[-count:][::-1] if count else []
+        del self.free_rows[len(self.free_rows) - count:]
+        self.cells[physical, :] = 0
+        return physical
+
+    def _allocate_cols(self, count):
+        """Take `count` cleared physical columns, doubling the matrix when none are free."""
+        while len(self.free_cols) < count:
+            old = self.cells.shape[1]
+            self.cells = np.hstack([self.cells, np.zeros_like(self.cells)])
+            self.free_cols[:0] = range(2 * old - 1, old - 1, -1)
+        physical = self.free_cols[-count:][::-1] if count else []
+        del self.free_cols[len(self.free_cols) - count:]
+        self.cells[:, physical] = 0
+        return physical
+
+    def insert_row(self, index, values=None):
+        (physical,) = self._allocate_rows(1)
+        self.row_map.insert(index, physical)
+        self.rows += 1
+        if values is not None:
+            self.cells[physical, self.col_map[:len(values)]] = [self._code(v) for v in values]
+            self._maybe_compact()
+
+    def delete_row(self, index):
+        values = self.row_values(index)
+        self.free_rows.append(self.row_map.pop(index))
+        self.rows -= 1
+        return values
+
+    def insert_col(self, index, values=None):
+        (physical,) = self._allocate_cols(1)
+        self.col_map.insert(index, physical)
+        self.cols += 1
+        if values is not None:
+            self.cells[self.row_map[:len(values)], physical] = [self._code(v) for v in values]
+            self._maybe_compact()
+
+    def delete_col(self, index):
+        physical = self.col_map.pop(index)
+        values = [self.pool[code] for code in self.cells[self.row_map, physical].tolist()]
+        self.free_cols.append(physical)
+        self.cols -= 1
+        return values
+
+    def resize(self, rows, cols):
+        shrunk = rows < self.rows or cols < self.cols
+        if rows < self.rows:
+            self.free_rows.extend(reversed(self.row_map[rows:]))
+            del self.row_map[rows:]
+        if cols < self.cols:
+            self.free_cols.extend(reversed(self.col_map[cols:]))
+            del self.col_map[cols:]
+        if shrunk:
+            self.rows, self.cols = min(rows, self.rows), min(cols, self.cols)
+            self._compact()
+        if cols > self.cols:
+            self.col_map.extend(self._allocate_cols(cols - self.cols))
+        if rows > self.rows:
+            self.row_map.extend(self._allocate_rows(rows - self.rows))
+        self.rows, self.cols = rows, cols
+
+    def to_list(self):
+        if not self.rows or not self.cols:
+            return [[] for _ in range(self.rows)]
+        pool = np.array(self.pool, dtype=object)
+        return pool[self.cells[np.ix_(self.row_map, self.col_map)]].tolist()
+
+    def items(self):
+        if not self.rows or not self.cols:
+            return
+        block = self.cells[np.ix_(self.row_map, self.col_map)]
+        for r, c in zip(*np.nonzero(block)):
+            yield int(r), int(c), self.pool[block[r, c]]
+
+    def clear(self):
+        self.cells[:] = 0
+        self._compact()
+
+
+class SparseGridStore(GridStore):
+    """
+    Storage for huge, mostly empty tables: only non-empty cells exist, as
+    {row: {col: value}}, and the size is purely logical. Resizing, inserting
+    or deleting rows and columns, clearing and snapshots all cost time in
+    proportion to the occupied cells, never to rows * cols.
+    """
+    name = "sparse"
+
+    def __init__(self, rows, cols):
+        super().__init__()
+        self.data = {}                          # row -> {col: value}, non-empty cells only
+        self.rows, self.cols = rows, cols
+
+    def get(self, row, col):
+        cells = self.data.get(row)
+        return cells.get(col, '') if cells else ''
+
+    def set(self, row, col, value):
+        if value:
+            self.data.setdefault(row, {})[col] = value
+        else:
+            cells = self.data.get(row)
+            if cells:
+                cells.pop(col, None)
+                if not cells:
+                    del self.data[row]
+
+    def row_values(self, row):
+        values = [''] * self.cols
+        for c, value in self.data.get(row, {}).items():
+            values[c] = value
+        return values
+
+    @staticmethod
+    def _shift(mapping, index, delta):
+        """Move every key >= index by delta (keys < index stay)."""
+        return {(k + delta if k >= index else k): v for k, v in mapping.items()}
+
+    def insert_row(self, index, values=None):
+        self.data = self._shift(self.data, index, 1)
+        self.rows += 1
+        for c, value in enumerate(values or ()):
+            self.set(index, c, value)
+
+    def delete_row(self, index):
+        values = self.row_values(index)
+        self.data.pop(index, None)
+        self.data = self._shift(self.data, index + 1, -1)
+        self.rows -= 1
+        return values
+
+    def insert_col(self, index, values=None):
+        for r, cells in self.data.items():
+            if any(c >= index for c in cells):
+                self.data[r] = self._shift(cells, index, 1)
+        self.cols += 1
+        for r, value in enumerate(values or ()):
+            self.set(r, index, value)
+
+    def delete_col(self, index):
+        values = [''] * self.rows
+        for r in list(self.data):
+            cells = self.data[r]
+            if index in cells:
+                values[r] = cells.pop(index)
+            if any(c > index for c in cells):
+                cells = self._shift(cells, index + 1, -1)
+            if cells:
+                self.data[r] = cells
+            else:
+                del self.data[r]
+        self.cols -= 1
+        return values
+
+    def resize(self, rows, cols):
+        if rows < self.rows or cols < self.cols:
+            kept = {}
+            for r, cells in self.data.items():
+                if r < rows:
+                    cells = {c: v for c, v in cells.items() if c < cols}
+                    if cells:
+                        kept[r] = cells
+            self.data = kept
+        self.rows, self.cols = rows, cols
+
+    def load(self, grid, rows=None, cols=None):
+        self.data = {}
+        self.rows = len(grid) if rows is None else rows
+        self.cols = max((len(row) for row in grid), default=0) if cols is None else cols
+        for r, row in enumerate(grid[:self.rows]):
+            cells = {c: v for c, v in enumerate(row[:self.cols]) if v}
+            if cells:
+                self.data[r] = cells
+
+    def items(self):
+        for r in sorted(self.data):
+            cells = self.data[r]
+            for c in sorted(cells):
+                yield r, c, cells[c]
+
+    def clear(self):
+        self.data = {}
+
+    def snapshot(self):
+        return self.rows, self.cols, {r: dict(cells) for r, cells in self.data.items()}
+
+    def restore(self, snapshot):
+        self.rows, self.cols, data = snapshot
+        self.data = {r: dict(cells) for r, cells in data.items()}
+
+
+GRID_STORES = {
+    ListGridStore.name: ListGridStore,
+    ArrayGridStore.name: ArrayGridStore,
+    SparseGridStore.name: SparseGridStore,
+}
+
+def create_grid_store(name, rows, cols):
+    """
+    Build a grid store by name ("list", "array" or "sparse").
+    """
+    try:
+        store_class = GRID_STORES[name]
+    except KeyError:
+        raise ValueError(f"Unknown grid storage '{name}'. Available: {', '.join(GRID_STORES)}")
+    logger.info(f"Grid storage: {name}")
+    return store_class(rows, cols)
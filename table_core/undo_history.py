@@ -0,0 +1,163 @@
+from .grid_state import GridStateManager
+from .navigation import NavigationController
+from utilities import LOGGER_NAME, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW
+
+import io
+import logging
+import pickle
+import tempfile
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class _CommandPickler(pickle.Pickler):
+    """
+    Pickles commands without the live objects they point to: the grid state
+    and the navigation controller are written as references and reattached
+    when the command is loaded again.
+    """
+    SHARED_TYPES = (GridStateManager, NavigationController)
+
+    def __init__(self, file, shared):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shared = shared
+
+    def persistent_id(self, obj):
+        if isinstance(obj, self.SHARED_TYPES):
+            self.shared[id(obj)] = obj
+            return id(obj)
+        return None
+
+
+class _CommandUnpickler(pickle.Unpickler):
+    def __init__(self, file, shared):
+        super().__init__(file)
+        self.shared = shared
+
+    def persistent_load(self, pid):
+        return self.shared[pid]
+
+
+class UndoHistory:
+    """
+    Undo stack with a memory budget.
+
+    Every pushed command is measured by the size of its pickled form (live
+    references to the grid state are not counted). When the commands held
+    in memory exceed the budget, the oldest ones are either written to a
+    temporary spill file ("spill") or forgotten ("drop"). Spilled commands
+    come back one at a time when undo reaches them, so the history behaves
+    like a plain list for append() and pop().
+    """
+
+    def __init__(self, budget_mb=UNDO_MEMORY_BUDGET_MB, overflow=UNDO_OVERFLOW):
+        """
+        Args:
+            budget_mb (float): Memory budget of the in-memory commands in MB; 0 means unlimited
+            overflow (str): "spill" to page old commands out to disk, "drop" to discard them
+        """
+        if overflow not in ("spill", "drop"):
+            raise ValueError(f"Unknown undo overflow policy '{overflow}'. Use 'spill' or 'drop'.")
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.overflow = overflow
+        self.commands = []          # In-memory commands, oldest first
+        self.sizes = []             # Pickled size of each in-memory command (None if not measured)
+        self.memory_size = 0        # Sum of self.sizes
+        self.spilled = []           # (offset, length) in the spill file, oldest first; all older than self.commands
+        self.dropped = 0            # Commands forgotten under the "drop" policy
+        self._shared = {}           # id -> live object referenced by pickled commands
+        self._file = None           # Spill file, created on first use
+
+    def __len__(self):
+        return len(self.spilled) + len(self.commands)
+
+    def __bool__(self):
+        return bool(self.commands or self.spilled)
+
+    def size_of(self, command):
+        """
+        Size in bytes of a command as it would be spilled, or None if it cannot be pickled.
+        """
+        try:
+            return len(self._dumps(command))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Undo history cannot measure {type(command).__name__}: {e}")
+            return None
+
+    def append(self, command):
+        # Without a budget there is nothing to enforce, so skip pickling the command
+        size = self.size_of(command) if self.budget > 0 else None
+        self.commands.append(command)
+        self.sizes.append(size)
+        self.memory_size += size or 0
+        self._enforce_budget()
+
+    def pop(self):
+        """
+        Remove and return the newest command, paging it in from the spill file if needed.
+        """
+        if not self.commands:
+            if not self.spilled:
+                raise IndexError("pop from empty undo history")
+            return self._page_in()
+        self.memory_size -= self.sizes.pop() or 0
+        return self.commands.pop()
+
+    def clear(self):
+        self.commands.clear()
+        self.sizes.clear()
+        self.memory_size = 0
+        self.spilled.clear()
+        self.dropped = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        self.clear()
+
+    def _dumps(self, command):
+        buffer = io.BytesIO()
+        _CommandPickler(buffer, self._shared).dump(command)
+        return buffer.getvalue()
+
+    def _enforce_budget(self):
+        """
+        Spill or drop the oldest in-memory commands until the rest fit the budget.
+        The newest command always stays in memory.
+        """
+        if self.budget <= 0:
+            return
+        moved = 0
+        while self.memory_size > self.budget and len(self.commands) > 1:
+            if self.sizes[0] is None:
+                logger.warning("Undo history over budget, but its oldest command cannot be pickled.")
+                break
+            command = self.commands.pop(0)
+            self.memory_size -= self.sizes.pop(0)
+            if self.overflow == "spill":
+                self._spill(command)
+            else:
+                self.dropped += 1
+            moved += 1
+        if moved:
+            logger.info(f"Undo history over {self.budget} bytes: {self.overflow} {moved} command(s); "
+                        f"{len(self.commands)} in memory ({self.memory_size} bytes), {len(self.spilled)} on disk")
+
+    def _spill(self, command):
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(prefix="ocr_table_undo_")
+        data = self._dumps(command)
+        # Spilled commands form a stack: the file only ever grows or shrinks at its end
+        offset = self.spilled[-1][0] + self.spilled[-1][1] if self.spilled else 0
+        self._file.seek(offset)
+        self._file.write(data)
+        self.spilled.append((offset, len(data)))
+
+    def _page_in(self):
+        offset, length = self.spilled.pop()
+        self._file.seek(offset)
+        data = self._file.read(length)
+        self._file.truncate(offset)
+        command = _CommandUnpickler(io.BytesIO(data), self._shared).load()
+        logger.debug(f"Paged in {type(command).__name__} from the undo spill file ({length} bytes)")
+        return command
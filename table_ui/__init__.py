@@ -1,5 +1,7 @@
 from .navigation_bar import NavigationBar
 from .lower_controls import LowerControls
 from .table_canvas import TableCanvas
+from .virtual_table_canvas import VirtualTableCanvas
 from .table_ui_utils.canvas_helper import CanvasLogicHelper
 from .table_ui_builder import TableUIBuilder
+from .status_bar import StatusBar
@@ -9,6 +9,7 @@ class NavigationBar:
     def __init__(self):
         # Dictionary to hold references to mode buttons (→, ↓, ⟳)
         self.mode_buttons = {}
+        self.watch_button = None
         logger.debug("NavigationBar initialized.")
 
     def build(self, controller):
@@ -44,19 +45,36 @@ class NavigationBar:
             ("Redo", controller.navigation_items["redo"]),
             ("Export", controller.navigation_items["export"]),
             ("Screenshot & OCR", controller.navigation_items["screenshot_ocr"]),
-            ("Clipboard OCR", controller.navigation_items["clipboard_ocr"])
+            ("Clipboard OCR", controller.navigation_items["clipboard_ocr"]),
+            ("Watch region", controller.navigation_items["watch_ocr"])
         ]:
             logger.debug(f"Creating action button: {text}")            
-            tk.Button(
+            btn = tk.Button(
                 self.nav_frame, text=text, command=command,
                 font=FONT, bg=BUTTON_COLOR,
                 activebackground=BUTTON_HIGHLIGHT,
                 relief="groove", padx=12, pady=6
-            ).pack(side='left', padx=4)
+            )
+            btn.pack(side='left', padx=4)
+        self.watch_button = btn                 # Last action button; its label follows the watch state
 
         self.update_mode_buttons('→')
         logger.info("Navigation bar UI built successfully.")
 
+    def set_watching(self, watching):
+        """
+        Switch the watch button between starting and stopping watch mode.
+
+        Parameters:
+        - watching: whether a screen region is being watched
+        """
+        if self.watch_button is None:
+            return
+        if watching:
+            self.watch_button.config(text="Stop watching", bg=BUTTON_ACTIVE_MODE)
+        else:
+            self.watch_button.config(text="Watch region", bg=BUTTON_COLOR)
+
     def update_mode_buttons(self, active_mode):
         """
         Highlight the active navigation mode button.
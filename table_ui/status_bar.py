@@ -0,0 +1,68 @@
+from utilities import BG_COLOR, FONT, LOGGER_NAME
+
+import tkinter as tk
+import logging
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class StatusBar:
+    """
+    One-line status indicator at the bottom of the main window, used for
+    background activity such as the OCR model warm-up.
+    """
+    BUSY_FRAMES = "◐◓◑◒"       # Spinner shown while a background task runs
+    BUSY_INTERVAL_MS = 150
+
+    def __init__(self):
+        self.label = None
+        self._message = ""
+        self._busy = False
+        self._frame_index = 0
+        self._after_id = None
+        logger.debug("StatusBar initialized.")
+
+    def build(self, root):
+        """
+        Build the status bar and attach it to the bottom of the root window.
+
+        Parameters:
+        - root: the parent tkinter widget
+        """
+        self.label = tk.Label(root, text="", anchor='w', font=FONT, bg=BG_COLOR, fg="#555555")
+        self.label.pack(side='bottom', fill='x', padx=8, pady=(0, 4))
+        logger.info("Status bar UI built.")
+
+    def set_status(self, message, busy=False):
+        """
+        Show a message; with busy=True an animated spinner is prepended.
+
+        Parameters:
+        - message: text to display ("" clears the bar)
+        - busy: whether a background task is still running
+        """
+        self._message = message
+        self._busy = busy
+        if self.label is None or not self.label.winfo_exists():
+            return
+        if busy and self._after_id is None:
+            self._animate()
+        elif not busy:
+            self._stop_animation()
+            self.label.config(text=message)
+
+    def clear(self):
+        self.set_status("")
+
+    def _animate(self):
+        if not self._busy or not self.label.winfo_exists():
+            self._after_id = None
+            return
+        frame = self.BUSY_FRAMES[self._frame_index % len(self.BUSY_FRAMES)]
+        self._frame_index += 1
+        self.label.config(text=f"{frame} {self._message}")
+        self._after_id = self.label.after(self.BUSY_INTERVAL_MS, self._animate)
+
+    def _stop_animation(self):
+        if self._after_id is not None:
+            self.label.after_cancel(self._after_id)
+            self._after_id = None
@@ -86,6 +86,9 @@ class TableCanvas:
         grid_duration = time.perf_counter() - grid_start_time
         logger.debug(f"Table grid creation took {grid_duration:.3f} seconds")
         
+        # From now on, follow the grid state's change notifications instead of rebuilding
+        self.state.add_listener(self.apply_change)
+        
         build_duration = time.perf_counter() - build_start_time
         logger.info(f"TableCanvas build completed in {build_duration:.3f} seconds")
     
@@ -205,6 +208,101 @@ class TableCanvas:
         
         logger.debug(f"Cleared {widget_count} widgets and {previous_entry_count} entry references")
     
+    def apply_change(self, change) -> None:
+        """
+        Bring the widgets in line with one change of the grid state.
+        
+        Entry widgets keep their grid position (and their event bindings):
+        a changed cell gets its text set, a structural change only adds or
+        destroys widgets at the bottom/right edges and then refreshes the
+        text of the cells that moved. Highlighting is left to the caller
+        (see CanvasLogicHelper.refresh_table).
+        
+        Args:
+            change: GridChange reported by GridStateManager
+        """
+        if self.controller is None:
+            return
+        
+        if change.kind == "cells":
+            for row, col in change.cells:
+                self._refresh_cell(row, col)
+            logger.debug(f"Applied change to {len(change.cells)} cell(s)")
+            return
+        
+        self._sync_grid_size(self.controller.callbacks)
+        rows, cols = len(self.entries), self.get_col_count()
+        if change.kind in ("insert_row", "delete_row"):
+            self._refresh_cells(range(change.index, rows), range(cols))
+        elif change.kind in ("insert_col", "delete_col"):
+            self._refresh_cells(range(rows), range(change.index, cols))
+        elif change.kind == "reset":
+            self._refresh_cells(range(rows), range(cols))
+        # "resize": kept cells are unchanged and new widgets were filled from the state
+        logger.debug(f"Applied '{change.kind}' change (index={change.index}); table is {rows}x{cols}")
+    
+    def _sync_grid_size(self, callbacks: Dict[str, Callable]) -> None:
+        """
+        Add or destroy Entry widgets at the bottom/right edges until the
+        widget grid has the size of the grid state.
+        
+        Args:
+            callbacks: Dictionary of callback functions for new cells
+        """
+        rows = self.get_row_count()
+        cols = self.get_col_count()
+        
+        # Surplus rows, then surplus or missing columns of the remaining rows
+        for row_entries in self.entries[rows:]:
+            for entry in row_entries:
+                entry.destroy()
+        del self.entries[rows:]
+        for row, row_entries in enumerate(self.entries):
+            for entry in row_entries[cols:]:
+                entry.destroy()
+            del row_entries[cols:]
+            row_entries.extend(self._create_cell_entry(row, col, callbacks)
+                               for col in range(len(row_entries), cols))
+        
+        # Missing rows
+        for row in range(len(self.entries), rows):
+            self.entries.append([self._create_cell_entry(row, col, callbacks) for col in range(cols)])
+    
+    def _refresh_cells(self, rows, cols) -> None:
+        """
+        Refresh the text of a block of cells from the grid state.
+        
+        Args:
+            rows: Row indices to refresh
+            cols: Column indices to refresh
+        """
+        for row in rows:
+            for col in cols:
+                self._refresh_cell(row, col)
+    
+    def _refresh_cell(self, row: int, col: int) -> None:
+        """
+        Show the grid state's value in one Entry, leaving it untouched when it
+        already shows that value (e.g. the text the user just typed).
+        
+        Args:
+            row: Row index of the cell
+            col: Column index of the cell
+        """
+        entry = self.entry_at(row, col)
+        if entry is None or row >= self.state.rows or col >= self.state.cols:
+            return
+        value = self.state.get_cell(row, col)
+        if entry.get() == value:
+            return
+        
+        # Temporarily enable the entry to replace its content
+        current_state = entry['state']
+        entry.config(state=EntryState.NORMAL.value)
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
+        entry.config(state=current_state)
+    
     def _create_cell_grid(self, callbacks: Dict[str, Callable]) -> None:
         """
         Create the grid of Entry widgets.
@@ -289,19 +387,18 @@ class TableCanvas:
         """
         Set initial content for a cell Entry widget.
         
-        Retrieves the content from the state's grid_data and populates
+        Retrieves the content from the grid state and populates
         the Entry widget. Temporarily enables the widget to allow content insertion.
         
         Args:
             entry: Entry widget to populate
-            row: Row index in the grid_data
-            col: Column index in the grid_data
+            row: Row index in the grid
+            col: Column index in the grid
         """
         # Check if this position has data in the grid
-        if (row < len(self.state.grid_data) and 
-            col < len(self.state.grid_data[row])):
+        if row < self.state.rows and col < self.state.cols:
             
-            content = self.state.grid_data[row][col]
+            content = self.state.get_cell(row, col)
             logger.debug(f"Setting initial content for ({row}, {col}): '{content}'")
             
             # Temporarily enable entry to insert content
@@ -457,6 +554,21 @@ class TableCanvas:
         
         return is_valid
     
+    def entry_at(self, row: int, col: int) -> Optional[tk.Entry]:
+        """
+        Get the Entry widget that shows a cell.
+        
+        Args:
+            row: Row index of the cell
+            col: Column index of the cell
+            
+        Returns:
+            The Entry widget, or None if the cell has no widget
+        """
+        if self._is_valid_entry_position(row, col):
+            return self.entries[row][col]
+        return None
+    
     def _update_cell_appearance(self, row: int, col: int, current_pos: Tuple[int, int], 
                               editing_cell: Optional[Tuple[int, int]], mode: InteractionMode) -> None:
         """
@@ -474,7 +586,7 @@ class TableCanvas:
             editing_cell: Currently editing position (if any)
             mode: Current interaction mode
         """
-        entry = self.entries[row][col]
+        entry = self.entry_at(row, col)
         
         try:
             if (row, col) == editing_cell and mode == InteractionMode.EDIT:
@@ -705,9 +817,10 @@ class TableCanvas:
         """
         logger.debug(f"Setting focus to cell ({row}, {col})")
         
-        if self._is_valid_entry_position(row, col):
+        entry = self.entry_at(row, col)
+        if entry is not None:
             try:
-                self.entries[row][col].focus_set()
+                entry.focus_set()
                 logger.debug(f"Focus successfully set to cell ({row}, {col})")
             except Exception as e:
                 logger.error(f"Failed to set focus to cell ({row}, {col}): {e}")
@@ -729,8 +842,8 @@ class TableCanvas:
         """
         logger.debug(f"Replacing content in cell ({row}, {col}) with character: '{char}'")
         
-        if self._is_valid_entry_position(row, col):
-            entry = self.entries[row][col]
+        entry = self.entry_at(row, col)
+        if entry is not None:
             # Only proceed if the entry is in normal (editable) state
             if entry['state'] == EntryState.NORMAL.value:
                 logger.debug(f"Entry at ({row}, {col}) is editable, scheduling content replacement")
@@ -777,9 +890,10 @@ class TableCanvas:
         Returns:
             String content of the cell, or empty string if invalid position
         """
-        if self._is_valid_entry_position(row, col):
+        entry = self.entry_at(row, col)
+        if entry is not None:
             try:
-                value = self.entries[row][col].get()
+                value = entry.get()
                 logger.debug(f"Retrieved value from entry ({row}, {col}): '{value}'")
                 return value
             except Exception as e:
@@ -16,6 +16,10 @@ class TableUIBuilder:
 
         self.controller.lower_controls.build(self.controller.root, self.controller.lower_commands)
 
+        # Packed before the table so it keeps its place at the bottom edge
+        if self.controller.status_bar is not None:
+            self.controller.status_bar.build(self.controller.root)
+
         self.controller.canvas_table.build(self.controller)
         self.bind_shortcuts()
         self.bind_table_scrolling()
@@ -15,13 +15,28 @@ class CanvasLogicHelper:
         r, c = nav.next_position(r, c, state.rows, state.cols)
         state.current_pos = (r, c)
         controller.canvas_table.highlight_active_cell()
-        controller.canvas_table.entries[r][c].focus_set()
+        controller.canvas_table.focus_cell(r, c)
+
+    @staticmethod
+    def refresh_table(controller):
+        """
+        Refreshes the cell highlighting after a grid change. The cells themselves
+        are already up to date: TableCanvas applies the grid state's change
+        notifications as they happen. Inside a command transaction the refresh
+        waits for the commit.
+        """
+        controller.command_manager.defer(
+            "refresh_table",
+            controller.canvas_table.highlight_active_cell
+        )
 
     @staticmethod
     def rebuild_table(controller):
         """
-        Rebuilds the visual grid and reconnects callbacks.
+        Rebuilds the visual grid and reconnects callbacks. Inside a command
+        transaction the rebuild waits for the commit and happens only once.
         """
-        controller.canvas_table.rebuild_table(
-            controller.callbacks
+        controller.command_manager.defer(
+            "rebuild_table",
+            lambda: controller.canvas_table.rebuild_table(controller.callbacks)
         )
\ No newline at end of file
@@ -0,0 +1,346 @@
+from utilities import BG_COLOR, FONT, LOGGER_NAME
+from .table_canvas import TableCanvas
+from .table_ui_utils import EntryState, CellEventHandler, InteractionMode
+
+import tkinter as tk
+import logging
+import time
+from typing import Optional, Callable, Dict, Tuple, List
+
+# Initialize logger for this module
+logger = logging.getLogger(LOGGER_NAME)
+
+
+class VirtualTableCanvas(TableCanvas):
+    """
+    Table canvas that only creates widgets for the visible cells.
+
+    The canvas scroll region covers the whole table, but Entry widgets
+    exist only for the cells in the viewport plus a small margin. They
+    come from a pool: when the view scrolls, widgets of cells that left
+    the view are moved to the cells that entered it and rebound to their
+    new data coordinates (text, styling and event handler). Building,
+    scrolling and highlighting therefore cost time in proportion to the
+    window size, not to rows * cols, so tables with 100k rows open and
+    scroll instantly.
+
+    The rest of the application reaches cells through entry_at() and
+    focus_cell(), which work for both canvases; `entries` stays empty.
+    """
+
+    MARGIN = 2      # Extra rows/columns rendered around the viewport
+
+    def __init__(self):
+        """
+        Initialize the VirtualTableCanvas with an empty widget pool.
+        """
+        super().__init__()
+        self.visible: Dict[Tuple[int, int], tk.Entry] = {}  # (row, col) -> Entry currently showing that cell
+        self.pool: List[tk.Entry] = []                  # Every Entry ever created, shown or parked
+        self.parked: List[tk.Entry] = []                # Hidden pool entries, free for reuse
+        self.handlers: Dict[tk.Entry, CellEventHandler] = {}  # Entry -> its (rebindable) event handler
+        self.windows: Dict[tk.Entry, int] = {}          # Entry -> canvas window item id
+        self.cell_width = 0                             # Cell pitch in pixels, measured on first build
+        self.cell_height = 0
+        self._viewport_pending = False                  # An idle viewport update is already scheduled
+        self._callbacks: Dict[str, Callable] = {}
+
+    def _create_ui_components(self, root: tk.Widget) -> None:
+        """
+        Create the scrollable canvas and scrollbars. Cells are canvas window
+        items, so there is no inner frame; the scrollbars report every view
+        change so the viewport can be refilled whatever caused the scroll.
+
+        Args:
+            root: Parent widget to contain the table
+        """
+        container = tk.Frame(root, bg=BG_COLOR)
+        container.pack(fill='both', expand=True)
+
+        self.canvas = tk.Canvas(container, borderwidth=0, bg=self.style_config.TABLE_BG, highlightthickness=0)
+        self.scroll_x = tk.Scrollbar(container, orient="horizontal", command=self.canvas.xview)
+        self.scroll_y = tk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(xscrollcommand=self._on_xscroll, yscrollcommand=self._on_yscroll)
+
+        self.scroll_x.pack(side="bottom", fill="x")
+        self.scroll_y.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+
+        # A resized window shows more or fewer cells
+        self.canvas.bind("<Configure>", lambda e: self._schedule_viewport_update())
+        logger.debug("Virtual table UI components created.")
+
+    def _on_xscroll(self, first, last) -> None:
+        self.scroll_x.set(first, last)
+        self._schedule_viewport_update()
+
+    def _on_yscroll(self, first, last) -> None:
+        self.scroll_y.set(first, last)
+        self._schedule_viewport_update()
+
+    def _schedule_viewport_update(self) -> None:
+        """
+        Refill the viewport once the current burst of scroll events is handled.
+        """
+        if not self._viewport_pending and self.canvas is not None:
+            self._viewport_pending = True
+            self.canvas.after_idle(self._update_viewport)
+
+    def rebuild_table(self, callbacks: Dict[str, Callable]) -> None:
+        """
+        Reset the scroll region to the table size and refill the viewport.
+        No widget is destroyed: the pool is reused.
+
+        Args:
+            callbacks: Dictionary of callback functions for various events
+        """
+        rebuild_start_time = time.perf_counter()
+        self._callbacks = callbacks
+        if not self.cell_width:
+            self._measure_cell()
+
+        # Park every widget, then show the cells of the current view
+        self._clear_existing_widgets()
+        self._update_scroll_region()
+        self._update_viewport()
+
+        rebuild_duration = time.perf_counter() - rebuild_start_time
+        logger.info(f"Virtual table rebuild completed in {rebuild_duration:.3f} seconds: "
+                    f"{self.get_row_count()}x{self.get_col_count()} table, {len(self.visible)} cells shown, "
+                    f"{len(self.pool)} widgets in the pool")
+
+    def _measure_cell(self) -> None:
+        """
+        Measure the pixel pitch of one cell with a pooled Entry widget.
+        """
+        entry = self._new_pool_entry()
+        self._park(entry)
+        self.canvas.update_idletasks()
+        pad_x = 2 * self.style_config.CELL_PADDING["padx"]
+        pad_y = 2 * self.style_config.CELL_PADDING["pady"]
+        self.cell_width = entry.winfo_reqwidth() + pad_x
+        self.cell_height = entry.winfo_reqheight() + pad_y
+        # Wheel and arrow scrolling move by whole cells
+        self.canvas.configure(xscrollincrement=self.cell_width, yscrollincrement=self.cell_height)
+        logger.debug(f"Virtual table cell size: {self.cell_width}x{self.cell_height} px")
+
+    def _update_scroll_region(self, event=None) -> None:
+        """
+        Scroll region of the whole logical table.
+        """
+        if self.canvas:
+            width = self.get_col_count() * self.cell_width
+            height = self.get_row_count() * self.cell_height
+            self.canvas.configure(scrollregion=(0, 0, width, height))
+
+    def _visible_range(self) -> Tuple[range, range]:
+        """
+        Rows and columns that intersect the viewport, widened by MARGIN.
+        """
+        x0 = self.canvas.canvasx(0)
+        y0 = self.canvas.canvasy(0)
+        width = max(self.canvas.winfo_width(), self.cell_width)
+        height = max(self.canvas.winfo_height(), self.cell_height)
+
+        first_row = max(int(y0 // self.cell_height) - self.MARGIN, 0)
+        last_row = min(int((y0 + height) // self.cell_height) + 1 + self.MARGIN, self.get_row_count())
+        first_col = max(int(x0 // self.cell_width) - self.MARGIN, 0)
+        last_col = min(int((x0 + width) // self.cell_width) + 1 + self.MARGIN, self.get_col_count())
+        return range(first_row, last_row), range(first_col, last_col)
+
+    def _update_viewport(self) -> None:
+        """
+        Show exactly the cells of the visible range. Cells that stay visible
+        keep their widget; widgets of cells that left the view are rebound to
+        the cells that entered it, and the pool only grows when the visible
+        area does.
+        """
+        self._viewport_pending = False
+        if self.state is None or not self.cell_width:
+            return
+
+        rows, cols = self._visible_range()
+        wanted = {(row, col) for row in rows for col in cols}
+
+        # A cell being edited must not lose its widget (and the typed text) to recycling
+        if (self.get_interaction_mode() == InteractionMode.EDIT and self.get_editing_cell() in self.visible
+                and self.get_editing_cell() not in wanted):
+            self.exit_edit_mode()
+
+        for cell in [cell for cell in self.visible if cell not in wanted]:
+            self._park(self.visible.pop(cell))
+
+        current_pos = self.get_current_position()
+        editing_cell = self.get_editing_cell()
+        mode = self.get_interaction_mode()
+        rebound = 0
+        for cell in wanted.difference(self.visible):
+            entry = self.parked.pop() if self.parked else self._new_pool_entry()
+            self._bind_entry(entry, *cell)
+            self.visible[cell] = entry
+            self._update_cell_appearance(cell[0], cell[1], current_pos, editing_cell, mode)
+            rebound += 1
+
+        if rebound:
+            logger.debug(f"Viewport rows {rows.start}-{rows.stop}, cols {cols.start}-{cols.stop}: "
+                         f"{rebound} widget(s) rebound, {len(self.pool)} in the pool")
+
+    def _park(self, entry: tk.Entry) -> None:
+        """
+        Hide a pooled Entry and make it available for another cell.
+        """
+        self.canvas.itemconfigure(self.windows[entry], state='hidden')
+        self.parked.append(entry)
+
+    def _new_pool_entry(self) -> tk.Entry:
+        """
+        Create one more Entry for the pool, with its event bindings and a hidden canvas window.
+        """
+        entry = tk.Entry(
+            self.canvas,
+            font=FONT,
+            justify='center',
+            width=self.style_config.CELL_WIDTH,
+            state=EntryState.READONLY.value,
+            **self.style_config.NORMAL_BORDER
+        )
+        self.windows[entry] = self.canvas.create_window(0, 0, window=entry, anchor="nw", state='hidden')
+        self.pool.append(entry)
+        return entry
+
+    def _bind_entry(self, entry: tk.Entry, row: int, col: int) -> None:
+        """
+        Point a pooled Entry at a cell: place it, load the cell's text and
+        make its event handler report the new coordinates.
+
+        Args:
+            entry: Pooled Entry widget
+            row: Row index of the cell it now shows
+            col: Column index of the cell it now shows
+        """
+        handler = self.handlers.get(entry)
+        if handler is None:
+            handler = CellEventHandler(self, row, col)
+            self.handlers[entry] = handler
+            self._bind_pooled_events(entry, handler)
+        handler.row, handler.col = row, col
+
+        window = self.windows[entry]
+        self.canvas.coords(window, col * self.cell_width + self.style_config.CELL_PADDING["padx"],
+                           row * self.cell_height + self.style_config.CELL_PADDING["pady"])
+        self.canvas.itemconfigure(window, state='normal')
+
+        entry.config(state=EntryState.NORMAL.value)
+        entry.delete(0, tk.END)
+        entry.insert(0, self.state.get_cell(row, col))
+        entry.config(state=EntryState.READONLY.value)
+
+    def _bind_pooled_events(self, entry: tk.Entry, handler: CellEventHandler) -> None:
+        """
+        Bind the same events as TableCanvas._bind_cell_events, but read the
+        coordinates from the handler at event time, since the Entry is
+        reused for other cells.
+
+        Args:
+            entry: Pooled Entry widget
+            handler: Its CellEventHandler
+        """
+        entry.bind("<Button-1>", lambda e: handler.handle_click(e))
+        entry.bind("<FocusIn>", lambda e: handler.handle_focus_in(e))
+        entry.bind("<FocusOut>", lambda e: handler.handle_focus_out(e))
+        entry.bind("<KeyPress>", lambda e: handler.handle_key_press(e))
+        entry.bind("<KeyRelease>", lambda e:
+                   self._callbacks.get("cell_changed", lambda r, c, e: None)(handler.row, handler.col, e))
+        for key, direction in {"<Up>": "up", "<Down>": "down", "<Left>": "left", "<Right>": "right"}.items():
+            entry.bind(key, lambda e, d=direction: self._handle_navigation(handler.row, handler.col, d))
+
+    def apply_change(self, change) -> None:
+        """
+        Follow a change of the grid state: a structural change resizes the
+        scroll region and refills the viewport; otherwise only visible cells
+        are refreshed.
+
+        Args:
+            change: GridChange reported by GridStateManager
+        """
+        if self.controller is None:
+            return
+
+        if change.kind == "cells":
+            for row, col in change.cells:
+                self._refresh_cell(row, col)
+            return
+
+        # Drop cells that no longer exist, then refresh the texts of the rest
+        rows, cols = self.get_row_count(), self.get_col_count()
+        for cell in [cell for cell in self.visible if cell[0] >= rows or cell[1] >= cols]:
+            self._park(self.visible.pop(cell))
+        for row, col in self.visible:
+            self._refresh_cell(row, col)
+        self._update_scroll_region()
+        self._update_viewport()
+
+    def _clear_existing_widgets(self) -> None:
+        """
+        Park every pooled widget (they are reused, not destroyed).
+        """
+        for entry in self.visible.values():
+            self._park(entry)
+        self.visible = {}
+        self.entries = []
+
+    def _is_valid_entry_position(self, row: int, col: int) -> bool:
+        return (row, col) in self.visible
+
+    def entry_at(self, row: int, col: int) -> Optional[tk.Entry]:
+        return self.visible.get((row, col))
+
+    def highlight_active_cell(self) -> None:
+        """
+        Update the styling of the visible cells only.
+        """
+        current_pos = self.get_current_position()
+        editing_cell = self.get_editing_cell()
+        interaction_mode = self.get_interaction_mode()
+        for row, col in self.visible:
+            self._update_cell_appearance(row, col, current_pos, editing_cell, interaction_mode)
+
+    def focus_cell(self, row: int, col: int) -> None:
+        """
+        Scroll the cell into view if needed, then give it keyboard focus.
+
+        Args:
+            row: Row index of cell to focus
+            col: Column index of cell to focus
+        """
+        self.scroll_to_cell(row, col)
+        super().focus_cell(row, col)
+
+    def scroll_to_cell(self, row: int, col: int) -> None:
+        """
+        Scroll the smallest amount that makes the cell fully visible and
+        make sure it has a widget right away.
+
+        Args:
+            row: Row index of the cell
+            col: Column index of the cell
+        """
+        if not self.cell_width:
+            return
+        x0, y0 = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        total_width = max(self.get_col_count() * self.cell_width, 1)
+        total_height = max(self.get_row_count() * self.cell_height, 1)
+
+        left, top = col * self.cell_width, row * self.cell_height
+        if left < x0:
+            self.canvas.xview_moveto(left / total_width)
+        elif left + self.cell_width > x0 + width:
+            self.canvas.xview_moveto(max(left + self.cell_width - width, 0) / total_width)
+        if top < y0:
+            self.canvas.yview_moveto(top / total_height)
+        elif top + self.cell_height > y0 + height:
+            self.canvas.yview_moveto(max(top + self.cell_height - height, 0) / total_height)
+
+        if (row, col) not in self.visible:
+            self._update_viewport()
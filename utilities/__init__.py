@@ -1,4 +1,9 @@
-from .constants import ROWS_DEFAULT, COLS_DEFAULT, BG_COLOR, BUTTON_COLOR, BUTTON_HIGHLIGHT, BUTTON_ACTIVE_MODE, FONT
+from .constants import ROWS_DEFAULT, COLS_DEFAULT, GRID_STORAGE_DEFAULT, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW, TABLE_VIEW_DEFAULT, BG_COLOR, BUTTON_COLOR, BUTTON_HIGHLIGHT, BUTTON_ACTIVE_MODE, FONT
+from .constants import OCR_READER_POOL_SIZE, OCR_MAX_WORKERS, OCR_POLL_INTERVAL_MS, OCR_CACHE_DIR, OCR_CACHE_MAX_BYTES
+from .constants import OCR_TILE_SIZE, OCR_TILE_OVERLAP, OCR_TILE_WORKERS, OCR_WARMUP_DELAY_MS, OCR_ENGINE_DEFAULT
+from .constants import OCR_MIN_CONFIDENCE, OCR_NMS_IOU, OCR_IMAGE_VIEWER, OCR_WATCH_INTERVAL_MS, OCR_WATCH_THRESHOLD
 from .logger_setup import setup_logger, LOGGER_NAME
-from .exporter import IExporter, CSVExporter
-from .helper_funcs import parse_args, generate_unique_filename, resource_path
\ No newline at end of file
+from .exporter import IExporter, CSVExporter, OCRResultFileExporter
+from .helper_funcs import parse_args, generate_unique_filename, resource_path
+from .lazy_import import lazy_exports
+from .startup_timer import StartupTimer, startup_timer
\ No newline at end of file
@@ -1,3 +1,5 @@
+import os
+
 BG_COLOR = "#f4f4f4"
 BUTTON_COLOR = "#e0e0e0"
 BUTTON_HIGHLIGHT = "#d0d0ff"
@@ -5,3 +7,22 @@ BUTTON_ACTIVE_MODE = "#a0cfff"
 FONT = ("Segoe UI", 10)
 ROWS_DEFAULT = 10
 COLS_DEFAULT = 10
+GRID_STORAGE_DEFAULT = "list"    # Table cell storage: "list" (nested lists), "array" (compact, cheap row/column inserts) or "sparse"
+UNDO_MEMORY_BUDGET_MB = 64      # Memory the undo history may use before old commands leave memory (0 = unlimited)
+UNDO_OVERFLOW = "spill"         # Undo history over budget: "spill" old commands to a temp file or "drop" them
+TABLE_VIEW_DEFAULT = "full"     # Table rendering: "full" (one widget per cell) or "virtual" (widgets for the visible cells only)
+OCR_READER_POOL_SIZE = 2        # Max number of warm EasyOCR readers kept in memory
+OCR_MAX_WORKERS = 2             # Background OCR jobs that may run at the same time
+OCR_POLL_INTERVAL_MS = 50       # How often the Tk loop checks for finished OCR jobs
+OCR_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".ocr_table_app", "ocr_cache")  # Persistent OCR result cache
+OCR_CACHE_MAX_BYTES = 256 * 1024 * 1024                     # Size budget of the OCR result cache
+OCR_TILE_SIZE = 1600            # Tile edge length (px) for tiled OCR of large images
+OCR_TILE_OVERLAP = 200          # Overlap between neighbouring tiles (px)
+OCR_TILE_WORKERS = 2            # Worker processes used by tiled OCR
+OCR_WARMUP_DELAY_MS = 500       # Delay after the main window shows before the OCR model warm-up starts
+OCR_ENGINE_DEFAULT = "easyocr"  # OCR backend used unless --engine says otherwise
+OCR_MIN_CONFIDENCE = 0.1        # OCR results below this confidence are discarded
+OCR_NMS_IOU = 0.5               # Overlapping OCR boxes above this IoU are suppressed (keep the most confident)
+OCR_IMAGE_VIEWER = "tk"         # Image viewer of the OCR window: "tk" (viewport rendering) or "matplotlib"
+OCR_WATCH_INTERVAL_MS = 2000    # Watch mode: how often the remembered screen region is grabbed again
+OCR_WATCH_THRESHOLD = 6.0       # Watch mode: mean grey-level difference that marks a frame tile as changed
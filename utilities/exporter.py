@@ -2,6 +2,7 @@ from utilities import LOGGER_NAME
 
 import logging
 import csv
+import json
 from tkinter import filedialog
 from abc import ABC, abstractmethod
 
@@ -19,6 +20,13 @@ class IExporter(ABC):
 
 # === CSVExporter: Concrete exporter that saves grid data as a CSV file ===
 class CSVExporter(IExporter):
+    def __init__(self, default_filename=None):
+        """
+        Parameters:
+        - default_filename: file name proposed in the save dialog (e.g. from --output_csv)
+        """
+        self.default_filename = default_filename
+
     def export(self, grid_data):
         """
         Prompt the user to save a CSV file, and write the grid data to it.
@@ -31,6 +39,7 @@ class CSVExporter(IExporter):
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv")],
+            initialfile=self.default_filename or "",
             title="Save CSV"
         )
         # If user cancels the dialog, exit early
@@ -47,3 +56,45 @@ class CSVExporter(IExporter):
         except Exception as e:
             # Handle unexpected errors (e.g. permission denied)
             logger.exception(f"❌ Failed to export CSV to '{filename}': {e}")
+
+
+# === OCRResultFileExporter: Writes raw OCR results of one image to CSV or JSON ===
+class OCRResultFileExporter(IExporter):
+    FORMATS = ("csv", "json")
+
+    def __init__(self, filename, fmt="csv", scale=1.0):
+        """
+        Parameters:
+        - filename: output file path
+        - fmt: "csv" or "json"
+        - scale: factor the boxes are divided by (maps preprocessed pixels back to the source image)
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported output format: {fmt}")
+        self.filename = filename
+        self.fmt = fmt
+        self.scale = scale or 1.0
+
+    def export(self, ocr_results):
+        """
+        Write OCR results without any user interaction.
+
+        Parameters:
+        - ocr_results: list of (box, text, confidence)
+        """
+        records = []
+        for box, text, conf in ocr_results:
+            points = [[round(float(x) / self.scale, 1), round(float(y) / self.scale, 1)] for x, y in box]
+            records.append({"text": text, "confidence": round(float(conf), 4), "box": points})
+
+        with open(self.filename, 'w', newline='', encoding='utf-8') as f:
+            if self.fmt == "json":
+                json.dump(records, f, ensure_ascii=False, indent=2)
+            else:
+                writer = csv.writer(f)
+                writer.writerow(["text", "confidence", "x_min", "y_min", "x_max", "y_max"])
+                for record in records:
+                    xs = [p[0] for p in record["box"]]
+                    ys = [p[1] for p in record["box"]]
+                    writer.writerow([record["text"], record["confidence"], min(xs), min(ys), max(xs), max(ys)])
+        logger.debug(f"Wrote {len(records)} OCR results to '{self.filename}'")
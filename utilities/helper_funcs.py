@@ -4,6 +4,9 @@ import sys
 from datetime import datetime 
 import tempfile
 
+from .constants import GRID_STORAGE_DEFAULT, UNDO_MEMORY_BUDGET_MB, UNDO_OVERFLOW, TABLE_VIEW_DEFAULT, OCR_READER_POOL_SIZE, OCR_TILE_SIZE, OCR_TILE_OVERLAP, OCR_TILE_WORKERS, OCR_ENGINE_DEFAULT
+from .constants import OCR_MIN_CONFIDENCE, OCR_NMS_IOU, OCR_IMAGE_VIEWER, OCR_WATCH_INTERVAL_MS, OCR_WATCH_THRESHOLD
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -12,13 +15,69 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+def parse_engine_option(text):
+    """Parse a KEY=VALUE engine option; numeric values are converted to int/float."""
+    key, sep, value = text.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got '{text}'")
+    for convert in (int, float):
+        try:
+            return key, convert(value)
+        except ValueError:
+            pass
+    return key, value
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Interactive OCR word selector")
     parser.add_argument("image_path", nargs="?", default="", help="Path to the input image (optional)")
     parser.add_argument("--scale_percent", type=int, default=150, help="Resize percent (default: 150)")
-    parser.add_argument("--output_csv", default="selected_words.csv", help="CSV output file")
+    parser.add_argument("--output_csv", default="selected_words.csv", help="File name proposed when exporting the table to CSV")
     parser.add_argument("--lang", default="en", help="OCR language (default: en)")
-    return parser.parse_args()
+    parser.add_argument("--reader_pool_size", type=int, default=OCR_READER_POOL_SIZE,
+                        help=f"Max warm OCR readers kept in memory (default: {OCR_READER_POOL_SIZE})")
+    parser.add_argument("--engine", default=OCR_ENGINE_DEFAULT,
+                        help=f"OCR engine: easyocr or synthetic (default: {OCR_ENGINE_DEFAULT})")
+    parser.add_argument("--engine_option", type=parse_engine_option, action="append", default=[],
+                        metavar="KEY=VALUE", help="Engine-specific option, e.g. latency_ms=200 (repeatable)")
+    parser.add_argument("--min_confidence", type=float, default=OCR_MIN_CONFIDENCE,
+                        help=f"Discard OCR results below this confidence (default: {OCR_MIN_CONFIDENCE})")
+    parser.add_argument("--nms_iou", type=float, default=OCR_NMS_IOU,
+                        help=f"Suppress overlapping boxes above this IoU; 1 disables (default: {OCR_NMS_IOU})")
+    parser.add_argument("--viewer", choices=("tk", "matplotlib"), default=OCR_IMAGE_VIEWER,
+                        help=f"Image viewer of the OCR window (default: {OCR_IMAGE_VIEWER})")
+    parser.add_argument("--grid_storage", choices=("list", "array", "sparse"), default=GRID_STORAGE_DEFAULT,
+                        help=f"Table cell storage; 'array' suits very large tables, 'sparse' huge mostly-empty ones (default: {GRID_STORAGE_DEFAULT})")
+    parser.add_argument("--undo_budget", type=float, default=UNDO_MEMORY_BUDGET_MB, metavar="MB",
+                        help=f"Memory budget of the undo history in MB; 0 means unlimited (default: {UNDO_MEMORY_BUDGET_MB})")
+    parser.add_argument("--undo_overflow", choices=("spill", "drop"), default=UNDO_OVERFLOW,
+                        help=f"What happens to the oldest undo steps over budget: written to a temp file or discarded (default: {UNDO_OVERFLOW})")
+    parser.add_argument("--table_view", choices=("full", "virtual"), default=TABLE_VIEW_DEFAULT,
+                        help=f"Table rendering; 'virtual' creates widgets only for the visible cells, for very large tables (default: {TABLE_VIEW_DEFAULT})")
+    parser.add_argument("--no_warmup", action="store_true",
+                        help="Do not load the OCR model in the background after start-up")
+    parser.add_argument("--watch_interval", type=int, default=OCR_WATCH_INTERVAL_MS,
+                        help=f"Watch mode: milliseconds between captures of the region (default: {OCR_WATCH_INTERVAL_MS})")
+    parser.add_argument("--watch_threshold", type=float, default=OCR_WATCH_THRESHOLD,
+                        help=f"Watch mode: grey-level change that counts as new content (default: {OCR_WATCH_THRESHOLD})")
+    parser.add_argument("--detect_first", action="store_true",
+                        help="Show the detected boxes right away and recognize words on click or in the background. "
+                             "--nms_iou applies to the detected boxes; --min_confidence only to later runs served from the cache")
+    parser.add_argument("--tiled", action="store_true",
+                        help="Recognize the image in overlapping tiles across worker processes")
+    parser.add_argument("--tile_size", type=int, default=OCR_TILE_SIZE,
+                        help=f"Tile edge length in pixels for --tiled (default: {OCR_TILE_SIZE})")
+    parser.add_argument("--tile_overlap", type=int, default=OCR_TILE_OVERLAP,
+                        help=f"Overlap between tiles in pixels for --tiled (default: {OCR_TILE_OVERLAP})")
+    parser.add_argument("--ocr_workers", type=int, default=OCR_TILE_WORKERS,
+                        help=f"Worker processes for --tiled and --batch (default: {OCR_TILE_WORKERS})")
+    parser.add_argument("--batch", metavar="SOURCE",
+                        help="Headless mode: OCR every image in a directory or glob and exit")
+    parser.add_argument("--output_dir", help="Directory for --batch results (default: next to each image)")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv", help="Result format for --batch (default: csv)")
+    parser.add_argument("--no_cache", action="store_true", help="Do not use the OCR result cache in --batch")
+    args = parser.parse_args()
+    args.engine_options = dict(args.engine_option)
+    return args
 
 def generate_unique_filename():
     """Generate a unique filename for clipboard image."""
@@ -0,0 +1,27 @@
+import importlib
+
+def lazy_exports(package_name, exports):
+    """
+    Build module-level __getattr__ and __dir__ functions (PEP 562) that import
+    a package's public names from their submodules on first access, so that
+    importing the package itself does not pull in heavy dependencies.
+
+    Parameters:
+    - package_name: the package's __name__
+    - exports: dict mapping exported name -> relative submodule (e.g. ".ocr_reader")
+
+    Returns:
+    - (__getattr__, __dir__) to assign in the package's __init__
+    """
+    def __getattr__(name):
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(submodule, package_name), name)
+        setattr(importlib.import_module(package_name), name, value)   # Cache: later lookups skip __getattr__
+        return value
+
+    def __dir__():
+        return sorted(set(exports) | set(vars(importlib.import_module(package_name))))
+
+    return __getattr__, __dir__
@@ -5,7 +5,7 @@ import os
 import sys
 
 LOGGER_NAME = resource_path("ocr_table_app")
-LOGGING_PATH = resource_path("logs\\ocr_table_app.log")
+LOGGING_PATH = resource_path(os.path.join("logs", "ocr_table_app.log"))
 
 def setup_logger():
     """
@@ -0,0 +1,48 @@
+from .logger_setup import LOGGER_NAME
+
+import logging
+import time
+
+logger = logging.getLogger(LOGGER_NAME)
+
+class StartupTimer:
+    """
+    Records named checkpoints during application start-up and reports the
+    time elapsed between them, ending with the time to the first window.
+    """
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks = []                 # (label, seconds since start)
+        self.reported = False
+
+    def mark(self, label):
+        """
+        Record a checkpoint.
+        """
+        self.marks.append((label, time.perf_counter() - self.start))
+
+    def report(self, label="first window shown"):
+        """
+        Record the final checkpoint and log the start-up breakdown (once).
+
+        Returns:
+        - total seconds from start to the final checkpoint
+        """
+        if self.reported:
+            return self.marks[-1][1] if self.marks else 0.0
+        self.mark(label)
+        self.reported = True
+
+        previous = 0.0
+        lines = []
+        for name, elapsed in self.marks:
+            lines.append(f"  {name:<28} +{(elapsed - previous) * 1000:7.1f} ms  ({elapsed * 1000:7.1f} ms)")
+            previous = elapsed
+        total = self.marks[-1][1]
+        logger.info("Startup time report:\n" + "\n".join(lines))
+        logger.info(f"Time to first window: {total * 1000:.0f} ms")
+        return total
+
+
+# Created when utilities is first imported, i.e. at the very start of the program
+startup_timer = StartupTimer()